@@ -0,0 +1,517 @@
+import numpy as np
+import pygame
+
+from physics.collision import collide_ropes
+from physics.constraint_array import ConstraintArray
+from physics.particle_array import ParticleArray
+from physics.spatial_hash import SpatialHash
+from profiler import PROFILER
+from rope_renderer import LOD_TOLERANCE, RopeRenderer
+
+# Desteklenen constraint çözücüleri
+SOLVERS = ("gauss_seidel", "red_black", "direct")
+
+# Doğrudan çözücünün adım başına en fazla doğrusallaştırma geçişi (aşılırsa
+# segment uzunlukları geri yüklenir ve adım yakınsamamış olarak raporlanır)
+DIRECT_PASSES = 32
+
+# Çözüm yapılmayan (tamamen uyuyan) adımın istatistikleri
+IDLE_STATS = {"iterations": 0, "max_error": 0.0, "rms_error": 0.0, "converged": True}
+
+# Seçim indeksinin hücre boyutu (drag_particle yakalama mesafesiyle aynı)
+PICK_CELL_SIZE = 50
+
+# Adım başına bundan az yer değiştiren partikül hareketsiz sayılır
+SLEEP_THRESHOLD = 0.01
+
+# Bu kadar adım hareketsiz kalan partikül uyur
+SLEEP_STEPS = 60
+
+
+class ArrayRope:
+    """Rope ile aynı arayüze sahip, durumu NumPy dizilerinde tutan ip sınıfı.
+
+    Entegrasyon ve sınır kontrolü tek vektörize geçişte yapılır. Mevcut
+    kodlar rope.particles[i].x gibi erişimlere devam edebilir.
+    """
+
+    def __init__(
+        self,
+        start_x,
+        start_y,
+        num_segments=10,
+        segment_length=50,
+        start_fixed=True,
+        particle_color=(255, 255, 255),
+        rope_color=(200, 200, 200),
+        solver="gauss_seidel",
+        self_collision=False,
+        dtype=float,
+        lod_tolerance=LOD_TOLERANCE,
+    ):
+        """
+        Args:
+            start_x: İpin başlangıç X koordinatı
+            start_y: İpin başlangıç Y koordinatı
+            num_segments: İpin kaç parçadan oluşacağı
+            segment_length: Her segmentin uzunluğu
+            start_fixed: İpin başlangıç noktası sabit mi?
+            particle_color: Partiküllerin rengi
+            rope_color: İpin çizgi rengi
+            solver: Constraint çözücüsü ("gauss_seidel" sıralı, "red_black" toplu,
+                "direct" üç köşegenli doğrudan çözüm)
+            self_collision: İp kendi segmentleriyle çarpışsın mı?
+            dtype: Pozisyon, kütle ve uzunluk dizilerinin tipi (np.float32 ile
+                partikül ve kısıtlama başına bellek yaklaşık yarıya iner)
+            lod_tolerance: Uzaklaştırılmış çizimde LOD toleransı (piksel; 0 ise
+                her partikül çizilir)
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver: {solver!r}")
+
+        self.solver = solver
+        self.self_collision = self_collision
+        self.collision_stats = {
+            "broadphase_pairs": 0,
+            "contacts": 0,
+            "truncated": False,
+        }
+        self.solver_stats = dict(IDLE_STATS)
+        self.segment_length = segment_length
+        self.rope_color = rope_color
+
+        # Partikülleri oluştur
+        xs = start_x + np.arange(num_segments + 1) * segment_length
+        ys = np.full(num_segments + 1, start_y, dtype=float)
+        self.particles = ParticleArray(xs, ys, color=particle_color, dtype=dtype)
+
+        # İlk partikül sabitse işaretle
+        if start_fixed:
+            self.particles.is_fixed[0] = True
+
+        # Constraint'leri oluştur (komşu partikülleri birbirine bağla)
+        indices = np.arange(num_segments)
+        self.constraints = ConstraintArray(
+            self.particles, indices, indices + 1, stiffness=1.0
+        )
+
+        self.renderer = RopeRenderer(lod_tolerance=lod_tolerance)
+
+        # Seçim ve yakınlık sorguları için ızgara indeksi (gerektiğinde kurulur)
+        self.index = SpatialHash(cell_size=PICK_CELL_SIZE)
+        self._index_dirty = True
+
+        # Pozisyonlar her değiştiğinde artar (yeniden çizim kararı için)
+        self.version = 0
+
+        # Değişince tüm ipi uyandıran dış kuvvet parametreleri
+        self._forces = None
+
+    def update(
+        self,
+        gravity=0.5,
+        damping=0.99,
+        dt=1.0,
+        constraint_iterations=3,
+        bounds=None,
+        colliders=(),
+        tolerance=None,
+        min_iterations=1,
+    ):
+        """
+        İpin fizik güncelleme döngüsü.
+
+        Kullanılan iterasyon sayısı ve kalan göreli hata solver_stats içinde
+        raporlanır.
+
+        Args:
+            gravity: Yerçekimi kuvveti
+            damping: Sönümleme katsayısı (enerji kaybı)
+            dt: Zaman adımı
+            constraint_iterations: Constraint çözme iterasyon sayısı (daha fazla = daha katı);
+                tolerance verilirse en fazla iterasyon sayısı
+            bounds: (genişlik, yükseklik) dünya sınırları (None ise ekran boyutu)
+            colliders: Bu iple çarpışacak diğer ipler
+            tolerance: Verilirse çözüm, en büyük göreli kısıtlama hatası
+                (doğal uzunluğa göre) bunun altına inince durur
+            min_iterations: tolerance ile yapılacak en az iterasyon sayısı
+        """
+        particles = self.particles
+
+        # Yerçekimi/sönüm değişirse uyuyan partiküller yeni kuvvetlere uyanır
+        forces = (gravity, damping, dt)
+        if forces != self._forces:
+            self._forces = forces
+            self.wake()
+
+        # Tüm ip uyuyorsa ve başka iple etkileşim yoksa adım atlanır
+        if (particles.is_sleeping | particles.is_fixed).all() and not colliders:
+            self.solver_stats = dict(IDLE_STATS)
+            return
+
+        # Uyuyan partiküller locked() içindedir; iki ucu durgun kısıtlamalar atlanır
+        active = None
+        if particles.is_sleeping.any():
+            static = particles.is_sleeping | particles.is_fixed
+            active = ~(static[self.constraints.i1] & static[self.constraints.i2])
+
+        # 1. Tüm partikülleri tek geçişte güncelle
+        with PROFILER.section("integrate"):
+            particles.update(gravity=gravity, damping=damping, dt=dt)
+
+        # 2. Constraint'leri çöz
+        with PROFILER.section("solve"):
+            if self.solver == "direct":
+                # Doğrudan çözüm iterasyon sayısından bağımsızdır
+                direct = {} if tolerance is None else {"tolerance": tolerance}
+                iterations, converged = self.constraints.resolve_direct(
+                    max_passes=DIRECT_PASSES, **direct
+                )
+            else:
+                resolve = (
+                    self.constraints.resolve_red_black
+                    if self.solver == "red_black"
+                    else self.constraints.resolve
+                )
+                iterations = resolve(
+                    iterations=constraint_iterations,
+                    active=active,
+                    tolerance=tolerance,
+                    min_iterations=min_iterations,
+                )
+                converged = None
+            max_error, rms_error = self.constraints.residual(active)
+        # Yinelemeli çözücülerde yakınsama yalnızca tolerans verilirse tanımlıdır
+        if converged is None and tolerance is not None:
+            converged = max_error <= tolerance
+        self.solver_stats = {
+            "iterations": iterations,
+            "max_error": max_error,
+            "rms_error": rms_error,
+            "converged": converged,
+        }
+
+        # 3. Öz-çarpışma ve diğer iplerle çarpışma (broadphase + narrowphase)
+        if self.self_collision or colliders:
+            with PROFILER.section("collide"):
+                self.collision_stats = collide_ropes(
+                    [self, *colliders], self_collision=self.self_collision
+                )
+
+        # 4. Ekran sınırlarına çarpma kontrolü
+        if bounds is None:
+            bounds = pygame.display.get_surface().get_size()
+        width, height = bounds
+        with PROFILER.section("clamp"):
+            particles.constrain(width, height)
+
+        # 5. Tamamen durgun bölümleri uyut
+        with PROFILER.section("sleep"):
+            self._update_sleep()
+
+        # Pozisyonlar değişti; indeks ilk sorguda yenilenir
+        self._moved()
+
+    def _update_sleep(self):
+        """Hareketsiz sayacını günceller ve tamamen durgun bölümleri uyutur."""
+        update_sleep(self.particles, self.particles.is_fixed)
+
+    def wake(self, mask=None):
+        """
+        Uyuyan partikülleri uyandırır.
+
+        Args:
+            mask: Uyandırılacak partiküller; her biri bulunduğu bölümün
+                tamamını uyandırır (None ise tüm ip)
+        """
+        wake_spans(self.particles, self.particles.is_fixed, mask)
+
+    def _wake_index(self, index):
+        """Tek bir partikülü (ve uyuyan bölümünü) uyandırır."""
+        mask = np.zeros(len(self.particles), dtype=bool)
+        mask[index] = True
+        self.wake(mask)
+
+    def active_particles(self):
+        """Simüle edilen (sabit olmayan ve uyumayan) partikül sayısı."""
+        particles = self.particles
+        return int(np.count_nonzero(~(particles.is_sleeping | particles.is_fixed)))
+
+    def _moved(self):
+        """Pozisyon değişikliğini kaydeder."""
+        self._index_dirty = True
+        self.version += 1
+
+    def resize(self, num_segments):
+        """
+        Segment sayısını ipi yeniden oluşturmadan değiştirir.
+
+        Mevcut partiküllerin pozisyon ve hızları korunur. Yeni partiküller
+        son segmentin doğrultusunda, segment_length aralıklarla ve hareketsiz
+        olarak eklenir; fazla partiküller sondan atılır.
+
+        Args:
+            num_segments: Yeni segment sayısı (en az 1)
+        """
+        num_segments = max(1, int(num_segments))
+        current = len(self.constraints)
+        if num_segments == current:
+            return
+
+        if num_segments < current:
+            self.particles.truncate(num_segments + 1)
+            self.constraints.truncate(num_segments)
+        else:
+            particles = self.particles
+            dx, dy = 1.0, 0.0
+            if len(particles) > 1:
+                dx = particles.x[-1] - particles.x[-2]
+                dy = particles.y[-1] - particles.y[-2]
+                length = np.hypot(dx, dy)
+                dx, dy = (dx / length, dy / length) if length > 0 else (1.0, 0.0)
+
+            steps = np.arange(1, num_segments - current + 1) * self.segment_length
+            particles.append(particles.x[-1] + dx * steps, particles.y[-1] + dy * steps)
+
+            indices = np.arange(current, num_segments)
+            self.constraints.append(
+                indices, indices + 1, self.segment_length, stiffness=1.0
+            )
+
+        self._moved()
+
+    def set_segment_length(self, segment_length):
+        """
+        Segment uzunluğunu değiştirir; doğal uzunluklar aynı oranda ölçeklenir.
+
+        Partiküller yerinde kalır, ip sonraki adımlarda yeni uzunluğa gelir;
+        bunun için uyuyan bölümler uyandırılır.
+
+        Args:
+            segment_length: Yeni segment uzunluğu
+        """
+        if segment_length == self.segment_length:
+            return
+        self.constraints.rest_length *= segment_length / self.segment_length
+        self.segment_length = segment_length
+        self.wake()
+
+    def memory_usage(self):
+        """
+        Simülasyon durumunun bellek kullanımı.
+
+        Partikül stili (yarıçap, renk) ip başına bir kez tutulduğu için
+        yalnızca diziler sayılır.
+
+        Returns:
+            {"particles", "constraints", "total" (bayt), "bytes_per_segment"}
+        """
+        particles = self.particles.nbytes
+        constraints = self.constraints.nbytes
+        total = particles + constraints
+        return {
+            "particles": particles,
+            "constraints": constraints,
+            "total": total,
+            "bytes_per_segment": total / max(len(self.constraints), 1),
+        }
+
+    def snapshot(self):
+        """
+        İpin tüm durumunun bellekteki kopyası (restore ile geri yüklenir).
+
+        Returns:
+            Partikül ve kısıtlama dizileri ile ip ayarlarını içeren sözlük
+        """
+        return {
+            "particles": {
+                name: getattr(self.particles, name).copy()
+                for name in ParticleArray.FIELDS
+            },
+            "constraints": {
+                name: getattr(self.constraints, name).copy()
+                for name in ConstraintArray.FIELDS
+            },
+            "segment_length": self.segment_length,
+            "solver": self.solver,
+            "self_collision": self.self_collision,
+            "radius": self.particles.radius,
+            "color": tuple(self.particles.color),
+            "rope_color": tuple(self.rope_color),
+        }
+
+    def restore(self, state, copy=True):
+        """
+        İpi bir snapshot'a geri döndürür; yeni nesne oluşturulmaz.
+
+        Args:
+            state: snapshot() veya scene.load_scene ile alınmış durum
+            copy: Dizileri kopyala (False ise state dizileri doğrudan kullanılır)
+        """
+        count = len(state["particles"]["x"])
+        for name in ParticleArray.FIELDS:
+            values = state["particles"].get(name)
+            if values is None:
+                # Eski kayıtlarda olmayan alanlar varsayılan değerle başlar
+                values = np.zeros(count, dtype=getattr(self.particles, name).dtype)
+            setattr(self.particles, name, values.copy() if copy else values)
+        for name in ConstraintArray.FIELDS:
+            values = state["constraints"][name]
+            setattr(self.constraints, name, values.copy() if copy else values)
+
+        self.segment_length = state["segment_length"]
+        self.solver = state["solver"]
+        self.self_collision = state["self_collision"]
+        self.particles.radius = state["radius"]
+        self.particles.color = tuple(state["color"])
+        self.rope_color = tuple(state["rope_color"])
+        self._moved()
+
+    def spatial_index(self):
+        """Güncel partikül pozisyonlarıyla kurulmuş ızgara indeksini döndürür."""
+        if self._index_dirty:
+            self.index.build(self.particles.x, self.particles.y)
+            self._index_dirty = False
+        return self.index
+
+    def nearest_particle(self, pos, max_distance=50):
+        """
+        Noktaya en yakın sabit olmayan partikülü bulur.
+
+        Args:
+            pos: (x, y) sorgu noktası
+            max_distance: En fazla mesafe
+
+        Returns:
+            Partikül indeksi veya None
+        """
+        return self.spatial_index().nearest(
+            pos[0], pos[1], max_distance, exclude=self.particles.is_fixed
+        )
+
+    def particles_near(self, pos, radius):
+        """Noktaya radius'tan yakın tüm sabit olmayan partiküllerin indeksleri."""
+        return self.spatial_index().query_radius(
+            pos[0], pos[1], radius, exclude=self.particles.is_fixed
+        )
+
+    def drag_particle(self, mouse_pos, dragged_index=None):
+        """
+        Fare ile bir partikülü sürüklemek için.
+
+        Args:
+            mouse_pos: (x, y) fare pozisyonu
+            dragged_index: Sürüklenecek partikülün indeksi (None ise en yakını bul)
+
+        Returns:
+            Sürüklenecek partikülün indeksi
+        """
+        mouse_x, mouse_y = mouse_pos
+
+        if dragged_index is not None and 0 <= dragged_index < len(self.particles):
+            # Belirli partikül sürükleniyor
+            self._wake_index(dragged_index)
+            self.particles[dragged_index].set_position(mouse_x, mouse_y)
+            self._moved()
+            return dragged_index
+
+        # Yakındaki en yakın partikülü bul ve sürükle
+        closest_idx = self.nearest_particle(mouse_pos, max_distance=50)
+        if closest_idx is not None:
+            self._wake_index(closest_idx)
+            self.particles[closest_idx].set_position(mouse_x, mouse_y)
+            self._moved()
+
+        return closest_idx
+
+    def is_mouse_over_particle(self, mouse_pos, radius=20):
+        """
+        Fare bir partikülün üzerinde mi kontrol et.
+
+        Args:
+            mouse_pos: (x, y) fare pozisyonu
+            radius: Tıklama hassasiyeti
+
+        Returns:
+            Partikül indeksi veya None
+        """
+        hits = self.particles_near(mouse_pos, radius)
+        if len(hits) == 0:
+            return None
+        return int(hits[0])
+
+    def draw(self, screen, camera=None):
+        """
+        İpi ekrana toplu ve görüş alanına kırpılmış olarak çizer.
+
+        Args:
+            screen: Pygame ekran objesi
+            camera: Kamera objesi (varsa world-to-screen transform uygular)
+        """
+        self.renderer.draw(screen, self, camera)
+
+    def release_all(self):
+        """Tüm partiküllerin sürükleme durumunu serbest bırak."""
+        self.particles.is_being_dragged[:] = False
+
+
+def sleep_spans(breaks):
+    """
+    Partiküllerin uyku bölümü etiketleri ve bölüm başlangıç indeksleri.
+
+    Zincir sırası varsayılır; breaks True olan her partikül (sabit
+    partiküller, World'de ayrıca her ipin ilk partikülü) yeni bir bölüm
+    başlatır.
+    """
+    spans = np.cumsum(breaks)
+    spans -= spans[0]
+    starts = np.flatnonzero(np.diff(spans, prepend=-1))
+    return spans, starts
+
+
+def update_sleep(particles, breaks):
+    """
+    Hareketsiz sayacını günceller ve tamamen durgun bölümleri uyutur.
+
+    Bir bölüm ancak bütün partikülleri SLEEP_STEPS adım boyunca hareketsiz
+    kaldıysa uyur; böylece uyuyan kısım hareket eden bir komşuya kilitli
+    bir uç gibi davranmaz. Diziler yerinde güncellenir.
+
+    Args:
+        particles: ParticleArray
+        breaks: Yeni bölüm başlatan partiküller (bkz. sleep_spans)
+    """
+    if len(particles) == 0:
+        return
+    speed = np.hypot(particles.x - particles.old_x, particles.y - particles.old_y)
+    moving = (speed >= SLEEP_THRESHOLD) | particles.is_being_dragged
+    moving &= ~particles.is_sleeping
+    particles.still_steps += 1
+    particles.still_steps[moving] = 0
+
+    still = (particles.still_steps >= SLEEP_STEPS) | particles.is_fixed
+    spans, starts = sleep_spans(breaks)
+    span_still = np.logical_and.reduceat(still, starts)
+    np.logical_and(span_still[spans], ~particles.is_fixed, out=particles.is_sleeping)
+
+
+def wake_spans(particles, breaks, mask=None):
+    """
+    Uyuyan partikülleri bölümleriyle birlikte uyandırır.
+
+    Args:
+        particles: ParticleArray
+        breaks: Yeni bölüm başlatan partiküller (bkz. sleep_spans)
+        mask: Uyandırılacak partiküller (None ise hepsi)
+    """
+    if mask is None:
+        particles.is_sleeping[:] = False
+        particles.still_steps[:] = 0
+        return
+
+    if not mask.any():
+        return
+    spans, _ = sleep_spans(breaks)
+    woken = np.isin(spans, spans[mask])
+    particles.is_sleeping[woken] = False
+    particles.still_steps[woken] = 0
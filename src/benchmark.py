@@ -0,0 +1,378 @@
+"""Step, draw ve pick sıcak yolları için tekrarlanabilir benchmark paketi.
+
+Kullanım:
+    python benchmark.py --output bench.json
+    python benchmark.py --output bench.csv --compare bench.json
+"""
+
+import argparse
+import csv
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from array_rope import SOLVERS, ArrayRope
+from main import HEIGHT, WIDTH, Camera
+from rope import Rope
+from world import World
+
+SEGMENTS = (2, 15, 100, 1000, 5000)
+ITERATIONS = (1, 5, 20)
+QUICK_SEGMENTS = (2, 100, 1000)
+QUICK_ITERATIONS = (5,)
+
+# Çok ipli dünya durumları: ip sayısı (her biri WORLD_SEGMENTS segment)
+ROPE_COUNTS = (10, 100, 1000)
+QUICK_ROPE_COUNTS = (100,)
+WORLD_SEGMENTS = 15
+
+# Uyarlamalı iterasyon durumlarının göreli hata toleransı
+ADAPTIVE_TOLERANCE = 2e-2
+
+# Bir sonucun gerileme sayılması için gereken yavaşlama oranı
+REGRESSION_THRESHOLD = 1.10
+
+BOUNDS = (WIDTH, HEIGHT)
+
+# İp gerçeklemeleri: ArrayRope ("array") ve nesne tabanlı Rope ("object").
+# Nesne durumları backend=object ile işaretlenir; dizi durumlarının anahtarları
+# önceki sonuç dosyalarıyla karşılaştırılabilsin diye değişmez.
+BACKENDS = ("array", "object")
+
+
+def measure(func, min_time=0.2, min_calls=3):
+    """
+    Fonksiyonu en az min_time saniye ve min_calls kez çalıştırıp süreyi ölçer.
+
+    Returns:
+        (çağrı sayısı, ortalama süre, en iyi süre) saniye cinsinden
+    """
+    timings = []
+    total = 0.0
+    while total < min_time or len(timings) < min_calls:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        total += elapsed
+    return len(timings), total / len(timings), min(timings)
+
+
+def make_rope(num_segments, solver="red_black", backend="array"):
+    """Benchmark için main.py ile aynı başlangıç durumunda bir ip oluşturur."""
+    if backend == "object":
+        return Rope(
+            start_x=0,
+            start_y=0,
+            num_segments=num_segments,
+            segment_length=35,
+            start_fixed=True,
+        )
+    return ArrayRope(
+        start_x=0,
+        start_y=0,
+        num_segments=num_segments,
+        segment_length=35,
+        start_fixed=True,
+        solver=solver,
+    )
+
+
+def backend_params(backend):
+    """Nesne tabanlı ip durumlarını işaretleyen ek parametreler."""
+    return {} if backend == "array" else {"backend": backend}
+
+
+def settle(rope, steps=30):
+    """İpin düz başlangıç durumundan çıkıp gerçekçi bir şekle gelmesini sağlar."""
+    for _ in range(steps):
+        rope.update(bounds=BOUNDS, constraint_iterations=5)
+
+
+def bench_construct(segments):
+    for backend in BACKENDS:
+        for num_segments in segments:
+
+            def construct(num_segments=num_segments, backend=backend):
+                make_rope(num_segments, backend=backend)
+
+            yield {"segments": num_segments, **backend_params(backend)}, construct
+
+
+def bench_update(segments, iterations):
+    # İpler ölçüm sırasında durulup uyuyabilir; her çağrıdan önce uyandırılır ki
+    # uyuyan ipin erken dönüşü değil gerçek bir adım ölçülsün
+    for solver in SOLVERS:
+        for num_segments in segments:
+            for count in iterations:
+                rope = make_rope(num_segments, solver)
+
+                def step(rope=rope, count=count):
+                    rope.wake()
+                    rope.update(bounds=BOUNDS, constraint_iterations=count)
+
+                params = {
+                    "segments": num_segments,
+                    "iterations": count,
+                    "solver": solver,
+                }
+                yield params, step
+
+            # Uyarlamalı: en fazla en büyük iterasyon sayısı kadar
+            rope = make_rope(num_segments, solver)
+
+            def adaptive(rope=rope, count=max(iterations)):
+                rope.wake()
+                rope.update(
+                    bounds=BOUNDS,
+                    constraint_iterations=count,
+                    tolerance=ADAPTIVE_TOLERANCE,
+                )
+
+            params = {
+                "segments": num_segments,
+                "iterations": max(iterations),
+                "solver": solver,
+                "tolerance": ADAPTIVE_TOLERANCE,
+            }
+            yield params, adaptive
+
+    # Nesne tabanlı ip (Gauss-Seidel; uyku yok)
+    for num_segments in segments:
+        for count in iterations:
+            rope = make_rope(num_segments, backend="object")
+
+            def step(rope=rope, count=count):
+                rope.update(bounds=BOUNDS, constraint_iterations=count)
+
+            params = {"segments": num_segments, "iterations": count}
+            yield {**params, "backend": "object"}, step
+
+        rope = make_rope(num_segments, backend="object")
+
+        def adaptive(rope=rope, count=max(iterations)):
+            rope.update(
+                bounds=BOUNDS,
+                constraint_iterations=count,
+                tolerance=ADAPTIVE_TOLERANCE,
+            )
+
+        params = {
+            "segments": num_segments,
+            "iterations": max(iterations),
+            "tolerance": ADAPTIVE_TOLERANCE,
+        }
+        yield {**params, "backend": "object"}, adaptive
+
+
+def bench_world(rope_counts):
+    for count in rope_counts:
+        ropes = [make_rope(WORLD_SEGMENTS) for _ in range(count)]
+
+        # Her ip ayrı ayrı güncellenir (ip başına Python çağrısı)
+        def per_rope(ropes=ropes):
+            for rope in ropes:
+                rope.wake()
+                rope.update(bounds=BOUNDS, constraint_iterations=5)
+
+        world = World()
+        world.add_ropes([make_rope(WORLD_SEGMENTS) for _ in range(count)])
+
+        def batched(world=world):
+            world.wake()
+            world.step(bounds=BOUNDS, constraint_iterations=5)
+
+        params = {"ropes": count, "segments": WORLD_SEGMENTS}
+        yield {**params, "mode": "per_rope"}, per_rope
+        yield {**params, "mode": "world"}, batched
+
+
+def bench_draw(segments):
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    for backend in BACKENDS:
+        for num_segments in segments:
+            rope = make_rope(num_segments, backend=backend)
+            settle(rope)
+            for camera in (None, Camera(zoom=1.0), Camera(zoom=0.2)):
+
+                def draw(rope=rope, camera=camera):
+                    rope.draw(screen, camera)
+
+                params = {"segments": num_segments, "camera": camera is not None}
+                if camera and camera.zoom != 1.0:
+                    params["zoom"] = camera.zoom
+                yield {**params, **backend_params(backend)}, draw
+
+
+def bench_pick(segments):
+    for backend in BACKENDS:
+        for num_segments in segments:
+            rope = make_rope(num_segments, backend=backend)
+            settle(rope)
+            target = rope.particles[len(rope.particles) // 2]
+            mouse_pos = (target.x + 3, target.y + 3)
+
+            def pick(rope=rope, mouse_pos=mouse_pos):
+                rope.is_mouse_over_particle(mouse_pos, radius=25)
+
+            def drag(rope=rope, mouse_pos=mouse_pos):
+                rope.drag_particle(mouse_pos)
+
+            params = {"segments": num_segments, **backend_params(backend)}
+            yield {**params, "query": "is_mouse_over_particle"}, pick
+            yield {**params, "query": "drag_particle"}, drag
+
+
+def run_suite(quick=False, min_time=0.2, only=None):
+    """
+    Tüm benchmark'ları çalıştırır.
+
+    Args:
+        quick: Daha küçük parametre ızgarası kullan
+        min_time: Her durum için en az ölçüm süresi (saniye)
+        only: Yalnızca bu isimlerdeki benchmark'ları çalıştır
+
+    Returns:
+        Sonuç sözlüklerinin listesi
+    """
+    segments = QUICK_SEGMENTS if quick else SEGMENTS
+    iterations = QUICK_ITERATIONS if quick else ITERATIONS
+    rope_counts = QUICK_ROPE_COUNTS if quick else ROPE_COUNTS
+    suites = {
+        "construct": bench_construct(segments),
+        "update": bench_update(segments, iterations),
+        "world": bench_world(rope_counts),
+        "draw": bench_draw(segments),
+        "pick": bench_pick(segments),
+    }
+
+    results = []
+    for name, cases in suites.items():
+        if only and name not in only:
+            continue
+        for params, func in cases:
+            calls, mean, best = measure(func, min_time=min_time)
+            result = {"benchmark": name, **params}
+            result.update({"calls": calls, "mean_s": mean, "best_s": best})
+            results.append(result)
+            print(f"{case_key(result):<60} {mean * 1000:10.3f} ms", file=sys.stderr)
+    return results
+
+
+def case_key(result):
+    """Bir sonucu ölçüm alanları dışındaki parametreleriyle tanımlar."""
+    params = [
+        f"{key}={value}"
+        for key, value in result.items()
+        if key not in ("benchmark", "calls", "mean_s", "best_s")
+    ]
+    return " ".join([result["benchmark"], *params])
+
+
+def metadata():
+    """Sonuçların hangi ortamda ve commit'te alındığını kaydeder."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+    }
+
+
+def write_results(path, results):
+    """Sonuçları uzantıya göre JSON veya CSV olarak yazar."""
+    if path.endswith(".csv"):
+        fields = []
+        for result in results:
+            fields.extend(key for key in result if key not in fields)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(path, "w") as f:
+            json.dump({"meta": metadata(), "results": results}, f, indent=2)
+
+
+def load_results(path):
+    """JSON veya CSV sonuç dosyasını okur."""
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            row["mean_s"] = float(row["mean_s"])
+        return rows
+
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline, results, threshold=REGRESSION_THRESHOLD):
+    """
+    Sonuçları bir önceki çalıştırmayla karşılaştırıp oranları yazdırır.
+
+    Returns:
+        Gerileme (threshold'dan fazla yavaşlama) sayısı
+    """
+    previous = {case_key(_normalize(result)): result for result in baseline}
+    regressions = 0
+    for result in results:
+        key = case_key(_normalize(result))
+        if key not in previous:
+            continue
+        ratio = result["mean_s"] / float(previous[key]["mean_s"])
+        flag = ""
+        if ratio > threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{key:<60} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def _normalize(result):
+    """CSV'den okunan değerleri JSON ile aynı anahtar biçimine getirir."""
+    return {key: str(value) for key, value in result.items() if value != ""}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rope Simulation benchmarks")
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--compare", help="previous JSON/CSV results to compare")
+    parser.add_argument("--quick", action="store_true", help="smaller grid")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=("construct", "update", "world", "draw", "pick"),
+        help="run only these benchmarks",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(quick=args.quick, min_time=args.min_time, only=args.only)
+    write_results(args.output, results)
+
+    if args.compare:
+        regressions = compare(load_results(args.compare), results)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""Kareleri arka plandaki bir yazıcı iş parçacığıyla diske aktarma.
+
+Çizim döngüsü her kareyi submit() ile sınırlı bir kuyruğa bırakır ve
+beklemeden devam eder: kuyruk doluysa kare atılır ve sayılır. Yazıcı iş
+parçacığı kareleri kuyruktan alıp PNG dizisi (her kare ayrı dosya) veya ham
+RGB akışı (tüm kareler art arda tek dosyada) olarak yazar. Böylece disk
+gecikmesi simülasyonu ve çizimi hiçbir zaman bekletmez.
+
+PNG'ler zlib ile burada kodlanır: zlib sıkıştırma sırasında GIL'i bırakır,
+pygame.image.save ise kodlama boyunca tutar ve çizim döngüsünü yavaşlatır.
+"""
+
+import os
+import queue
+import struct
+import threading
+import zlib
+
+import numpy as np
+import pygame
+
+FORMATS = ("png", "raw")
+
+# Varsayılan kuyruk uzunluğu (kare); 1600x900 RGB için yaklaşık 270 MiB
+QUEUE_SIZE = 64
+
+# PNG dizisindeki dosya adları
+PNG_PATTERN = "frame_{:06d}.png"
+
+# PNG sıkıştırma düzeyi (zlib, 0-9)
+PNG_COMPRESSION = 6
+
+# Yazıcıya kuyruğun bittiğini bildiren değer
+_DONE = None
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(kind, data):
+    """Uzunluk, tip, veri ve CRC'den oluşan bir PNG parçası."""
+    return (
+        struct.pack(">I", len(data))
+        + kind
+        + data
+        + struct.pack(">I", zlib.crc32(kind + data))
+    )
+
+
+def encode_png(pixels, size, level=PNG_COMPRESSION):
+    """
+    Ham RGB baytlarını PNG dosya içeriğine çevirir (8 bit, filtresiz).
+
+    Args:
+        pixels: Satır satır RGB baytları (pygame.image.tobytes(..., "RGB"))
+        size: (genişlik, yükseklik)
+        level: zlib sıkıştırma düzeyi
+
+    Returns:
+        PNG baytları
+    """
+    width, height = size
+    rows = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width * 3)
+
+    # Her satırın başına filtre tipi (0 = yok) eklenir
+    filtered = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    filtered[:, 1:] = rows
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"".join(
+        (
+            _PNG_SIGNATURE,
+            _png_chunk(b"IHDR", header),
+            _png_chunk(b"IDAT", zlib.compress(filtered.tobytes(), level)),
+            _png_chunk(b"IEND", b""),
+        )
+    )
+
+
+class FrameWriter(threading.Thread):
+    """Kuyruğa bırakılan kareleri diske yazan arka plan iş parçacığı."""
+
+    def __init__(self, path, size, fmt="png", queue_size=QUEUE_SIZE):
+        """
+        Args:
+            path: PNG için hedef klasör, ham RGB için hedef dosya
+            size: (genişlik, yükseklik) kare boyutu
+            fmt: "png" veya "raw"
+            queue_size: Yazılmayı bekleyebilecek en fazla kare
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown export format: {fmt!r}")
+        super().__init__(name="frame-writer", daemon=True)
+
+        self.path = path
+        self.size = tuple(size)
+        self.format = fmt
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.max_queued = 0
+        self.error = None
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        if fmt == "png":
+            os.makedirs(path, exist_ok=True)
+            self._file = None
+        else:
+            self._file = open(path, "wb")
+
+    @property
+    def queued(self):
+        """Yazılmayı bekleyen kare sayısı."""
+        return self._queue.qsize()
+
+    def submit(self, surface):
+        """
+        Karenin kopyasını kuyruğa bırakır; hiçbir zaman beklemez.
+
+        Args:
+            surface: Kare yüzeyi (size boyutunda)
+
+        Returns:
+            Kare kuyruğa alındıysa True, kuyruk dolu olduğu için atıldıysa False
+        """
+        index = self.submitted
+        self.submitted += 1
+        try:
+            self._queue.put_nowait((index, pygame.image.tobytes(surface, "RGB")))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.max_queued = max(self.max_queued, self._queue.qsize())
+        return True
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                break
+            if self.error is not None:
+                continue
+            index, pixels = item
+            try:
+                if self._file is not None:
+                    self._file.write(pixels)
+                else:
+                    name = os.path.join(self.path, PNG_PATTERN.format(index))
+                    with open(name, "wb") as f:
+                        f.write(encode_png(pixels, self.size))
+            except OSError as exc:
+                # Hata kaydedilir; kalan kareler kuyruğu tıkamadan atılır
+                self.error = exc
+                continue
+            self.written += 1
+
+    def close(self):
+        """Kuyruktaki karelerin yazılmasını bekler ve dosyayı kapatır."""
+        if self.is_alive():
+            self._queue.put(_DONE)
+            self.join()
+        if self._file is not None:
+            self._file.close()
+
+    def stats(self):
+        """
+        Aktarım sayaçları.
+
+        Returns:
+            {"submitted", "written", "dropped", "queued", "max_queued"}
+        """
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+        }
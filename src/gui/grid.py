@@ -0,0 +1,71 @@
+import math
+
+import pygame
+
+
+class GridBackground:
+    """Arka plan ızgarasını önceden çizilmiş bir döşeme (tile) ile çizer.
+
+    Izgara çizgileri yalnızca zoom veya pencere boyutu değiştiğinde ekrandan
+    bir hücre büyük bir yüzeye çizilir. Kaydırma (pan) sırasında bu yüzey,
+    kameranın ızgara hücresi içindeki kaymasına göre tek bir blit ile
+    ekrana yerleştirilir.
+    """
+
+    def __init__(
+        self, grid_size=50, line_color=(40, 40, 50), background_color=(20, 20, 30)
+    ):
+        """
+        Args:
+            grid_size: Izgara hücresinin dünya birimindeki kenar uzunluğu
+            line_color: Çizgi rengi
+            background_color: Döşemenin zemin rengi (ekranı da temizler)
+        """
+        self.grid_size = grid_size
+        self.line_color = line_color
+        self.background_color = background_color
+        self._tile = None
+        self._key = None
+
+    def tile(self, zoom, size):
+        """
+        Verilen zoom ve pencere boyutu için ızgara döşemesi.
+
+        Returns:
+            (yüzey, ekrandaki hücre boyutu)
+        """
+        spacing = self.grid_size * zoom
+        key = (zoom, size)
+        if key != self._key:
+            width, height = size
+            pad = math.ceil(spacing) + 1
+            tile = pygame.Surface((width + pad, height + pad))
+            tile.fill(self.background_color)
+
+            tile_width, tile_height = tile.get_size()
+            for i in range(int(tile_width / spacing) + 1):
+                x = int(i * spacing)
+                pygame.draw.line(tile, self.line_color, (x, 0), (x, tile_height), 1)
+            for i in range(int(tile_height / spacing) + 1):
+                y = int(i * spacing)
+                pygame.draw.line(tile, self.line_color, (0, y), (tile_width, y), 1)
+
+            self._tile = tile
+            self._key = key
+        return self._tile, spacing
+
+    def draw(self, screen, camera):
+        """
+        Ekranı temizler ve ızgarayı çizer.
+
+        Args:
+            screen: Pygame ekran objesi
+            camera: Kamera objesi
+        """
+        tile, spacing = self.tile(camera.zoom, screen.get_size())
+
+        # Dünya orijininin ekran konumu, hücre içindeki kaymayı belirler
+        origin_x, origin_y = camera.world_to_screen(0, 0)
+        offset_x = origin_x % spacing - spacing
+        offset_y = origin_y % spacing - spacing
+        screen.blit(tile, (math.floor(offset_x), math.floor(offset_y)))
@@ -1,5 +1,11 @@
 import pygame
 
+from gui.text import get_font, render_text
+
+# Profil panelindeki kare süresi dağılımının aralık sayısı
+HISTOGRAM_BINS = 30
+HISTOGRAM_HEIGHT = 80
+
 
 class GUI:
     """Menü, bilgi yazısı ve UI elementleri için sınıf."""
@@ -7,10 +13,10 @@ class GUI:
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.font_large = pygame.font.SysFont(None, 72)
-        self.font_medium = pygame.font.SysFont(None, 36)
-        self.font_small = pygame.font.SysFont(None, 24)
-        self.font_tiny = pygame.font.SysFont(None, 18)
+        self.font_large = get_font(72)
+        self.font_medium = get_font(36)
+        self.font_small = get_font(24)
+        self.font_tiny = get_font(18)
 
         self.simulation_running = False
         self.show_help = True
@@ -21,18 +27,18 @@ class GUI:
 
     def draw_title(self, screen):
         """Ana başlığı çizer."""
-        title_text = self.font_large.render("Rope Simulation", True, (255, 255, 255))
+        title_text = render_text(self.font_large, "Rope Simulation", (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, self.height // 4))
         screen.blit(title_text, title_rect)
 
     def draw_status(self, screen):
         """Simülasyon durumunu çizer."""
         if self.simulation_running:
-            status_text = self.font_medium.render(
-                "Simulation Running", True, (100, 255, 100)
+            status_text = render_text(
+                self.font_medium, "Simulation Running", (100, 255, 100)
             )
         else:
-            status_text = self.font_medium.render("Paused", True, (255, 255, 100))
+            status_text = render_text(self.font_medium, "Paused", (255, 255, 100))
 
         status_rect = status_text.get_rect(
             center=(self.width // 2, self.height // 4 + 60)
@@ -47,14 +53,18 @@ class GUI:
         help_lines = [
             "Controls:",
             "  SPACE  - Start/Stop Simulation",
-            "  R      - Reset Rope",
+            "  R      - Reset Ropes",
+            "  N      - Add Rope at Cursor",
+            "  C      - Toggle Rope Collisions",
+            "  F5/F9  - Save/Load Scene",
+            "  F3/F4  - Toggle Profiler/Export Trace",
             "  Click  - Grab and drag rope segments",
             "  ESC    - Exit",
         ]
 
-        y_offset = self.height - 150
+        y_offset = self.height - 250
         for line in help_lines:
-            text = self.font_small.render(line, True, (150, 150, 150))
+            text = render_text(self.font_small, line, (150, 150, 150))
             screen.blit(text, (20, y_offset))
             y_offset += 25
 
@@ -63,10 +73,50 @@ class GUI:
         x, y = self.width - 200, 20
 
         for key, value in params.items():
-            text = self.font_tiny.render(f"{key}: {value}", True, (200, 200, 200))
+            text = render_text(self.font_tiny, f"{key}: {value}", (200, 200, 200))
             screen.blit(text, (x, y))
             y += 20
 
+    def draw_profile(self, screen, profiler, rect, limit=None):
+        """
+        Aşamaların kare başına ortalama süresini ve kare süresi dağılımını çizer.
+
+        Args:
+            screen: Hedef yüzey
+            profiler: profiler.Profiler
+            rect: Panelin alanı (dağılım alttaki boşluğa çizilir)
+            limit: Dağılımın üst sınırı (ms, None ise en uzun kare)
+        """
+        x, y = rect.x, rect.y
+        p50, p99 = profiler.percentiles(50, 99)
+        lines = [f"Frame p50 {p50:.1f} ms  p99 {p99:.1f} ms"]
+        for name, ms in profiler.breakdown().items():
+            lines.append(f"{name}: {ms:.2f} ms")
+        for line in lines:
+            text = render_text(self.font_tiny, line, (200, 200, 200))
+            screen.blit(text, (x, y))
+            y += 18
+
+        counts, edges = profiler.histogram(bins=HISTOGRAM_BINS, limit=limit)
+        bottom = rect.bottom - 18
+        height = min(bottom - y - 4, HISTOGRAM_HEIGHT)
+        if height <= 0:
+            return
+        bar_width = rect.width // HISTOGRAM_BINS
+        peak = max(int(counts.max()), 1)
+        for i, count in enumerate(counts):
+            bar_height = int(height * count / peak)
+            if bar_height:
+                bar = (
+                    x + i * bar_width,
+                    bottom - bar_height,
+                    bar_width - 1,
+                    bar_height,
+                )
+                pygame.draw.rect(screen, (100, 150, 255), bar)
+        label = render_text(self.font_tiny, f"0 - {edges[-1]:.0f} ms", (150, 150, 150))
+        screen.blit(label, (x, bottom + 2))
+
     def draw(self, screen):
         """Tüm UI elementlerini çizer."""
         self.draw_title(screen)
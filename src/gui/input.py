@@ -0,0 +1,44 @@
+import pygame
+
+
+def coalesce_motion(events):
+    """
+    Art arda gelen fare hareketi olaylarını tek bir olayda birleştirir.
+
+    Birleşik olay son pozisyonu, toplam göreli hareketi (rel) ve son
+    buton durumunu taşır; böylece slider, sürükleme ve kamera kaydırma bir
+    karede fare ne kadar hızlı hareket ederse etsin en fazla bir kez
+    işlenir. Bekleyen hareket, sıradaki hareket dışı olaydan (örn. buton
+    bırakma) önce eklenir; olayların sırası korunur.
+
+    Args:
+        events: Karenin pygame olayları
+
+    Returns:
+        Hareket olayları birleştirilmiş olay listesi
+    """
+    result = []
+    pending = None
+    for event in events:
+        if event.type != pygame.MOUSEMOTION:
+            if pending is not None:
+                result.append(pending)
+                pending = None
+            result.append(event)
+            continue
+
+        if pending is None:
+            pending = event
+            continue
+        rel = getattr(event, "rel", (0, 0))
+        pending_rel = getattr(pending, "rel", (0, 0))
+        pending = pygame.event.Event(
+            pygame.MOUSEMOTION,
+            pos=event.pos,
+            rel=(pending_rel[0] + rel[0], pending_rel[1] + rel[1]),
+            buttons=getattr(event, "buttons", (0, 0, 0)),
+        )
+
+    if pending is not None:
+        result.append(pending)
+    return result
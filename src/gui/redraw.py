@@ -0,0 +1,84 @@
+import pygame
+
+
+class RedrawScheduler:
+    """Ekranı yalnızca bir şey değiştiğinde ve yalnızca değişen alanda günceller.
+
+    Her kare, izlenen ögelerin (ip, kamera, buton hover durumu, slider değeri,
+    parametre paneli) durumu bir önceki kareyle karşılaştırılır. Değişen
+    ögelerin eski ve yeni alanları kirli işaretlenir ve
+    pygame.display.update ile yalnızca bu dikdörtgenler gönderilir. Hiçbir şey
+    değişmediyse kare çizilmez ve bir sonraki olay beklenirken işlemci
+    kullanılmaz.
+    """
+
+    def __init__(self, size):
+        """
+        Args:
+            size: (genişlik, yükseklik) ekran boyutu
+        """
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self._states = {}
+        self._rects = []
+        self._full = True
+
+    @property
+    def dirty(self):
+        """Bu karede çizilecek bir şey var mı?"""
+        return self._full or bool(self._rects)
+
+    def invalidate(self, rect=None):
+        """
+        Bir alanı kirli işaretler.
+
+        Args:
+            rect: Ekran alanı (None ise tüm ekran)
+        """
+        if rect is None:
+            self._full = True
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def track(self, key, state, rect=None):
+        """
+        Bir ögenin durumunu kaydeder; değiştiyse eski ve yeni alanını kirletir.
+
+        Args:
+            key: Ögenin adı
+            state: Karşılaştırılabilir durum (ör. hover, değer, versiyon)
+            rect: Ögenin ekran alanı (None ise tüm ekran)
+
+        Returns:
+            Durum değişti mi
+        """
+        previous = self._states.get(key)
+        self._states[key] = (state, rect)
+        if previous is not None and previous == (state, rect):
+            return False
+
+        self.invalidate(rect)
+        if previous is not None:
+            self.invalidate(previous[1])
+        return True
+
+    def events(self, block=False):
+        """
+        Bekleyen olayları döndürür.
+
+        Args:
+            block: True ise en az bir olay gelene kadar bekler (boşta kalma)
+        """
+        if block:
+            return [pygame.event.wait()] + pygame.event.get()
+        return pygame.event.get()
+
+    def present(self):
+        """Kirli alanları ekrana gönderir ve kirli listesini temizler."""
+        if self._full:
+            pygame.display.flip()
+        elif self._rects:
+            pygame.display.update(self._rects)
+        self._full = False
+        self._rects = []
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+
+import pygame
+
+# Önbellekte tutulacak en fazla render edilmiş yazı sayısı
+TEXT_CACHE_SIZE = 256
+
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """
+    Fontu ilk istekte yükler, sonraki isteklerde aynı objeyi döndürür.
+
+    Args:
+        size: Font boyutu
+        name: Sistem font adı (None ise pygame varsayılanı)
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """Render edilmiş yazı yüzeyleri için LRU önbellek.
+
+    Anahtar (font, yazı, renk) üçlüsüdür; değişmeyen HUD yazıları yalnızca
+    bir kez render edilir, her karede sadece blit edilir.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        """
+        Args:
+            max_entries: Önbellekteki en fazla yüzey sayısı
+        """
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font, text, color):
+        """
+        Yazıyı render eder veya önbellekteki yüzeyi döndürür.
+
+        Args:
+            font: pygame.font.Font objesi
+            text: Yazı
+            color: Yazı rengi
+
+        Returns:
+            Yazının yüzeyi (değiştirilmemeli)
+        """
+        key = (font, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Önbelleği boşaltır."""
+        self._surfaces.clear()
+
+
+# Tüm HUD'un paylaştığı varsayılan önbellek
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, color):
+    """Yazıyı varsayılan önbellek üzerinden render eder."""
+    return TEXT_CACHE.render(font, text, color)
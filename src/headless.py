@@ -0,0 +1,150 @@
+import time
+
+from array_rope import ArrayRope
+from parallel import ShardedWorld
+from profiler import PROFILER
+from world import World
+
+# Çok ipli koşularda iplerin yatay aralığı
+ROPE_SPACING = 60
+
+
+def run_headless(
+    steps=1000,
+    num_segments=15,
+    segment_length=35,
+    gravity=0.5,
+    damping=0.99,
+    constraint_iterations=5,
+    solver="gauss_seidel",
+    bounds=(1600, 900),
+    recorder=None,
+    tolerance=None,
+    min_iterations=1,
+    dtype=float,
+    ropes=1,
+    workers=0,
+):
+    """
+    Simülasyonu pencere açmadan ve çizim yapmadan çalıştırır.
+
+    ropes 1'den büyükse ipler yan yana tek bir World içinde oluşturulur ve
+    her adımda birlikte ilerletilir. workers verilirse dünya paylaşımlı
+    bellekte tutulur ve ipler o kadar işçi süreçte parça parça ilerletilir
+    (süreçlerin başlatılması süreye dahil değildir).
+
+    Args:
+        steps: Çalıştırılacak fizik adımı sayısı
+        num_segments: İpin kaç parçadan oluşacağı
+        segment_length: Her segmentin uzunluğu
+        gravity: Yerçekimi kuvveti
+        damping: Sönümleme katsayısı
+        constraint_iterations: Constraint çözme iterasyon sayısı
+        solver: Constraint çözücüsü (ArrayRope.SOLVERS)
+        bounds: (genişlik, yükseklik) dünya sınırları
+        recorder: Verilirse her adımın pozisyonları kaydedilir (recording.Recorder)
+        tolerance: Verilirse iterasyonlar göreli hata bu değere inince durur
+            (constraint_iterations en fazla iterasyon sayısı olur)
+        min_iterations: tolerance ile yapılacak en az iterasyon sayısı
+        dtype: Durum dizilerinin tipi (np.float32 ile bellek yaklaşık yarıya iner)
+        ropes: İp sayısı
+        workers: İşçi süreç sayısı (0 ise aynı süreçte)
+
+    Returns:
+        Çalışma istatistikleri (adım sayısı, süre, adım/saniye, ortalama
+        iterasyon, çözüm sonrası en büyük/ortalama RMS göreli hata, toleransa
+        inemeyen adım sayısı ve ArrayRope/World.memory_usage raporu)
+    """
+    created = [
+        ArrayRope(
+            start_x=i * ROPE_SPACING,
+            start_y=0,
+            num_segments=num_segments,
+            segment_length=segment_length,
+            start_fixed=True,
+            solver=solver,
+            dtype=dtype,
+        )
+        for i in range(ropes)
+    ]
+    sharded = None
+    if ropes > 1 or workers:
+        sim = World(solver=solver, dtype=dtype)
+        sim.add_ropes(created)
+        update = sim.step
+        if workers:
+            sharded = ShardedWorld(sim, workers)
+            update = sharded.step
+        if recorder is not None:
+            recorder.write_ropes(sim.offsets[:-1])
+    else:
+        sim = created[0]
+        update = sim.update
+
+    iterations = 0
+    max_error = 0.0
+    rms_total = 0.0
+    unconverged = 0
+    try:
+        start = time.perf_counter()
+        for step in range(steps):
+            update(
+                gravity=gravity,
+                damping=damping,
+                dt=1.0,
+                constraint_iterations=constraint_iterations,
+                bounds=bounds,
+                tolerance=tolerance,
+                min_iterations=min_iterations,
+            )
+            solver_stats = sim.solver_stats
+            iterations += solver_stats["iterations"]
+            max_error = max(max_error, solver_stats["max_error"])
+            rms_total += solver_stats["rms_error"]
+            unconverged += solver_stats["converged"] is False
+            if recorder is not None:
+                recorder.write_frame(sim.particles.x, sim.particles.y, step)
+            PROFILER.frame_end()
+        elapsed = time.perf_counter() - start
+    finally:
+        if sharded is not None:
+            sharded.close()
+
+    return {
+        "steps": steps,
+        "segments": num_segments,
+        "ropes": ropes,
+        "workers": workers,
+        "solver": solver,
+        "seconds": elapsed,
+        "steps_per_second": steps / elapsed if elapsed > 0 else float("inf"),
+        "mean_iterations": iterations / steps if steps else 0.0,
+        "max_error": max_error,
+        "mean_rms_error": rms_total / steps if steps else 0.0,
+        "unconverged_steps": unconverged,
+        "memory": sim.memory_usage(),
+    }
+
+
+def run_scaling(max_workers, **kwargs):
+    """
+    Aynı koşuyu aynı süreçte ve 1..max_workers işçiyle tekrarlar.
+
+    Args:
+        max_workers: En fazla işçi süreç sayısı
+        kwargs: run_headless argümanları
+
+    Returns:
+        run_headless istatistiklerinin listesi (ilki aynı süreçteki koşu);
+        her birinde aynı süreçteki koşuya göre "speedup" oranı bulunur
+    """
+    results = []
+    for workers in range(max_workers + 1):
+        stats = run_headless(workers=workers, **kwargs)
+        stats["speedup"] = (
+            stats["steps_per_second"] / results[0]["steps_per_second"]
+            if results
+            else 1.0
+        )
+        results.append(stats)
+    return results
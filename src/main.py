@@ -1,17 +1,30 @@
+import argparse
 import sys
 
+import numpy as np
 import pygame
 
+from array_rope import SOLVERS, ArrayRope
+from export import FORMATS, QUEUE_SIZE, FrameWriter
+from gui.grid import GridBackground
 from gui.gui import GUI
-from rope import Rope
-
-# Pygame başlatma
-pygame.init()
+from gui.input import coalesce_motion
+from gui.redraw import RedrawScheduler
+from gui.text import get_font, render_text
+from headless import run_headless, run_scaling
+from parallel import ShardedWorld
+from profiler import PROFILER
+from recording import Recorder, Recording
+from rope_renderer import LOD_TOLERANCE
+from scene import load_scene, save_scene
+from simulation import SimulationThread, interpolate
+from world import World
 
 # Pencere boyutları (Yükseklik 900 olarak ayarlandı)
 WIDTH, HEIGHT = 1600, 900
-SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Rope Simulation")
+
+# Pencere yalnızca interaktif modda açılır (bkz. init_display)
+SCREEN = None
 
 # Renkler
 BACKGROUND_COLOR = (20, 20, 30)
@@ -22,10 +35,44 @@ BUTTON_COLOR = (50, 70, 90)
 BUTTON_HOVER = (70, 90, 110)
 BUTTON_BORDER = (100, 120, 140)
 
+# Arka plan ızgarası (zoom veya pencere boyutu değişince yeniden çizilir)
+GRID = GridBackground(
+    grid_size=50, line_color=(40, 40, 50), background_color=BACKGROUND_COLOR
+)
+
+# Kayıtta kare başına ayrılan partikül sayısı (Segments slider'ı üst sınırı + 1)
+RECORD_CAPACITY = 5001
+
+# --ropes ile başlangıçta oluşturulan iplerin yatay aralığı
+ROPE_SPACING = 60
+
+# F5/F9 ile kaydedilen/yüklenen varsayılan sahne dosyası
+SCENE_PATH = "scene.rope"
+
+# Sahneyle kaydedilip F9 ile geri yüklenen fizik parametreleri; tolerance ve
+# min_iterations gibi komut satırı ayarları yüklemeden etkilenmez (segment
+# sayısı ve uzunluğu yüklenen iplerden okunur)
+SCENE_PARAMS = ("gravity", "damping", "constraint_iterations", "self_collision")
+
+# F4 ile yazılan varsayılan Chrome trace dosyası
+TRACE_PATH = "trace.json"
+
 # FPS kontrolü
 CLOCK = pygame.time.Clock()
 FPS = 60
 
+# Fizik iş parçacığının saniyedeki sabit adım sayısı (kare hızından bağımsız)
+PHYSICS_RATE = 60
+
+
+def init_display():
+    """Pygame'i başlatır ve simülasyon penceresini açar."""
+    global SCREEN
+
+    pygame.init()
+    SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Rope Simulation")
+
 
 class Camera:
     """Kamera sınıfı - zoom ve pan işlemleri için."""
@@ -67,33 +114,8 @@ class Camera:
 
 
 def draw_grid(camera):
-    """Arka planda şık bir ızgara çizer."""
-    line_color = (40, 40, 50)
-    grid_size = 50
-
-    # Ekran sınırlarını dünya koordinatlarına çevir
-    world_left, world_top = camera.screen_to_world(0, 0)
-    world_right, world_bottom = camera.screen_to_world(WIDTH, HEIGHT)
-
-    # Zemin ızgarası
-    start_x = int(world_left // grid_size * grid_size)
-    end_x = int(world_right // grid_size * grid_size + grid_size)
-    start_y = int(world_top // grid_size * grid_size)
-    end_y = int(world_bottom // grid_size * grid_size + grid_size)
-
-    for x in range(start_x, end_x + 1, grid_size):
-        screen_x, screen_y = camera.world_to_screen(x, start_y)
-        screen_x_end, screen_y_end = camera.world_to_screen(x, end_y)
-        pygame.draw.line(
-            SCREEN, line_color, (screen_x, screen_y), (screen_x_end, screen_y_end), 1
-        )
-
-    for y in range(start_y, end_y + 1, grid_size):
-        screen_x, screen_y = camera.world_to_screen(start_x, y)
-        screen_x_end, screen_y_end = camera.world_to_screen(end_x, y)
-        pygame.draw.line(
-            SCREEN, line_color, (screen_x, screen_y), (screen_x_end, screen_y_end), 1
-        )
+    """Arka planı temizler ve önbellekteki ızgara döşemesini çizer."""
+    GRID.draw(SCREEN, camera)
 
 
 def draw_button(screen, rect, text, font, hovered):
@@ -102,7 +124,7 @@ def draw_button(screen, rect, text, font, hovered):
     pygame.draw.rect(screen, color, rect)
     pygame.draw.rect(screen, BUTTON_BORDER, rect, 2)
 
-    text_surf = font.render(text, True, WHITE)
+    text_surf = render_text(font, text, WHITE)
     text_rect = text_surf.get_rect(center=rect.center)
     screen.blit(text_surf, text_rect)
 
@@ -113,7 +135,7 @@ def draw_slider(screen, rect, value, min_val, max_val, label, font):
     pygame.draw.rect(screen, BUTTON_BORDER, rect, 2)
 
     # Etiket
-    label_surf = font.render(f"{label}: {int(value)}", True, WHITE)
+    label_surf = render_text(font, f"{label}: {int(value)}", WHITE)
     screen.blit(label_surf, (rect.left, rect.top - 25))
 
     # Slider valisi
@@ -135,8 +157,109 @@ def clamp(value, min_val, max_val):
     return max(min_val, min(value, max_val))
 
 
-def main():
-    """Ana oyun döngüsü."""
+def create_rope(start_x, start_y, params):
+    """Parametrelere göre NumPy tabanlı yeni bir ip oluşturur."""
+    return ArrayRope(
+        start_x=start_x,
+        start_y=start_y,
+        num_segments=params["num_segments"],
+        segment_length=params["segment_length"],
+        start_fixed=True,
+        particle_color=WHITE,
+        rope_color=ROPE_COLOR,
+        solver="gauss_seidel",
+        self_collision=params["self_collision"],
+    )
+
+
+def create_world(starts, params, lod_tolerance=LOD_TOLERANCE):
+    """
+    Verilen başlangıç noktalarında birer ip içeren dünya oluşturur.
+
+    Args:
+        starts: İplerin sabit uçlarının (x, y) dünya koordinatları
+        params: Simülasyon parametreleri
+        lod_tolerance: Uzaklaştırılmış çizimde LOD toleransı (piksel)
+
+    Returns:
+        World
+    """
+    world = World(
+        solver="gauss_seidel",
+        self_collision=params["self_collision"],
+        lod_tolerance=lod_tolerance,
+    )
+    world.add_ropes([create_rope(x, y, params) for x, y in starts])
+    return world
+
+
+def reset_world(world, initial_states, params):
+    """
+    Dünyayı bellekteki başlangıç snapshot'larına döndürür.
+
+    Segment sayısı veya uzunluğu snapshot'lardan farklıysa ipler aynı
+    başlangıç noktalarında parametrelerden yeniden oluşturulur ve yeni
+    snapshot alınır.
+
+    Returns:
+        Başlangıç snapshot'ları
+    """
+    world.self_collision = params["self_collision"]
+    if any(
+        len(state["constraints"]["i1"]) != params["num_segments"]
+        or state["segment_length"] != params["segment_length"]
+        for state in initial_states
+    ):
+        starts = [
+            (state["particles"]["x"][0], state["particles"]["y"][0])
+            for state in initial_states
+        ]
+        world.clear()
+        world.add_ropes([create_rope(x, y, params) for x, y in starts])
+        return world.snapshot()
+
+    world.restore(initial_states)
+    return initial_states
+
+
+def main(
+    recorder=None,
+    scene_path=SCENE_PATH,
+    tolerance=None,
+    min_iterations=1,
+    trace_path=TRACE_PATH,
+    ropes=1,
+    workers=0,
+    physics_rate=PHYSICS_RATE,
+    lod_tolerance=LOD_TOLERANCE,
+):
+    """
+    Ana oyun döngüsü.
+
+    Tüm ipler tek bir World içinde tutulur ve ayrı bir fizik iş
+    parçacığında sabit zaman adımıyla birlikte ilerletilir; çizim son iki
+    fizik snapshot'ı arasında interpolasyon yapılmış bir kopyadan yapılır.
+    Fare ile seçim tüm iplerde yapılır. N fare konumuna yeni bir ip ekler.
+    F3 aşama profilini açıp kapatır (panel ve kare süresi dağılımı), F4
+    toplanan bölümleri Chrome trace dosyasına yazar.
+
+    Args:
+        recorder: Verilirse pozisyonlar ve girdi olayları kaydedilir
+            (recording.Recorder)
+        scene_path: F5 ile kaydedilen, F9 ile yüklenen sahne dosyası
+        tolerance: Verilirse kısıtlama iterasyonları göreli hata bu değere
+            inince durur (iterasyon sayısı en fazla değer olur)
+        min_iterations: tolerance ile yapılacak en az iterasyon sayısı
+        trace_path: F4 ile yazılan Chrome trace dosyası
+        ropes: Başlangıçta yan yana oluşturulan ip sayısı
+        workers: Verilirse ipler paylaşımlı bellekte tutulur ve bu kadar
+            işçi süreçte ilerletilir
+        physics_rate: Saniyedeki fizik adımı sayısı
+        lod_tolerance: Uzaklaştırılmış çizimde LOD toleransı (piksel; 0 ise
+            her partikül çizilir)
+    """
+    init_display()
+
     # GUI ve Rope nesnelerini oluştur
     gui = GUI(WIDTH, HEIGHT)
 
@@ -150,6 +273,9 @@ def main():
         "gravity": 0.5,
         "damping": 0.99,
         "constraint_iterations": 5,
+        "tolerance": tolerance,
+        "min_iterations": min_iterations,
+        "self_collision": False,
     }
 
     # Yeni aralıklar ( %25 genişletilmiş )
@@ -160,19 +286,26 @@ def main():
         "segment_length": (15, 187),
     }
 
-    # İpin başlangıç_parametreleri
-    start_x = 0
+    # İplerin başlangıç noktaları (ortadaki ip başlangıç noktasında)
+    start_x = -ROPE_SPACING * (ropes - 1) / 2
     start_y = 0
-    rope = Rope(
-        start_x=start_x,
-        start_y=start_y,
-        num_segments=params["num_segments"],
-        segment_length=params["segment_length"],
-        start_fixed=True,
-        particle_color=WHITE,
-        rope_color=ROPE_COLOR,
+    world = create_world(
+        [(start_x + i * ROPE_SPACING, start_y) for i in range(ropes)], params
     )
 
+    # Reset ipleri yeniden oluşturmak yerine bu snapshot'lara döner
+    initial_states = world.snapshot()
+
+    # İşçi süreçler varsa adımlar onlara dağıtılır
+    sharded = ShardedWorld(world, workers) if workers else None
+
+    # Fizik kendi iş parçacığında ilerler; view çizilen ara durumdur
+    physics = SimulationThread(world, sharded, rate=physics_rate)
+    view = World(lod_tolerance=lod_tolerance)
+    view.restore(world.snapshot())
+    view_layout = world.layout
+    physics.start()
+
     # Fare ile sürükleme değişkenleri
     dragged_particle_index = None
     mouse_down = False
@@ -192,6 +325,9 @@ def main():
     zoom_out_rect = pygame.Rect(60, 10, 40, 40)
     zoom_reset_rect = pygame.Rect(110, 10, 60, 40)
 
+    # Profil paneli (F3)
+    profile_rect = pygame.Rect(10, 60, 300, 380)
+
     hover_states = {
         "reset": False,
         "gravity": False,
@@ -206,286 +342,883 @@ def main():
     running = True
     paused = True
 
+    # Yeniden çizim zamanlayıcısı; boştayken olay gelene kadar beklenir
+    scheduler = RedrawScheduler((WIDTH, HEIGHT))
+    idle = False
+
+    # Kayıt durumu: en son kaydedilen snapshot versiyonu ve ip düzeni
+    recorded = None
+    recorded_layout = None
+
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-
-        # Hover durumlarını güncelle
-        hover_states["reset"] = button_rect.collidepoint(mouse_pos)
-        hover_states["gravity"] = gravity_slider_rect.collidepoint(mouse_pos)
-        hover_states["damping"] = damping_slider_rect.collidepoint(mouse_pos)
-        hover_states["segments"] = segments_slider_rect.collidepoint(mouse_pos)
-        hover_states["length"] = length_slider_rect.collidepoint(mouse_pos)
-        hover_states["zoom_in"] = zoom_in_rect.collidepoint(mouse_pos)
-        hover_states["zoom_out"] = zoom_out_rect.collidepoint(mouse_pos)
-        hover_states["zoom_reset"] = zoom_reset_rect.collidepoint(mouse_pos)
-
-        # EVENT HANDLING
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+        events = scheduler.events(block=idle)
+
+        # Dünya yalnızca fizik kilidi tutulurken değiştirilir
+        with PROFILER.section("events"), physics.lock:
+            if recorder is not None:
+                for event in events:
+                    recorder.write_event(event)
+
+            # Karedeki hareket olayları tek olaya indirgenir; slider, sürükleme
+            # ve kamera kaydırma fare hızından bağımsız olarak bir kez işlenir
+            events = coalesce_motion(events)
+            mouse_pos = pygame.mouse.get_pos()
+
+            # Hover durumlarını güncelle
+            hover_states["reset"] = button_rect.collidepoint(mouse_pos)
+            hover_states["gravity"] = gravity_slider_rect.collidepoint(mouse_pos)
+            hover_states["damping"] = damping_slider_rect.collidepoint(mouse_pos)
+            hover_states["segments"] = segments_slider_rect.collidepoint(mouse_pos)
+            hover_states["length"] = length_slider_rect.collidepoint(mouse_pos)
+            hover_states["zoom_in"] = zoom_in_rect.collidepoint(mouse_pos)
+            hover_states["zoom_out"] = zoom_out_rect.collidepoint(mouse_pos)
+            hover_states["zoom_reset"] = zoom_reset_rect.collidepoint(mouse_pos)
+
+            # EVENT HANDLING
+            for event in events:
+                if event.type == pygame.QUIT:
                     running = False
-                elif event.key == pygame.K_SPACE:
-                    paused = not paused
-                    gui.simulation_running = not paused
-                elif event.key == pygame.K_r:
-                    # Rope'u resetle
-                    rope = Rope(
-                        start_x=start_x,
-                        start_y=start_y,
-                        num_segments=params["num_segments"],
-                        segment_length=params["segment_length"],
-                        start_fixed=True,
-                        particle_color=WHITE,
-                        rope_color=ROPE_COLOR,
-                    )
-                    dragged_particle_index = None
-                    active_slider = None
-                    camera.reset()
-                elif event.key == pygame.K_EQUALS or event.key == pygame.K_KP_PLUS:
-                    camera.zoom_in()
-                elif event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
-                    camera.zoom_out()
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    # Reset butonuna tıklandı
-                    if hover_states["reset"]:
-                        rope = Rope(
-                            start_x=start_x,
-                            start_y=start_y,
-                            num_segments=params["num_segments"],
-                            segment_length=params["segment_length"],
-                            start_fixed=True,
-                            particle_color=WHITE,
-                            rope_color=ROPE_COLOR,
-                        )
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    scheduler.invalidate()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_SPACE:
+                        paused = not paused
+                        gui.simulation_running = not paused
+                    elif event.key == pygame.K_r:
+                        # İpleri resetle
+                        initial_states = reset_world(world, initial_states, params)
                         dragged_particle_index = None
                         active_slider = None
-                    # Zoom butonları
-                    elif hover_states["zoom_in"]:
+                        camera.reset()
+                    elif event.key == pygame.K_EQUALS or event.key == pygame.K_KP_PLUS:
                         camera.zoom_in()
-                    elif hover_states["zoom_out"]:
+                    elif event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
                         camera.zoom_out()
-                    elif hover_states["zoom_reset"]:
-                        camera.reset()
-                    # Slider'lara tıklandı
-                    elif hover_states["gravity"]:
-                        active_slider = "gravity"
-                        mouse_down = True
-                    elif hover_states["damping"]:
-                        active_slider = "damping"
-                        mouse_down = True
-                    elif hover_states["segments"]:
-                        active_slider = "segments"
-                        mouse_down = True
-                    elif hover_states["length"]:
-                        active_slider = "length"
-                        mouse_down = True
-                    # Kamera sürüklemesi
-                    elif (
-                        hover_states["zoom_in"]
-                        or hover_states["zoom_out"]
-                        or hover_states["zoom_reset"]
-                    ):
-                        dragging_camera = True
-                        last_mouse_pos = mouse_pos
-                    else:
-                        # rope üzerine tıklandı
-                        world_pos = camera.screen_to_world(mouse_pos[0], mouse_pos[1])
-                        particle_index = rope.is_mouse_over_particle(
-                            world_pos, radius=25 / camera.zoom
+                    elif event.key == pygame.K_c:
+                        # İplerin kendileriyle ve birbirleriyle çarpışmasını aç/kapat
+                        params["self_collision"] = not params["self_collision"]
+                        world.self_collision = params["self_collision"]
+                    elif event.key == pygame.K_n:
+                        # Fare konumuna yeni ip ekle; reset onu da korur
+                        rope = create_rope(
+                            *camera.screen_to_world(mouse_pos[0], mouse_pos[1]),
+                            params,
                         )
-                        if particle_index is not None:
-                            dragged_particle_index = particle_index
-                            rope.particles[particle_index].is_being_dragged = True
-                            mouse_down = True
+                        initial_states = initial_states + [rope.snapshot()]
+                        world.add_rope(rope)
+                    elif event.key == pygame.K_F5:
+                        # Sahneyi kaydet
+                        save_scene(
+                            scene_path,
+                            world,
+                            {name: params[name] for name in SCENE_PARAMS},
+                            camera,
+                        )
+                        print(f"Scene saved to {scene_path}")
+                    elif event.key == pygame.K_F3:
+                        PROFILER.toggle()
+                    elif event.key == pygame.K_F4:
+                        count = PROFILER.export_chrome_trace(trace_path)
+                        print(f"Trace with {count} events written to {trace_path}")
+                    elif event.key == pygame.K_F9:
+                        # Sahneyi yükle; reset artık bu sahneye döner
+                        try:
+                            scene = load_scene(scene_path)
+                        except (OSError, ValueError) as exc:
+                            print(f"Could not load scene: {exc}")
                         else:
+                            world.restore(scene["ropes"])
+                            world.release_all()
+                            for name in SCENE_PARAMS:
+                                if name in scene["params"]:
+                                    params[name] = scene["params"][name]
+                            # İpsiz sahnede slider'lar önceki değerlerinde kalır
+                            if world.ropes:
+                                first = world.ropes[0]
+                                params["num_segments"] = len(first.constraints)
+                                params["segment_length"] = first.segment_length
+                            world.self_collision = params["self_collision"]
+                            if scene["camera"]:
+                                camera.x = scene["camera"]["x"]
+                                camera.y = scene["camera"]["y"]
+                                camera.zoom = scene["camera"]["zoom"]
+                            initial_states = world.snapshot()
+                            dragged_particle_index = None
+                            active_slider = None
+                            mouse_down = False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    if event.button == 1:
+                        # Reset butonuna tıklandı
+                        if hover_states["reset"]:
+                            initial_states = reset_world(
+                                world, initial_states, params
+                            )
+                            dragged_particle_index = None
+                            active_slider = None
+                        # Zoom butonları
+                        elif hover_states["zoom_in"]:
+                            camera.zoom_in()
+                        elif hover_states["zoom_out"]:
+                            camera.zoom_out()
+                        elif hover_states["zoom_reset"]:
+                            camera.reset()
+                        # Slider'lara tıklandı
+                        elif hover_states["gravity"]:
+                            active_slider = "gravity"
                             mouse_down = True
-                elif event.button == 4:  # Mouse scroll up (zoom in)
-                    camera.zoom_in()
-                elif event.button == 5:  # Mouse scroll down (zoom out)
-                    camera.zoom_out()
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:
-                    # Slider Releases
-                    if active_slider is not None:
-                        active_slider = None
-                        mouse_down = False
-                    elif mouse_down is True:
-                        mouse_down = False
-                        if (
-                            dragged_particle_index is not None
-                            and dragged_particle_index < len(rope.particles)
+                        elif hover_states["damping"]:
+                            active_slider = "damping"
+                            mouse_down = True
+                        elif hover_states["segments"]:
+                            active_slider = "segments"
+                            mouse_down = True
+                        elif hover_states["length"]:
+                            active_slider = "length"
+                            mouse_down = True
+                        # Kamera sürüklemesi
+                        elif (
+                            hover_states["zoom_in"]
+                            or hover_states["zoom_out"]
+                            or hover_states["zoom_reset"]
                         ):
-                            rope.particles[
-                                dragged_particle_index
-                            ].is_being_dragged = False
-                        dragged_particle_index = None
-                    dragging_camera = False
-            elif event.type == pygame.MOUSEMOTION:
-                # Slider hareketi
-                if active_slider is not None:
-                    if active_slider == "gravity":
-                        rel_x = clamp(
-                            mouse_pos[0] - gravity_slider_rect.left - 10, 0, 180
-                        )
-                        min_val, max_val = PARAM_RANGES["gravity"]
-                        params["gravity"] = round(
-                            min_val + (rel_x / 180) * (max_val - min_val), 2
-                        )
-                    elif active_slider == "damping":
-                        rel_x = clamp(
-                            mouse_pos[0] - damping_slider_rect.left - 10, 0, 180
-                        )
-                        min_val, max_val = PARAM_RANGES["damping"]
-                        params["damping"] = round(
-                            min_val + (rel_x / 180) * (max_val - min_val), 3
-                        )
-                    elif active_slider == "segments":
-                        rel_x = clamp(
-                            mouse_pos[0] - segments_slider_rect.left - 10, 0, 180
-                        )
-                        min_val, max_val = PARAM_RANGES["segments"]
-                        params["num_segments"] = int(
-                            min_val + (rel_x / 180) * (max_val - min_val)
-                        )
-                        # Segment sayısı değişince rope'u yeniden oluştur
-                        rope = Rope(
-                            start_x=start_x,
-                            start_y=start_y,
-                            num_segments=params["num_segments"],
-                            segment_length=params["segment_length"],
-                            start_fixed=True,
-                            particle_color=WHITE,
-                            rope_color=ROPE_COLOR,
-                        )
-                        dragged_particle_index = None
-                    elif active_slider == "length":
-                        rel_x = clamp(
-                            mouse_pos[0] - length_slider_rect.left - 10, 0, 180
-                        )
-                        min_val, max_val = PARAM_RANGES["segment_length"]
-                        params["segment_length"] = int(
-                            min_val + (rel_x / 180) * (max_val - min_val)
-                        )
-                        # Segment uzunluğu değişince rope'u yeniden oluştur
-                        rope = Rope(
-                            start_x=start_x,
-                            start_y=start_y,
-                            num_segments=params["num_segments"],
-                            segment_length=params["segment_length"],
-                            start_fixed=True,
-                            particle_color=WHITE,
-                            rope_color=ROPE_COLOR,
-                        )
-                        dragged_particle_index = None
-                # Kamera sürüklemesi
-                elif dragging_camera:
-                    dx = mouse_pos[0] - last_mouse_pos[0]
-                    dy = mouse_pos[1] - last_mouse_pos[1]
-                    camera.x -= dx / camera.zoom
-                    camera.y -= dy / camera.zoom
-                    last_mouse_pos = mouse_pos
-                elif mouse_down is True and dragged_particle_index is not None:
-                    world_pos = camera.screen_to_world(mouse_pos[0], mouse_pos[1])
-                    rope.drag_particle(world_pos, dragged_particle_index)
-
-        # EKRANI TEMİZLE
-        SCREEN.fill(BACKGROUND_COLOR)
-
-        # IZGARAYI ÇİZ
-        draw_grid(camera)
+                            dragging_camera = True
+                            last_mouse_pos = mouse_pos
+                        else:
+                            # Herhangi bir ipin üzerine tıklandı (global indeks)
+                            world_pos = camera.screen_to_world(
+                                mouse_pos[0], mouse_pos[1]
+                            )
+                            particle_index = world.is_mouse_over_particle(
+                                world_pos, radius=25 / camera.zoom
+                            )
+                            if particle_index is not None:
+                                dragged_particle_index = particle_index
+                                world.particles[particle_index].is_being_dragged = True
+                                mouse_down = True
+                            else:
+                                mouse_down = True
+                    elif event.button == 4:  # Mouse scroll up (zoom in)
+                        camera.zoom_in()
+                    elif event.button == 5:  # Mouse scroll down (zoom out)
+                        camera.zoom_out()
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    if event.button == 1:
+                        # Slider Releases
+                        if active_slider is not None:
+                            active_slider = None
+                            mouse_down = False
+                        elif mouse_down is True:
+                            mouse_down = False
+                            if (
+                                dragged_particle_index is not None
+                                and dragged_particle_index < len(world.particles)
+                            ):
+                                world.particles[
+                                    dragged_particle_index
+                                ].is_being_dragged = False
+                            dragged_particle_index = None
+                        dragging_camera = False
+                elif event.type == pygame.MOUSEMOTION:
+                    # Slider hareketi
+                    if active_slider is not None:
+                        if active_slider == "gravity":
+                            rel_x = clamp(
+                                mouse_pos[0] - gravity_slider_rect.left - 10, 0, 180
+                            )
+                            min_val, max_val = PARAM_RANGES["gravity"]
+                            params["gravity"] = round(
+                                min_val + (rel_x / 180) * (max_val - min_val), 2
+                            )
+                        elif active_slider == "damping":
+                            rel_x = clamp(
+                                mouse_pos[0] - damping_slider_rect.left - 10, 0, 180
+                            )
+                            min_val, max_val = PARAM_RANGES["damping"]
+                            params["damping"] = round(
+                                min_val + (rel_x / 180) * (max_val - min_val), 3
+                            )
+                        elif active_slider == "segments":
+                            rel_x = clamp(
+                                mouse_pos[0] - segments_slider_rect.left - 10, 0, 180
+                            )
+                            min_val, max_val = PARAM_RANGES["segments"]
+                            params["num_segments"] = int(
+                                min_val + (rel_x / 180) * (max_val - min_val)
+                            )
+                            # İp olaylardan sonra, karede bir kez boyutlandırılır
+                        elif active_slider == "length":
+                            rel_x = clamp(
+                                mouse_pos[0] - length_slider_rect.left - 10, 0, 180
+                            )
+                            min_val, max_val = PARAM_RANGES["segment_length"]
+                            params["segment_length"] = int(
+                                min_val + (rel_x / 180) * (max_val - min_val)
+                            )
+                            # İp olaylardan sonra, karede bir kez boyutlandırılır
+                    # Kamera sürüklemesi
+                    elif dragging_camera:
+                        dx = mouse_pos[0] - last_mouse_pos[0]
+                        dy = mouse_pos[1] - last_mouse_pos[1]
+                        camera.x -= dx / camera.zoom
+                        camera.y -= dy / camera.zoom
+                        last_mouse_pos = mouse_pos
+                    elif mouse_down is True and dragged_particle_index is not None:
+                        world_pos = camera.screen_to_world(mouse_pos[0], mouse_pos[1])
+                        world.drag_particle(world_pos, dragged_particle_index)
 
-        # GUI'yi çiz
-        gui.draw(SCREEN)
-
-        # Parametre bilgilerini çiz
-        sim_params = {
-            "Segments": len(rope.particles) - 1,
-            "FPS": int(CLOCK.get_fps()),
-            "Paused": "Yes" if paused else "No",
-            "Gravity": params["gravity"],
-            "Damping": params["damping"],
-            "Zoom": f"{camera.zoom:.2f}x",
-        }
-        gui.draw_params(SCREEN, sim_params)
-
-        # UI Kontrollerini çiz
-        font_small = pygame.font.SysFont(None, 20)
-        font_tiny = pygame.font.SysFont(None, 16)
-
-        # Zoom butonları
-        draw_button(SCREEN, zoom_in_rect, "+", font_small, hover_states["zoom_in"])
-        draw_button(SCREEN, zoom_out_rect, "-", font_small, hover_states["zoom_out"])
-        draw_button(
-            SCREEN, zoom_reset_rect, "RESET", font_small, hover_states["zoom_reset"]
-        )
+        # Slider değişikliklerini ipleri yeniden oluşturmadan uygula (karede bir kez)
+        with PROFILER.section("resize"), physics.lock:
+            layout = world.layout
+            world.resize(params["num_segments"])
+            if world.layout != layout and dragged_particle_index is not None:
+                # Global indeksler kaydığı için sürükleme bırakılır
+                world.release_all()
+                dragged_particle_index = None
+                mouse_down = False
+            world.set_segment_length(params["segment_length"])
+
+            # İp yapısı değiştiyse çizim kopyası yenilenir; duraklatılmışken
+            # yapılan değişiklikler fizik adımı beklenmeden yayımlanır
+            if world.layout != view_layout:
+                view.restore(world.snapshot())
+                view_layout = world.layout
+                physics.publish(jump=True)
+            elif paused and world.version != physics.snapshots[1].version:
+                physics.publish(jump=True)
 
-        # Reset button
-        draw_button(
-            SCREEN, button_rect, "RESET ROPE", font_small, hover_states["reset"]
+        # Fizik iş parçacığı sonraki adımlarda bu parametreleri kullanır
+        physics.paused = paused
+        physics.configure(
+            gravity=params["gravity"],
+            damping=params["damping"],
+            dt=1.0,
+            constraint_iterations=params["constraint_iterations"],
+            bounds=SCREEN.get_size(),
+            tolerance=params["tolerance"],
+            min_iterations=params["min_iterations"],
         )
 
-        # Sliders
-        draw_slider(
-            SCREEN,
-            gravity_slider_rect,
-            params["gravity"],
-            PARAM_RANGES["gravity"][0],
-            PARAM_RANGES["gravity"][1],
-            "Gravity",
-            font_tiny,
+        # Son iki snapshot arasında ara durum (kilitsiz)
+        previous, current = physics.snapshots
+        with PROFILER.section("interpolate"):
+            alpha = physics.alpha()
+            if current.layout == view_layout:
+                interpolate(
+                    previous, current, alpha, view.particles.x, view.particles.y
+                )
+                view.particles.is_being_dragged[:] = current.is_being_dragged
+
+        # Yeni bir fizik durumu varsa kaydet (ip düzeni değiştiyse önce düzeni)
+        if recorder is not None and recorded != current.version:
+            if recorded_layout != current.layout:
+                recorder.write_ropes(view.offsets[:-1])
+                recorded_layout = current.layout
+            recorder.write_frame(
+                current.x, current.y, current.step, dragged_particle_index
+            )
+            recorded = current.version
+
+        # Parametre bilgileri
+        with PROFILER.section("hud"):
+            sim_params = {
+                "Ropes": len(world),
+                "Segments": len(world.constraints),
+                "Active": current.active,
+                "FPS": int(CLOCK.get_fps()),
+                "Physics": f"{physics.steps_per_second:.0f}/s",
+                "Paused": "Yes" if paused else "No",
+                "Gravity": params["gravity"],
+                "Damping": params["damping"],
+                "Zoom": f"{camera.zoom:.2f}x",
+                "Iterations": current.solver_stats["iterations"],
+                "Residual": f"{current.solver_stats['max_error']:.1e}",
+            }
+            # Çözüm toleransa inmeden kesildiyse HUD'da belirtilir
+            if current.solver_stats["converged"] is False:
+                sim_params["Residual"] += " (capped)"
+            if world.self_collision:
+                stats = current.collision_stats
+                sim_params["Broadphase"] = stats["broadphase_pairs"]
+                sim_params["Contacts"] = stats["contacts"]
+            # --record-capacity aşıldıysa kaydedilen kareler kırpılmaktadır
+            if recorder is not None and recorder.truncated_frames:
+                sim_params["Truncated"] = recorder.truncated_frames
+
+            # Değişen ögeleri izle (hızlar yalnızca simülasyon çalışırken)
+            hud_state = dict(sim_params)
+            if paused:
+                hud_state.pop("FPS")
+                hud_state.pop("Physics")
+            params_rect = pygame.Rect(WIDTH - 200, 20, 200, 20 * len(sim_params))
+            scheduler.track("camera", (camera.x, camera.y, camera.zoom))
+            scheduler.track("gui", (gui.simulation_running, gui.show_help))
+            scheduler.track(
+                "world",
+                (view_layout, current.version, alpha, dragged_particle_index),
+                view.bounds(camera),
+            )
+            scheduler.track("params", tuple(hud_state.items()), params_rect)
+            for name, rect in (
+                ("reset", button_rect),
+                ("zoom_in", zoom_in_rect),
+                ("zoom_out", zoom_out_rect),
+                ("zoom_reset", zoom_reset_rect),
+            ):
+                scheduler.track(name, hover_states[name], rect)
+            for name, rect in (
+                ("gravity", gravity_slider_rect),
+                ("damping", damping_slider_rect),
+                ("num_segments", segments_slider_rect),
+                ("segment_length", length_slider_rect),
+            ):
+                scheduler.track(name, params[name], rect)
+
+            # Profil paneli açıkken her kare yenilenir
+            scheduler.track("profiler", PROFILER.enabled, profile_rect)
+            if PROFILER.enabled:
+                scheduler.invalidate(profile_rect)
+
+        # Hiçbir şey değişmediyse kare çizilmez
+        redraw = scheduler.dirty
+        if redraw:
+            # EKRANI TEMİZLE VE IZGARAYI ÇİZ
+            with PROFILER.section("grid"):
+                draw_grid(camera)
+
+            with PROFILER.section("gui"):
+                # GUI'yi çiz
+                gui.draw(SCREEN)
+
+                # Parametre bilgilerini çiz
+                gui.draw_params(SCREEN, sim_params)
+
+                # UI Kontrollerini çiz
+                font_small = get_font(20)
+                font_tiny = get_font(16)
+
+                # Zoom butonları
+                draw_button(
+                    SCREEN, zoom_in_rect, "+", font_small, hover_states["zoom_in"]
+                )
+                draw_button(
+                    SCREEN, zoom_out_rect, "-", font_small, hover_states["zoom_out"]
+                )
+                draw_button(
+                    SCREEN,
+                    zoom_reset_rect,
+                    "RESET",
+                    font_small,
+                    hover_states["zoom_reset"],
+                )
+
+                # Reset button
+                draw_button(
+                    SCREEN, button_rect, "RESET ROPE", font_small, hover_states["reset"]
+                )
+
+                # Sliders
+                draw_slider(
+                    SCREEN,
+                    gravity_slider_rect,
+                    params["gravity"],
+                    PARAM_RANGES["gravity"][0],
+                    PARAM_RANGES["gravity"][1],
+                    "Gravity",
+                    font_tiny,
+                )
+                draw_slider(
+                    SCREEN,
+                    damping_slider_rect,
+                    params["damping"],
+                    PARAM_RANGES["damping"][0],
+                    PARAM_RANGES["damping"][1],
+                    "Damping",
+                    font_tiny,
+                )
+                draw_slider(
+                    SCREEN,
+                    segments_slider_rect,
+                    params["num_segments"],
+                    PARAM_RANGES["segments"][0],
+                    PARAM_RANGES["segments"][1],
+                    "Segments",
+                    font_tiny,
+                )
+                draw_slider(
+                    SCREEN,
+                    length_slider_rect,
+                    params["segment_length"],
+                    PARAM_RANGES["segment_length"][0],
+                    PARAM_RANGES["segment_length"][1],
+                    "Segment Length",
+                    font_tiny,
+                )
+
+            # İplerin çizimi için kamera transform uygula
+            with PROFILER.section("rope_draw"):
+                view.draw(SCREEN, camera)
+
+            if PROFILER.enabled:
+                gui.draw_profile(SCREEN, PROFILER, profile_rect, limit=2000 / FPS)
+
+            # YALNIZCA DEĞİŞEN ALANLARI GÜNCELLE
+            with PROFILER.section("present"):
+                scheduler.present()
+
+        # Simülasyon duruyorsa ve değişiklik yoksa bir sonraki turda olay beklenir
+        idle = paused and not redraw
+
+        with PROFILER.section("tick"):
+            CLOCK.tick(FPS)
+        PROFILER.frame_end()
+
+    physics.stop()
+    if sharded is not None:
+        sharded.close()
+    pygame.quit()
+    sys.exit()
+
+
+def parse_args(argv=None):
+    """Komut satırı argümanlarını ayrıştırır."""
+    parser = argparse.ArgumentParser(description="Rope Simulation")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run the physics without a window and report steps/second",
+    )
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--segments", type=int, default=15)
+    parser.add_argument(
+        "--ropes", type=int, default=1, help="number of ropes stepped together"
+    )
+    parser.add_argument("--segment-length", type=float, default=35)
+    parser.add_argument("--gravity", type=float, default=0.5)
+    parser.add_argument("--damping", type=float, default=0.99)
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=5,
+        help="constraint iterations per step (maximum with --tolerance)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        help="stop iterating once the max relative constraint error is below this",
+    )
+    parser.add_argument("--min-iterations", type=int, default=1)
+    parser.add_argument("--solver", choices=SOLVERS, default="gauss_seidel")
+    parser.add_argument(
+        "--physics-rate",
+        type=float,
+        default=PHYSICS_RATE,
+        help="fixed physics steps per second, independent of the frame rate",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="step the ropes in this many worker processes over shared memory",
+    )
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="headless: repeat the run in-process and with 1..--workers workers",
+    )
+    parser.add_argument(
+        "--dtype",
+        choices=("float64", "float32"),
+        default="float64",
+        help="headless state precision (float32 halves position memory)",
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="print the rope's memory usage"
+    )
+    parser.add_argument("--width", type=int, default=WIDTH)
+    parser.add_argument("--height", type=int, default=HEIGHT)
+    parser.add_argument(
+        "--record", metavar="PATH", help="record positions and input events"
+    )
+    parser.add_argument(
+        "--record-delta",
+        action="store_true",
+        help="store frames as int16 deltas from periodic keyframes",
+    )
+    parser.add_argument(
+        "--record-capacity",
+        type=int,
+        help="particles stored per frame; extra particles are dropped "
+        "(default: max size of all ropes, grown when ropes are added)",
+    )
+    parser.add_argument(
+        "--scene", default=SCENE_PATH, help="scene file saved with F5, loaded with F9"
+    )
+    parser.add_argument("--replay", metavar="PATH", help="play back a recording")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="start with per-phase timers enabled (toggle with F3)",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="enable profiling and write a Chrome trace on exit (F4 writes it live)",
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed")
+    parser.add_argument(
+        "--lod-tolerance",
+        type=float,
+        default=LOD_TOLERANCE,
+        help="pixels along the rope below which particles are skipped when "
+        "zoomed out (0 draws every particle)",
+    )
+    parser.add_argument(
+        "--export",
+        metavar="PATH",
+        help="render frames offscreen to PATH (PNG folder or raw RGB file)",
+    )
+    parser.add_argument("--export-format", choices=FORMATS, default="png")
+    parser.add_argument("--export-frames", type=int, default=600)
+    parser.add_argument(
+        "--export-rate",
+        type=float,
+        default=FPS,
+        help="frames (one physics step each) per second; 0 renders unthrottled",
+    )
+    parser.add_argument(
+        "--export-queue",
+        type=int,
+        default=QUEUE_SIZE,
+        help="frames that may wait for the writer before new ones are dropped",
+    )
+    return parser.parse_args(argv)
+
+
+def open_recorder(args, capacity):
+    """
+    --record verilmişse bir Recorder açar.
+
+    --record-capacity verilmediyse kayıt, sonradan eklenen iplerle kapasiteyi
+    aşınca büyür; verildiyse fazla partiküller kırpılır.
+    """
+    if not args.record:
+        return None
+    return Recorder(
+        args.record,
+        capacity=args.record_capacity or capacity,
+        delta=args.record_delta,
+        grow=not args.record_capacity,
+    )
+
+
+def close_recorder(recorder):
+    """Kaydı kapatır; kırpılan kare varsa uyarı yazdırır."""
+    recorder.close()
+    if recorder.truncated_frames:
+        print(
+            f"warning: {recorder.truncated_frames} of {recorder.frames} recorded "
+            f"frames were truncated to {recorder.capacity} particles "
+            "(raise --record-capacity)"
         )
-        draw_slider(
-            SCREEN,
-            damping_slider_rect,
-            params["damping"],
-            PARAM_RANGES["damping"][0],
-            PARAM_RANGES["damping"][1],
-            "Damping",
-            font_tiny,
+
+
+def headless(args):
+    """Pencere açmadan simülasyonu çalıştırır ve hızını yazdırır."""
+    PROFILER.enable(args.profile or bool(args.trace))
+    if args.scaling:
+        scaling(args)
+        return
+    recorder = open_recorder(args, (args.segments + 1) * args.ropes)
+    stats = run_headless(
+        steps=args.steps,
+        num_segments=args.segments,
+        segment_length=args.segment_length,
+        gravity=args.gravity,
+        damping=args.damping,
+        constraint_iterations=args.iterations,
+        solver=args.solver,
+        bounds=(args.width, args.height),
+        recorder=recorder,
+        tolerance=args.tolerance,
+        min_iterations=args.min_iterations,
+        dtype=np.dtype(args.dtype),
+        ropes=args.ropes,
+        workers=args.workers,
+    )
+    if recorder is not None:
+        close_recorder(recorder)
+    print(
+        f"{stats['steps']} steps, {stats['ropes']} x {stats['segments']} segments, "
+        f"solver={stats['solver']}: {stats['seconds']:.3f} s, "
+        f"{stats['steps_per_second']:.1f} steps/s, "
+        f"{stats['mean_iterations']:.2f} iterations/step, "
+        f"max error {stats['max_error']:.2e}, "
+        f"mean RMS error {stats['mean_rms_error']:.2e}"
+    )
+    if stats["unconverged_steps"]:
+        print(
+            f"warning: {stats['unconverged_steps']} steps stopped before "
+            f"reaching the tolerance"
         )
-        draw_slider(
-            SCREEN,
-            segments_slider_rect,
-            params["num_segments"],
-            PARAM_RANGES["segments"][0],
-            PARAM_RANGES["segments"][1],
-            "Segments",
-            font_tiny,
+    if args.memory:
+        memory = stats["memory"]
+        print(
+            f"memory: particles {memory['particles'] / 2**20:.1f} MiB, "
+            f"constraints {memory['constraints'] / 2**20:.1f} MiB, "
+            f"{memory['bytes_per_segment']:.1f} bytes/segment ({args.dtype})"
         )
-        draw_slider(
-            SCREEN,
-            length_slider_rect,
-            params["segment_length"],
-            PARAM_RANGES["segment_length"][0],
-            PARAM_RANGES["segment_length"][1],
-            "Segment Length",
-            font_tiny,
+    if PROFILER.enabled:
+        p50, p99 = PROFILER.percentiles(50, 99)
+        print(f"step time p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+        for name, ms in PROFILER.breakdown().items():
+            print(f"  {name:<10} {ms:8.3f} ms/step")
+    if args.trace:
+        count = PROFILER.export_chrome_trace(args.trace)
+        print(f"Trace with {count} events written to {args.trace}")
+
+
+def scaling(args):
+    """Headless koşunun işçi sayısına göre hızını tablo olarak yazdırır."""
+    results = run_scaling(
+        max(args.workers, 1),
+        steps=args.steps,
+        num_segments=args.segments,
+        segment_length=args.segment_length,
+        gravity=args.gravity,
+        damping=args.damping,
+        constraint_iterations=args.iterations,
+        solver=args.solver,
+        bounds=(args.width, args.height),
+        tolerance=args.tolerance,
+        min_iterations=args.min_iterations,
+        dtype=np.dtype(args.dtype),
+        ropes=args.ropes,
+    )
+    print(
+        f"{args.steps} steps, {args.ropes} x {args.segments} segments, "
+        f"solver={args.solver}"
+    )
+    print(f"{'workers':>8} {'steps/s':>10} {'speedup':>8}")
+    for stats in results:
+        workers = stats["workers"] or "-"
+        print(
+            f"{workers:>8} {stats['steps_per_second']:10.1f} "
+            f"{stats['speedup']:7.2f}x"
         )
 
-        # Rope'u güncelle ve çiz
-        if not paused:
-            rope.update(
-                gravity=params["gravity"],
-                damping=params["damping"],
+
+def export(args):
+    """
+    Simülasyonu pencere açmadan ekran dışı bir yüzeye çizer ve kareleri
+    arka plandaki yazıcıya verir.
+
+    Her kare bir fizik adımıdır ve döngü --export-rate hızında ilerler.
+    Yazıcının kuyruğu doluysa kare beklenmeden atılır; sonunda yazılan,
+    atılan ve kuyrukta en fazla bekleyen kare sayıları yazdırılır.
+    """
+    pygame.init()
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    gui = GUI(WIDTH, HEIGHT)
+    camera = Camera()
+    params = {
+        "num_segments": args.segments,
+        "segment_length": args.segment_length,
+        "self_collision": False,
+    }
+    start_x = -ROPE_SPACING * (args.ropes - 1) / 2
+    world = create_world(
+        [(start_x + i * ROPE_SPACING, 0) for i in range(args.ropes)],
+        params,
+        lod_tolerance=args.lod_tolerance,
+    )
+
+    writer = FrameWriter(
+        args.export, (WIDTH, HEIGHT), args.export_format, args.export_queue
+    )
+    writer.start()
+    try:
+        for frame in range(args.export_frames):
+            world.step(
+                gravity=args.gravity,
+                damping=args.damping,
                 dt=1.0,
-                constraint_iterations=params["constraint_iterations"],
+                constraint_iterations=args.iterations,
+                bounds=(WIDTH, HEIGHT),
+                tolerance=args.tolerance,
+                min_iterations=args.min_iterations,
             )
 
-        # Rope'un çizimi için kamera transform uygula
-        rope.draw(SCREEN, camera)
+            GRID.draw(surface, camera)
+            world.draw(surface, camera)
+            gui.draw_params(
+                surface,
+                {
+                    "Frame": frame,
+                    "Ropes": len(world),
+                    "Segments": len(world.constraints),
+                    "Gravity": args.gravity,
+                    "Damping": args.damping,
+                    "Iterations": world.solver_stats["iterations"],
+                    "Queued": writer.queued,
+                    "Dropped": writer.dropped,
+                },
+            )
+            writer.submit(surface)
+            CLOCK.tick(args.export_rate)
+    finally:
+        writer.close()
 
-        # EKRANI GÜNCELLE
-        pygame.display.flip()
+    stats = writer.stats()
+    print(
+        f"{stats['written']}/{stats['submitted']} frames written to {args.export} "
+        f"({args.export_format}), {stats['dropped']} dropped, "
+        f"max {stats['max_queued']} queued"
+    )
+    if writer.error is not None:
+        print(f"Export stopped writing: {writer.error}")
+    elif args.export_format == "raw":
+        print(f"raw rgb24 {WIDTH}x{HEIGHT} at {args.export_rate or FPS:g} fps")
+
+
+def replay(args):
+    """
+    Kaydı simülasyonu yeniden çalıştırmadan oynatır.
 
-        # FPS KONTROLÜ
+    SPACE oynat/durdur, sol/sağ ok kare kare ilerleme, yukarı/aşağı ok hızı
+    iki katına çıkarma/yarıya indirme, BACKSPACE yönü ters çevirme,
+    HOME/END başa/sona gitme; zaman çizelgesine tıklamak o kareye atlar.
+    """
+    recording = Recording(args.replay)
+    last = len(recording) - 1
+    if last < 0:
+        print(f"{args.replay}: no frames recorded")
+        return
+
+    init_display()
+    camera = Camera(zoom=1.0, min_zoom=0.2, max_zoom=3.0)
+    world = World(lod_tolerance=args.lod_tolerance)
+    font = get_font(20)
+    timeline_rect = pygame.Rect(20, HEIGHT - 30, WIDTH - 40, 10)
+
+    position = 0.0
+    speed = args.speed
+    playing = True
+    running = True
+
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    playing = not playing
+                elif event.key == pygame.K_RIGHT:
+                    position, playing = int(position) + 1, False
+                elif event.key == pygame.K_LEFT:
+                    position, playing = int(position) - 1, False
+                elif event.key == pygame.K_UP:
+                    speed *= 2
+                elif event.key == pygame.K_DOWN:
+                    speed /= 2
+                elif event.key == pygame.K_BACKSPACE:
+                    speed = -speed
+                elif event.key == pygame.K_HOME:
+                    position = 0
+                elif event.key == pygame.K_END:
+                    position = last
+                elif event.key == pygame.K_EQUALS or event.key == pygame.K_KP_PLUS:
+                    camera.zoom_in()
+                elif event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
+                    camera.zoom_out()
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1 and timeline_rect.inflate(0, 20).collidepoint(
+                    event.pos
+                ):
+                    ratio = (event.pos[0] - timeline_rect.left) / timeline_rect.width
+                    position = ratio * last
+                elif event.button == 4:
+                    camera.zoom_in()
+                elif event.button == 5:
+                    camera.zoom_out()
+
+        if playing:
+            position += speed
+        position = clamp(position, 0, last)
+
+        # Kareye doğrudan eriş ve dünyaya yükle
+        index = int(position)
+        frame = recording.frame(index)
+        count = len(frame["x"])
+        sizes = np.diff(np.append(recording.rope_starts(index), count))
+        if count >= 2 and not np.array_equal(sizes, np.diff(world.offsets)):
+            world.clear()
+            world.add_ropes(
+                [
+                    ArrayRope(0, 0, num_segments=size - 1, start_fixed=True)
+                    for size in sizes
+                    if size >= 2
+                ]
+            )
+        if count == len(world.particles):
+            world.particles.x[:] = frame["x"]
+            world.particles.y[:] = frame["y"]
+            world.particles.is_being_dragged[:] = False
+            if frame["dragged"] is not None and frame["dragged"] < count:
+                world.particles.is_being_dragged[frame["dragged"]] = True
+
+        draw_grid(camera)
+        world.draw(SCREEN, camera)
+
+        # Zaman çizelgesi ve durum
+        pygame.draw.rect(SCREEN, BUTTON_COLOR, timeline_rect)
+        progress = timeline_rect.copy()
+        progress.width = int(timeline_rect.width * index / max(1, last))
+        pygame.draw.rect(SCREEN, BLUE, progress)
+        status = (
+            f"Frame {index}/{last}  Step {frame['step']}  Speed {speed:g}x  "
+            f"{'Playing' if playing else 'Paused'}"
+        )
+        events = recording.events_until(index)
+        if len(events):
+            name = pygame.event.event_name(int(events[-1]["type"]))
+            status += f"  Last event: {name}"
+        SCREEN.blit(render_text(font, status, WHITE), (20, HEIGHT - 60))
+
+        pygame.display.flip()
         CLOCK.tick(FPS)
 
     pygame.quit()
-    sys.exit()
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.replay:
+        replay(args)
+    elif args.headless:
+        headless(args)
+    elif args.export:
+        export(args)
+    else:
+        PROFILER.enable(args.profile or bool(args.trace))
+        recorder = open_recorder(args, RECORD_CAPACITY * args.ropes)
+        try:
+            main(
+                recorder,
+                scene_path=args.scene,
+                tolerance=args.tolerance,
+                min_iterations=args.min_iterations,
+                trace_path=args.trace or TRACE_PATH,
+                ropes=args.ropes,
+                workers=args.workers,
+                physics_rate=args.physics_rate,
+                lod_tolerance=args.lod_tolerance,
+            )
+        finally:
+            if recorder is not None:
+                close_recorder(recorder)
+            if args.trace:
+                PROFILER.export_chrome_trace(args.trace)
@@ -0,0 +1,407 @@
+"""Büyük dünyaların işçi süreçlerde parça parça ilerletilmesi.
+
+ShardedWorld bir World'ün düz dizilerini tek bir paylaşımlı bellek bloğuna
+(multiprocessing.shared_memory) taşır ve ipleri partikül sayısına göre
+dengelenmiş parçalara böler. Her işçi süreç kendi parçasını bu blok
+üzerindeki görünümlerle World.step ile ilerletir; ana süreç işçileri
+beklerken ilk parçayı kendisi ilerletir. Adım başına yalnızca adım
+parametreleri ve istatistikler gönderilir, diziler kopyalanmaz.
+
+Parçalar tam iplerden oluşur: ipler arasında kısıtlama olmadığından parçalar
+arasında sınır partikülü alışverişi gerekmez. Öz-çarpışma parça içinde
+işçilerde çözülür; ana süreç yalnızca başka bir parçanın sınır kutusuna
+giren ipler arasındaki temasları çözer. Tek bir çok büyük ip tek parçaya
+düşer. Ana süreçteki World ve ipleri aynı bloğu gösterdiğinden çizim ve
+sürükleme paylaşımlı diziler üzerinde doğrudan çalışır.
+"""
+
+import multiprocessing
+import os
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pygame
+
+from physics.collision import collide_ropes
+from physics.constraint_array import ConstraintArray
+from physics.particle_array import ParticleArray
+from profiler import PROFILER
+from world import World
+
+# Dizilerin paylaşımlı bloktaki hizalaması (bayt, önbellek satırı)
+_ALIGN = 64
+
+
+def _padded(size):
+    """Boyutu bir sonraki hizalama sınırına yuvarlar."""
+    return -(-size // _ALIGN) * _ALIGN
+
+
+def _all_converged(flags):
+    """Parçaların yakınsama bayraklarını birleştirir (None: tanımsız)."""
+    flags = list(flags)
+    if False in flags:
+        return False
+    return None if None in flags else True
+
+
+def _shards(offsets, edges, count):
+    """
+    İpleri partikül sayısı dengeli, ardışık parçalara böler.
+
+    Args:
+        offsets: İplerin başlangıç indeksleri ve sonda toplam partikül sayısı
+        edges: İplerin ilk kısıtlama indeksleri ve sonda toplam kısıtlama sayısı
+        count: En fazla parça sayısı
+
+    Returns:
+        (p0, p1, c0, c1, yerel offsets) listesi; boş parçalar atlanır
+    """
+    ropes = len(offsets) - 1
+    targets = offsets[-1] * np.arange(1, count) / count
+    cuts = np.searchsorted(offsets, targets)
+    bounds = np.unique(np.concatenate(([0], np.clip(cuts, 0, ropes), [ropes])))
+
+    shards = []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        p0, p1 = int(offsets[first]), int(offsets[last])
+        c0, c1 = int(edges[first]), int(edges[last])
+        shards.append((p0, p1, c0, c1, offsets[first : last + 1] - p0))
+    return shards
+
+
+def _attach(name, entries, shard, solver, radius, self_collision):
+    """İşçide paylaşımlı bloğa bağlanır ve parçayı ilerletecek dünyayı kurar."""
+    shm = SharedMemory(name=name)
+    arrays = {
+        (group, field): np.ndarray(
+            count, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset
+        )
+        for group, field, dtype, count, offset in entries
+    }
+    return shm, _shard_world(arrays, shard, solver, radius, self_collision)
+
+
+def _shard_world(arrays, shard, solver, radius, self_collision):
+    """
+    Tüm dünyanın dizilerinden bir parçayı gösteren, ipsiz World kurar.
+
+    Args:
+        arrays: (grup, alan adı) -> tüm dünyanın dizisi
+        shard: _shards çıktısındaki (p0, p1, c0, c1, yerel offsets)
+        solver: Constraint çözücüsü
+        radius: Ortak partikül yarıçapı
+        self_collision: Parça içi çarpışma
+
+    Returns:
+        World
+    """
+    p0, p1, c0, c1, offsets = shard
+
+    particles = ParticleArray([], [], radius=radius)
+    for field in ParticleArray.FIELDS:
+        setattr(particles, field, arrays["particles", field][p0:p1])
+
+    # Kısıtlama indeksleri parçaya yerel kopyadır (düzen değişince yeniden kurulur)
+    constraints = ConstraintArray(particles, [], [])
+    for field in ConstraintArray.FIELDS:
+        values = arrays["constraints", field][c0:c1]
+        if field in ("i1", "i2"):
+            values = values - p0
+        setattr(constraints, field, values)
+
+    world = World(solver=solver, self_collision=self_collision)
+    world.attach(particles, constraints, offsets)
+    return world
+
+
+def _worker(connection):
+    """İşçi süreç döngüsü: ("attach" | "step" | "close", veri) mesajları."""
+    shm = None
+    world = None
+    while True:
+        message, payload = connection.recv()
+        if message == "step":
+            world.step(**payload)
+            connection.send((world.solver_stats, world.collision_stats))
+        elif message == "attach":
+            world = None
+            if shm is not None:
+                shm.close()
+            shm, world = _attach(**payload)
+            connection.send(None)
+        else:
+            break
+    world = None
+    if shm is not None:
+        shm.close()
+
+
+class ShardedWorld:
+    """World'ü paylaşımlı bellekte tutup işçi süreçlerde ilerleten sarmalayıcı.
+
+    İp yapısı değiştiğinde (World.layout) diziler yeni bir bloğa taşınır ve
+    işçiler yeniden bağlanır. workers işçiyle dünya workers + 1 parçaya
+    bölünür; ilk parça ana süreçtedir. Kullanım sonunda close()
+    çağrılmalıdır; dünya kendi dizilerine geri kopyalanır.
+    """
+
+    def __init__(self, world, workers):
+        """
+        Args:
+            world: İlerletilecek World (tüm iplerin yarıçapı aynı olmalı)
+            workers: İşçi süreç sayısı
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.world = world
+        self.workers = int(workers)
+        self.shards = []
+        self._local = None
+        self._shm = None
+        self._retired = []
+        self._layout = None
+
+        # Her işçi world modülünü yeniden yükler; pygame karşılama yazısı basılmaz
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        context = multiprocessing.get_context("spawn")
+        self._connections = []
+        self._processes = []
+        for _ in range(self.workers):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+        self._share()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _share(self):
+        """Dünyanın dizilerini yeni bir paylaşımlı bloğa taşır ve işçileri bağlar."""
+        world = self.world
+        if world.ropes and world.particles.radius is None:
+            raise ValueError("sharded stepping needs ropes with a common radius")
+
+        entries = []
+        size = 0
+        for group, array in (
+            ("particles", world.particles),
+            ("constraints", world.constraints),
+        ):
+            for field in type(array).FIELDS:
+                values = getattr(array, field)
+                entries.append([group, field, values.dtype.str, len(values), size])
+                size += _padded(values.nbytes)
+
+        self._retire()
+        self._shm = SharedMemory(create=True, size=max(size, 1))
+        offsets = {(group, field): offset for group, field, _, _, offset in entries}
+
+        def allocate(group, field, current):
+            return np.ndarray(
+                current.shape,
+                dtype=current.dtype,
+                buffer=self._shm.buf,
+                offset=offsets[group, field],
+            )
+
+        world.relocate(allocate)
+
+        edges = np.cumsum([0] + [len(rope.constraints) for rope in world.ropes])
+        self.shards = _shards(world.offsets, edges, self.workers + 1)
+        options = {
+            "solver": world.solver,
+            "radius": world.particles.radius,
+            "self_collision": world.self_collision,
+        }
+
+        # İlk parça ana süreçte, aynı dizilerin görünümleri üzerinde ilerletilir
+        self._local = None
+        if self.shards:
+            arrays = {
+                (group, field): getattr(array, field)
+                for group, array in (
+                    ("particles", world.particles),
+                    ("constraints", world.constraints),
+                )
+                for field in type(array).FIELDS
+            }
+            self._local = _shard_world(arrays, self.shards[0], **options)
+
+        for connection, shard in zip(self._connections, self.shards[1:]):
+            connection.send(
+                (
+                    "attach",
+                    {
+                        "name": self._shm.name,
+                        "entries": entries,
+                        "shard": shard,
+                        **options,
+                    },
+                )
+            )
+        for connection in self._connections[: len(self.shards) - 1]:
+            connection.recv()
+        self._layout = world.layout
+
+    def _retire(self):
+        """Eski bloğu siler; hâlâ görünümü olan bloklar close() sırasında kapanır."""
+        if self._shm is None:
+            return
+        self._shm.unlink()
+        self._retired.append(self._shm)
+        self._shm = None
+        for shm in list(self._retired):
+            try:
+                shm.close()
+            except BufferError:
+                continue
+            self._retired.remove(shm)
+
+    def step(
+        self,
+        gravity=0.5,
+        damping=0.99,
+        dt=1.0,
+        constraint_iterations=3,
+        bounds=None,
+        tolerance=None,
+        min_iterations=1,
+    ):
+        """
+        Tüm parçaları işçilerde paralel olarak bir adım ilerletir.
+
+        Argümanlar World.step ile aynıdır; dünyanın solver_stats ve
+        collision_stats değerleri parçaların istatistiklerinden birleştirilir.
+        """
+        world = self.world
+        if world.layout != self._layout:
+            self._share()
+        if not self.shards:
+            return
+
+        if bounds is None:
+            bounds = pygame.display.get_surface().get_size()
+        payload = {
+            "gravity": gravity,
+            "damping": damping,
+            "dt": dt,
+            "constraint_iterations": constraint_iterations,
+            "bounds": tuple(bounds),
+            "tolerance": tolerance,
+            "min_iterations": min_iterations,
+        }
+
+        connections = self._connections[: len(self.shards) - 1]
+        for connection in connections:
+            connection.send(("step", payload))
+        self._local.step(**payload)
+        with PROFILER.section("shards"):
+            results = [(self._local.solver_stats, self._local.collision_stats)]
+            results += [connection.recv() for connection in connections]
+
+        # RMS hatası parçaların kısıtlama sayısıyla ağırlıklandırılır
+        stats = [solver for solver, _ in results]
+        counts = np.array([c1 - c0 for _, _, c0, c1, _ in self.shards], dtype=float)
+        rms = np.array([shard["rms_error"] for shard in stats])
+        world.solver_stats = {
+            "iterations": max(shard["iterations"] for shard in stats),
+            "max_error": max(shard["max_error"] for shard in stats),
+            "rms_error": float(
+                np.sqrt(np.sum(rms**2 * counts) / max(counts.sum(), 1.0))
+            ),
+            "converged": _all_converged(shard["converged"] for shard in stats),
+        }
+
+        if world.self_collision:
+            collisions = [collision for _, collision in results]
+            collisions.append(self._collide_boundary(bounds))
+            world.collision_stats = {
+                "broadphase_pairs": sum(c["broadphase_pairs"] for c in collisions),
+                "contacts": sum(c["contacts"] for c in collisions),
+                "truncated": any(c["truncated"] for c in collisions),
+            }
+
+        world._moved()
+
+    def _collide_boundary(self, bounds):
+        """
+        Farklı parçalardaki ipler arasındaki temasları ana süreçte çözer.
+
+        Yalnızca (yarıçapla genişletilmiş) sınır kutusu başka bir parçanın
+        kutusuna giren ipler çarpıştırılır; temas olursa bu iplerin sınır
+        kontrolü tekrarlanır (World.step'te sınır kontrolü çarpışmadan
+        sonradır).
+
+        Returns:
+            collide_ropes istatistikleri
+        """
+        world = self.world
+        if len(self.shards) < 2:
+            return collide_ropes([])
+
+        with PROFILER.section("collide"):
+            particles = world.particles
+            starts = world.offsets[:-1]
+            reach = float(particles.radius)
+            boxes = [
+                np.minimum.reduceat(particles.x, starts) - reach,
+                np.maximum.reduceat(particles.x, starts) + reach,
+                np.minimum.reduceat(particles.y, starts) - reach,
+                np.maximum.reduceat(particles.y, starts) + reach,
+            ]
+
+            # İp ve parça kutularının kesişimi (ipin kendi parçası hariç)
+            sizes = [len(offsets) - 1 for *_, offsets in self.shards]
+            shard_of = np.repeat(np.arange(len(sizes)), sizes)
+            first = np.cumsum([0] + sizes[:-1])
+            min_x, max_x, min_y, max_y = boxes
+            shard_min_x = np.minimum.reduceat(min_x, first)
+            shard_max_x = np.maximum.reduceat(max_x, first)
+            shard_min_y = np.minimum.reduceat(min_y, first)
+            shard_max_y = np.maximum.reduceat(max_y, first)
+            overlap = (
+                (min_x[:, None] <= shard_max_x)
+                & (max_x[:, None] >= shard_min_x)
+                & (min_y[:, None] <= shard_max_y)
+                & (max_y[:, None] >= shard_min_y)
+                & (shard_of[:, None] != np.arange(len(sizes)))
+            )
+            candidates = np.flatnonzero(overlap.any(axis=1))
+            ropes = [world.ropes[i] for i in candidates]
+            stats = collide_ropes(
+                ropes, self_collision=False, groups=shard_of[candidates]
+            )
+
+        if stats["contacts"]:
+            with PROFILER.section("clamp"):
+                for rope in ropes:
+                    rope.particles.constrain(*bounds)
+        return stats
+
+    def close(self):
+        """İşçileri durdurur ve dünyayı paylaşımlı bloktan kendi dizilerine taşır."""
+        for connection in self._connections:
+            try:
+                connection.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._processes = []
+
+        self._local = None
+        if self._shm is not None:
+            self.world.relocate(lambda group, field, current: np.empty_like(current))
+            self._retire()
+        self._layout = None
@@ -0,0 +1,338 @@
+import numpy as np
+
+# Hücre koordinatlarını tek bir tamsayı anahtarda birleştirmek için çarpan
+_KEY_STRIDE = 1 << 32
+
+# Min köşe hücresi sorgu hücresinin solunda/üstünde olabilecek segmentler
+_NEIGHBOR_OFFSETS = ((0, 0), (-1, 0), (0, -1), (-1, -1))
+
+# Üst üste yığılmış partiküllerde çift sayısının karesel büyümesine karşı sınır
+MAX_PAIRS = 200_000
+
+# Temas olmayan çağrının istatistikleri
+_NO_CONTACTS = {"broadphase_pairs": 0, "contacts": 0, "truncated": False}
+
+
+def collide_ropes(
+    ropes, self_collision=True, skip_links=1, max_pairs=MAX_PAIRS, groups=None
+):
+    """
+    İplerin partiküllerini segmentlere (kapsül) karşı çarpıştırır.
+
+    Broadphase: her segmentin yarıçapla genişletilmiş AABB'si, min köşesinin
+    düştüğü ızgara hücresine yerleştirilir. Hücre boyutu en büyük AABB'den
+    küçük olmadığı için bir partikülün aday segmentleri kendi hücresi ile
+    sol/üst komşularındadır (4 hücre). Narrowphase: partikül ile segmentin
+    en yakın noktası arasındaki mesafe iki yarıçapın toplamından küçükse
+    partikül ve segment uçları ters kütleleriyle orantılı olarak ayrılır.
+
+    Args:
+        ropes: ArrayRope listesi (aynı iple çağrılırsa yalnızca öz-çarpışma)
+        self_collision: Bir ipin kendi segmentleriyle çarpışması
+        skip_links: Aynı ipte segment uçlarına bu kadar bağlantı yakın
+            partiküller atlanır (komşular zaten mesafe kısıtlamasıyla bağlı)
+        max_pairs: Aday çift sayısı bunu aşarsa her partikülün adayları
+            eşit olarak kırpılır (ör. duvara yığılmış ip)
+        groups: Verilirse iplerin grup numaraları; yalnızca farklı gruptaki
+            ipler çarpıştırılır (grup içi temaslar başka yerde çözülmüştür)
+
+    Returns:
+        {"broadphase_pairs": AABB testini geçen çift sayısı,
+         "contacts": çözülen temas sayısı,
+         "truncated": aday çiftler kırpıldı mı}
+    """
+    if not ropes:
+        return dict(_NO_CONTACTS)
+
+    # Tüm ipleri ortak dizilerde birleştir
+    offsets = np.cumsum([0] + [len(rope.particles) for rope in ropes])
+    x = np.concatenate([rope.particles.x for rope in ropes])
+    y = np.concatenate([rope.particles.y for rope in ropes])
+    locked = np.concatenate([rope.particles.locked() for rope in ropes])
+    mass = np.concatenate([rope.particles.mass for rope in ropes])
+    radius = np.concatenate(
+        [np.full(len(rope.particles), rope.particles.radius) for rope in ropes]
+    ).astype(float)
+
+    # Yarıçapı segmentten büyük iplerde zincir komşuları zaten temas halindedir
+    skip = np.array([_skip_links(rope, skip_links) for rope in ropes], dtype=np.intp)
+
+    a = np.concatenate(
+        [rope.constraints.i1 + offset for rope, offset in zip(ropes, offsets)]
+    )
+    b = np.concatenate(
+        [rope.constraints.i2 + offset for rope, offset in zip(ropes, offsets)]
+    )
+    stats, touched = _collide(
+        x,
+        y,
+        locked,
+        mass,
+        radius,
+        a,
+        b,
+        offsets,
+        skip,
+        self_collision,
+        max_pairs,
+        groups,
+    )
+
+    # Sonuçları iplere geri yaz; temas eden uyuyan partiküller uyanır
+    if stats["contacts"]:
+        for rope, start, end in zip(ropes, offsets[:-1], offsets[1:]):
+            rope.particles.x[:] = x[start:end]
+            rope.particles.y[:] = y[start:end]
+            rope.wake(touched[start:end])
+
+    return stats
+
+
+def collide_flat(particles, constraints, offsets, skip_links=1, max_pairs=MAX_PAIRS):
+    """
+    Düz dizilerdeki ipleri kendileriyle ve birbirleriyle çarpıştırır.
+
+    collide_ropes ile aynıdır, ancak ip nesnesi gerektirmez ve pozisyonlar
+    yerinde güncellenir (ör. işçi süreçteki paylaşımlı bellek parçası).
+
+    Args:
+        particles: Ortak yarıçaplı ParticleArray
+        constraints: particles indeksli ConstraintArray (ip sırasıyla)
+        offsets: İplerin başlangıç indeksleri ve sonda toplam partikül sayısı
+        skip_links: collide_ropes ile aynı
+        max_pairs: collide_ropes ile aynı
+
+    Returns:
+        (collide_ropes istatistikleri, temasa giren partiküllerin maskesi)
+    """
+    count = len(particles.x)
+    if len(constraints) == 0:
+        return dict(_NO_CONTACTS), np.zeros(count, dtype=bool)
+
+    # İp başına en kısa segment (kısıtlamalar ip sırasıyla dizilidir)
+    owner = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    rope_of = owner[constraints.i1]
+    shortest = np.full(len(offsets) - 1, np.inf)
+    np.minimum.at(shortest, rope_of, constraints.rest_length)
+    shortest = np.maximum(np.where(np.isinf(shortest), 1.0, shortest), 1e-9)
+    skip = np.maximum(
+        skip_links, np.ceil(2 * particles.radius / shortest).astype(np.intp)
+    )
+
+    radius = np.full(count, float(particles.radius))
+    return _collide(
+        particles.x,
+        particles.y,
+        particles.locked(),
+        particles.mass,
+        radius,
+        constraints.i1,
+        constraints.i2,
+        offsets,
+        skip,
+        True,
+        max_pairs,
+    )
+
+
+def _collide(
+    x,
+    y,
+    locked,
+    mass,
+    radius,
+    a,
+    b,
+    offsets,
+    skip,
+    self_collision,
+    max_pairs,
+    groups=None,
+):
+    """
+    Ortak dizilerde broadphase, eleme ve temas çözümü (x, y yerinde güncellenir).
+
+    Returns:
+        (istatistikler, temasa giren partiküllerin maskesi)
+    """
+    stats = dict(_NO_CONTACTS)
+    touched = np.zeros(len(x), dtype=bool)
+    if len(a) == 0:
+        return stats, touched
+
+    inv_mass = np.where(locked, 0.0, 1.0 / mass)
+    owner = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+    particle_idx, segment_idx, truncated = _broadphase(x, y, a, b, radius, max_pairs)
+    stats["truncated"] = truncated
+
+    # Aynı ipin komşu partiküllerini ve (isteniyorsa) öz-çarpışmayı ele
+    particle_owner = owner[particle_idx]
+    segment_owner = owner[a[segment_idx]]
+    same_rope = particle_owner == segment_owner
+    links = skip[particle_owner]
+    seg_low = np.minimum(a, b)[segment_idx] - links
+    seg_high = np.maximum(a, b)[segment_idx] + links
+    adjacent = same_rope & (particle_idx >= seg_low) & (particle_idx <= seg_high)
+    keep = ~adjacent
+    if not self_collision:
+        keep &= ~same_rope
+    if groups is not None:
+        groups = np.asarray(groups)
+        keep &= groups[particle_owner] != groups[segment_owner]
+    particle_idx = particle_idx[keep]
+    segment_idx = segment_idx[keep]
+    stats["broadphase_pairs"] = len(particle_idx)
+
+    contacts, touched = _resolve_contacts(
+        x, y, inv_mass, radius, a, b, particle_idx, segment_idx
+    )
+    stats["contacts"] = contacts
+    return stats, touched
+
+
+def _skip_links(rope, skip_links):
+    """Bir ipte çarpışma dışı bırakılacak zincir komşusu sayısı."""
+    rest_length = rope.constraints.rest_length
+    if len(rest_length) == 0:
+        return skip_links
+    shortest = max(float(rest_length.min()), 1e-9)
+    return max(skip_links, int(np.ceil(2 * rope.particles.radius / shortest)))
+
+
+def _broadphase(x, y, a, b, radius, max_pairs):
+    """
+    Genişletilmiş segment AABB'si partikülü içeren (partikül, segment) çiftleri.
+
+    Returns:
+        (partikül indeksleri, segment indeksleri, kırpıldı mı)
+    """
+    reach = radius.max() + 0.5 * (radius[a] + radius[b])
+    min_x = np.minimum(x[a], x[b]) - reach
+    max_x = np.maximum(x[a], x[b]) + reach
+    min_y = np.minimum(y[a], y[b]) - reach
+    max_y = np.maximum(y[a], y[b]) + reach
+
+    # Hücre boyutu en büyük AABB kenarından küçük olmamalı
+    cell_size = max(float(np.max(max_x - min_x)), float(np.max(max_y - min_y)), 1.0)
+
+    seg_keys = _keys(min_x, min_y, cell_size)
+    order = np.argsort(seg_keys, kind="stable")
+    sorted_keys = seg_keys[order]
+
+    cell_x = np.floor_divide(x, cell_size).astype(np.int64)
+    cell_y = np.floor_divide(y, cell_size).astype(np.int64)
+
+    ranges = []
+    for dx, dy in _NEIGHBOR_OFFSETS:
+        query = (cell_x + dx) * _KEY_STRIDE + (cell_y + dy)
+        starts = np.searchsorted(sorted_keys, query, side="left")
+        counts = np.searchsorted(sorted_keys, query, side="right") - starts
+        ranges.append((starts, counts))
+
+    # Aday sayısı sınırı aşarsa her partikül hücresinin başından eşit pay alır
+    truncated = sum(int(counts.sum()) for _, counts in ranges) > max_pairs
+    if truncated:
+        cap = max(1, max_pairs // (len(x) * len(ranges)))
+        ranges = [(starts, np.minimum(counts, cap)) for starts, counts in ranges]
+
+    particle_parts = []
+    segment_parts = []
+    for starts, counts in ranges:
+        total = int(counts.sum())
+        if total == 0:
+            continue
+
+        # Her partikülün hücre aralığını tek dizide aç
+        particles = np.repeat(np.arange(len(x)), counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        slots = np.repeat(starts, counts) + (np.arange(total) - first)
+        particle_parts.append(particles)
+        segment_parts.append(order[slots])
+
+    if not particle_parts:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty, truncated
+
+    particle_idx = np.concatenate(particle_parts)
+    segment_idx = np.concatenate(segment_parts)
+
+    # AABB testi
+    px = x[particle_idx]
+    py = y[particle_idx]
+    inside = (
+        (px >= min_x[segment_idx])
+        & (px <= max_x[segment_idx])
+        & (py >= min_y[segment_idx])
+        & (py <= max_y[segment_idx])
+    )
+    return particle_idx[inside], segment_idx[inside], truncated
+
+
+def _keys(cx, cy, cell_size):
+    cell_x = np.floor_divide(cx, cell_size).astype(np.int64)
+    cell_y = np.floor_divide(cy, cell_size).astype(np.int64)
+    return cell_x * _KEY_STRIDE + cell_y
+
+
+def _resolve_contacts(x, y, inv_mass, radius, a, b, particle_idx, segment_idx):
+    """
+    Kapsül temaslarını tek Jacobi geçişinde çözer.
+
+    Returns:
+        (temas sayısı, temasa giren partiküllerin maskesi)
+    """
+    touched = np.zeros(len(x), dtype=bool)
+    if len(particle_idx) == 0:
+        return 0, touched
+
+    sa = a[segment_idx]
+    sb = b[segment_idx]
+    px, py = x[particle_idx], y[particle_idx]
+    ax, ay = x[sa], y[sa]
+    ex, ey = x[sb] - ax, y[sb] - ay
+
+    # Segment üzerindeki en yakın nokta
+    length_sq = ex * ex + ey * ey
+    t = ((px - ax) * ex + (py - ay) * ey) / np.where(length_sq == 0, 1.0, length_sq)
+    t = np.clip(t, 0.0, 1.0)
+    nx = px - (ax + t * ex)
+    ny = py - (ay + t * ey)
+    distance = np.hypot(nx, ny)
+
+    min_distance = radius[particle_idx] + 0.5 * (radius[sa] + radius[sb])
+    hit = (distance < min_distance) & (distance > 0)
+    if not hit.any():
+        return 0, touched
+
+    p, sa, sb, t = particle_idx[hit], sa[hit], sb[hit], t[hit]
+    distance = distance[hit]
+    nx = nx[hit] / distance
+    ny = ny[hit] / distance
+    penetration = min_distance[hit] - distance
+
+    # Partikül ve segment uçlarını ters kütleleriyle orantılı ayır
+    w_p = inv_mass[p]
+    w_a = inv_mass[sa] * (1.0 - t)
+    w_b = inv_mass[sb] * t
+    denom = w_p + w_a * (1.0 - t) + w_b * t
+    valid = denom > 0
+    scale = np.where(valid, penetration / np.where(valid, denom, 1.0), 0.0)
+
+    shift_x = np.zeros(len(x))
+    shift_y = np.zeros(len(y))
+    count = np.zeros(len(x))
+    for index, weight in ((p, w_p), (sa, -w_a), (sb, -w_b)):
+        np.add.at(shift_x, index, weight * scale * nx)
+        np.add.at(shift_y, index, weight * scale * ny)
+        np.add.at(count, index, weight != 0)
+
+    # Birden fazla temas alan partiküllerde düzeltmelerin ortalamasını al
+    moved = count > 0
+    x[moved] += shift_x[moved] / count[moved]
+    y[moved] += shift_y[moved] / count[moved]
+
+    # Yalnızca en az bir tarafı hareket edebilen temaslar (uyuyan çiftler hariç)
+    for index in (p, sa, sb):
+        touched[index[valid]] = True
+    return int(valid.sum()), touched
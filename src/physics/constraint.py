@@ -4,6 +4,8 @@ import pygame
 class Constraint:
     """İki partikül arasındaki mesafe kısıtlaması (ip segmenti)."""
 
+    __slots__ = ("p1", "p2", "stiffness", "rest_length")
+
     def __init__(self, p1, p2, stiffness=1.0):
         """
         Args:
@@ -20,6 +22,13 @@ class Constraint:
         dy = p1.y - p2.y
         self.rest_length = (dx * dx + dy * dy) ** 0.5
 
+    def error(self):
+        """Mevcut göreli hata (|mesafe - doğal uzunluk| / doğal uzunluk)."""
+        dx = self.p1.x - self.p2.x
+        dy = self.p1.y - self.p2.y
+        distance = (dx * dx + dy * dy) ** 0.5
+        return abs(distance - self.rest_length) / (self.rest_length or 1.0)
+
     def resolve(self):
         """İki partikül arasındaki mesafeyi sabit uzunluğa ayarla."""
         # Partiküller arasında vektor
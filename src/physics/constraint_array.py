@@ -0,0 +1,476 @@
+import numpy as np
+
+from physics.tridiagonal import solve_tridiagonal
+
+# Doğrudan çözücüde köşegene eklenen küçük sönüm (tekil sistemler için)
+DIRECT_REGULARIZATION = 1e-9
+
+# Doğrudan çözücünün başlangıç sönümü ve kabul/ret sonrası çarpanları
+DIRECT_DAMPING = 1e-6
+DIRECT_DAMPING_DECREASE = 0.3
+DIRECT_DAMPING_INCREASE = 10.0
+
+# Doğrudan çözücüde bir geçişte denenecek en fazla adım (sönüm artırılarak)
+DIRECT_LINE_SEARCH = 8
+
+
+class ConstraintArray:
+    """Mesafe kısıtlamalarını indeks dizileri olarak tutar (ParticleArray için)."""
+
+    # Kısıtlama başına tutulan diziler
+    FIELDS = ("i1", "i2", "stiffness", "rest_length", "parity")
+
+    def __init__(self, particles, i1, i2, stiffness=1.0, parity=None):
+        """
+        Uzunluk ve esneklik dizileri partikül pozisyonlarıyla aynı tiptedir.
+
+        Args:
+            particles: Kısıtlamaların bağlı olduğu ParticleArray
+            i1: İlk partikül indeksleri
+            i2: İkinci partikül indeksleri
+            stiffness: İpin esnekliği (1.0 = katı, <1.0 = esnek)
+            parity: Red-black çözüm için renk sınıfları (None ise zincir sırası)
+        """
+        self.particles = particles
+        self.i1 = np.array(i1, dtype=np.intp)
+        self.i2 = np.array(i2, dtype=np.intp)
+        self.stiffness = np.full(len(self.i1), stiffness, dtype=particles.x.dtype)
+
+        # Zincirde çift ve tek indeksli kısıtlamalar ortak partikül paylaşmaz
+        if parity is None:
+            parity = np.arange(len(self.i1)) % 2
+        self.parity = np.array(parity, dtype=np.int8)
+
+        # İlk mesafeyi hesapla (ipin doğal uzunluğu)
+        dx = particles.x[self.i1] - particles.x[self.i2]
+        dy = particles.y[self.i1] - particles.y[self.i2]
+        self.rest_length = np.hypot(dx, dy)
+
+    def __len__(self):
+        return len(self.i1)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("constraint index out of range")
+        return ConstraintView(self, index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield ConstraintView(self, i)
+
+    def append(self, i1, i2, rest_length, stiffness=1.0):
+        """
+        Sona yeni kısıtlamalar ekler; zincir paritesi sürdürülür.
+
+        Args:
+            i1: İlk partikül indeksleri
+            i2: İkinci partikül indeksleri
+            rest_length: Doğal uzunluk(lar)
+            stiffness: İpin esnekliği
+        """
+        i1 = np.asarray(i1, dtype=np.intp)
+        count = len(i1)
+        start = len(self.i1)
+        self.i1 = np.concatenate((self.i1, i1))
+        self.i2 = np.concatenate((self.i2, np.asarray(i2, dtype=np.intp)))
+        dtype = self.rest_length.dtype
+        self.stiffness = np.concatenate(
+            (self.stiffness, np.full(count, stiffness, dtype=dtype))
+        )
+        self.rest_length = np.concatenate(
+            (self.rest_length, np.broadcast_to(rest_length, (count,)).astype(dtype))
+        )
+        parity = np.arange(start, start + count) % 2
+        self.parity = np.concatenate((self.parity, parity.astype(np.int8)))
+
+    @property
+    def nbytes(self):
+        """Kısıtlama dizilerinin toplam boyutu (bayt)."""
+        return sum(getattr(self, name).nbytes for name in self.FIELDS)
+
+    def truncate(self, count):
+        """İlk count kısıtlamayı tutar, gerisini atar."""
+        for name in self.FIELDS:
+            setattr(self, name, getattr(self, name)[:count].copy())
+
+    def resolve(self, iterations=1, active=None, tolerance=None, min_iterations=1):
+        """
+        Kısıtlamaları sırayla çözer (Gauss-Seidel, Constraint.resolve ile aynı).
+
+        Sıralı bağımlılık nedeniyle vektörize edilemez; döngü NumPy skalerleri
+        yerine Python listeleri üzerinde döner ve sonuç tek seferde yazılır.
+
+        Args:
+            iterations: Tüm kısıtlamaların en fazla kaç kez çözüleceği
+            active: Yalnızca True olan kısıtlamaları çöz (None ise hepsi)
+            tolerance: Verilirse her taramadan sonra residual() ölçülür ve en
+                büyük göreli hata bunun altına inince durulur
+            min_iterations: Tolerans sağlansa da yapılacak en az tarama sayısı
+
+        Returns:
+            Yapılan tarama sayısı
+        """
+        particles = self.particles
+        x = particles.x.tolist()
+        y = particles.y.tolist()
+        locked = particles.locked().tolist()
+        indices = slice(None) if active is None else np.flatnonzero(active)
+        constraints = list(
+            zip(
+                self.i1[indices].tolist(),
+                self.i2[indices].tolist(),
+                self.rest_length[indices].tolist(),
+                self.stiffness[indices].tolist(),
+            )
+        )
+
+        done = 0
+        for done in range(1, iterations + 1):
+            for a, b, rest_length, stiffness in constraints:
+                dx = x[a] - x[b]
+                dy = y[a] - y[b]
+                distance = (dx * dx + dy * dy) ** 0.5
+
+                if distance == 0:
+                    continue  # Mesafe 0 ise çözüm yok
+
+                difference = (rest_length - distance) / distance
+                adjust_x = dx * difference * 0.5 * stiffness
+                adjust_y = dy * difference * 0.5 * stiffness
+
+                if not locked[a]:
+                    x[a] += adjust_x
+                    y[a] += adjust_y
+
+                if not locked[b]:
+                    x[b] -= adjust_x
+                    y[b] -= adjust_y
+
+            if tolerance is not None and done >= min_iterations:
+                particles.x[:] = x
+                particles.y[:] = y
+                if self.residual(active)[0] <= tolerance:
+                    break
+
+        particles.x[:] = x
+        particles.y[:] = y
+        return done
+
+    def resolve_red_black(
+        self, iterations=1, active=None, tolerance=None, min_iterations=1
+    ):
+        """
+        Kısıtlamaları parite sınıfları halinde toplu çözer (red-black).
+
+        Aynı sınıftaki kısıtlamalar ortak partikül paylaşmadığı için her sınıf
+        tek bir dizi işlemiyle çözülür; her iterasyon iki yarım taramadır.
+
+        Args:
+            iterations: En fazla tam tarama (çift + tek) sayısı
+            active: Yalnızca True olan kısıtlamaları çöz (None ise hepsi)
+            tolerance: Verilirse her taramadan sonra residual() ölçülür ve en
+                büyük göreli hata bunun altına inince durulur
+            min_iterations: Tolerans sağlansa da yapılacak en az tarama sayısı
+
+        Returns:
+            Yapılan tarama sayısı
+        """
+        particles = self.particles
+        free = ~particles.locked()
+        classes = []
+        for color in (0, 1):
+            members = self.parity == color
+            if active is not None:
+                members &= active
+            classes.append(self._batch(np.flatnonzero(members), free))
+
+        done = 0
+        for done in range(1, iterations + 1):
+            for batch in classes:
+                self._resolve_batch(*batch)
+
+            if tolerance is not None and done >= min_iterations:
+                if self.residual(active)[0] <= tolerance:
+                    break
+
+        return done
+
+    def residual(self, active=None):
+        """
+        Kısıtlamaların doğal uzunluğa göre göreli hatası.
+
+        Args:
+            active: Yalnızca True olan kısıtlamaları ölç (None ise hepsi)
+
+        Returns:
+            (en büyük göreli hata, RMS göreli hata)
+        """
+        i1, i2, rest_length = self.i1, self.i2, self.rest_length
+        if active is not None:
+            i1, i2, rest_length = i1[active], i2[active], rest_length[active]
+        if len(i1) == 0:
+            return 0.0, 0.0
+
+        x, y = self.particles.x, self.particles.y
+        distance = np.hypot(x[i1] - x[i2], y[i1] - y[i2])
+        error = np.abs(distance - rest_length)
+        error /= np.where(rest_length == 0, 1.0, rest_length)
+        return float(error.max()), float(np.sqrt(np.dot(error, error) / len(error)))
+
+    def _batch(self, indices, free):
+        """Bir parite sınıfı için sabit kalan dizileri önceden hazırlar."""
+        a = self.i1[indices]
+        b = self.i2[indices]
+        scale = 0.5 * self.stiffness[indices]
+        return a, b, self.rest_length[indices], scale, free[a], free[b]
+
+    def _resolve_batch(self, a, b, rest_length, scale, free_a, free_b):
+        """Ortak partikül paylaşmayan kısıtlamaları tek geçişte çözer."""
+        x = self.particles.x
+        y = self.particles.y
+
+        dx = x[a] - x[b]
+        dy = y[a] - y[b]
+        distance = np.hypot(dx, dy)
+
+        # Mesafe 0 ise çözüm yok
+        safe = np.where(distance == 0, 1.0, distance)
+        difference = np.where(distance == 0, 0.0, (rest_length - safe) / safe)
+
+        adjust_x = dx * difference * scale
+        adjust_y = dy * difference * scale
+
+        x[a] += adjust_x * free_a
+        y[a] += adjust_y * free_a
+        x[b] -= adjust_x * free_b
+        y[b] -= adjust_y * free_b
+
+    def resolve_direct(self, max_passes=8, tolerance=1e-4):
+        """
+        Zincir kısıtlamalarını doğrusallaştırıp doğrudan çözer.
+
+        Her geçişte (J W J^T + mu I) lambda = -C sistemi kurulur; zincirde
+        ardışık kısıtlamalar yalnızca ortak partikülleri üzerinden bağlandığı
+        için matris üç köşegenlidir ve O(n) sürede çözülür. Sönüm (mu)
+        Levenberg-Marquardt gibi uyarlanır: toplam kare hatayı azaltan adım
+        kabul edilip sönüm küçültülür, azaltmayan adım geri alınıp daha büyük
+        sönümle (daha kısa ve gradyana yakın bir adımla) yeniden denenir.
+        Hiçbir deneme hatayı azaltmazsa pozisyonlar geçiş başındaki haline
+        döner. Göreli hata tolerans altına inene kadar (en fazla max_passes
+        kez) tekrarlanır; durgun iplerde 1-2 geçiş yeterlidir.
+
+        Hızlı savrulan uzun zincirlerde gereken düzeltme çapa etrafında bir
+        dönmedir ve doğrusallaştırma bunu ancak çok sayıda geçişte yakalar.
+        Geçişler toleransa inmeden biterse segmentler _restore_lengths ile
+        doğal uzunluklarına getirilir ve çözüm yakınsamamış olarak raporlanır.
+
+        Args:
+            max_passes: En fazla doğrusallaştırma (Gauss-Newton) geçişi sayısı
+            tolerance: Segment uzunluğuna göre kabul edilen en büyük göreli hata
+
+        Returns:
+            (yapılan geçiş sayısı, geçişler toleransa indi mi)
+        """
+        if len(self) == 0:
+            return 0, True
+
+        particles = self.particles
+        a, b = self.i1, self.i2
+
+        # Ters kütle; sabit ve sürüklenen partiküller hareket etmez
+        inv_mass = np.where(particles.locked(), 0.0, 1.0 / particles.mass)
+        w_a = inv_mass[a]
+        w_b = inv_mass[b]
+
+        # Ardışık kısıtlamaların ortak partikülü (zincirde b[k] == a[k + 1])
+        shared = b[:-1] == a[1:]
+        w_shared = np.where(shared, w_b[:-1], 0.0)
+
+        rest_length = np.where(self.rest_length == 0, 1.0, self.rest_length)
+        movable = (w_a + w_b) > 0
+        if not movable.any():
+            return 0, True
+
+        # Sönüm köşegen ölçeğine göre verilir (kütleden bağımsız)
+        scale = float(np.max(w_a + w_b))
+        damping = 0.0
+        x, y = particles.x, particles.y
+
+        error, nx, ny = self._chain_error()
+        error = np.where(movable, error, 0.0)
+        merit = np.dot(error, error)
+        passes = 0
+        converged = False
+        for passes in range(max_passes + 1):
+            residual = np.abs(error) / rest_length
+            converged = not (residual > tolerance).any()
+            if converged or passes == max_passes:
+                break
+
+            coupling = -w_shared * (nx[:-1] * nx[1:] + ny[:-1] * ny[1:])
+            lower = np.concatenate(([0.0], coupling))
+            upper = np.concatenate((coupling, [0.0]))
+
+            start_x, start_y = x.copy(), y.copy()
+            for _ in range(DIRECT_LINE_SEARCH):
+                # Regularizasyon: iki ucu kilitli gergin zincirde matris tekildir
+                diag = w_a + w_b + (damping + DIRECT_REGULARIZATION) * scale
+                lam = solve_tridiagonal(lower, diag, upper, -error) * self.stiffness
+
+                # Düzeltmeleri partikül bazında topla
+                step_x, step_y = self._spread(lam, w_a, w_b, nx, ny)
+
+                np.copyto(x, start_x + step_x)
+                np.copyto(y, start_y + step_y)
+                trial, trial_nx, trial_ny = self._chain_error()
+                trial = np.where(movable, trial, 0.0)
+                trial_merit = np.dot(trial, trial)
+                if trial_merit < merit:
+                    error, nx, ny, merit = trial, trial_nx, trial_ny, trial_merit
+                    damping *= DIRECT_DAMPING_DECREASE
+                    break
+                damping = max(damping, DIRECT_DAMPING) * DIRECT_DAMPING_INCREASE
+            else:
+                # Hiçbir adım hatayı azaltmadı: geçiş başındaki pozisyonlar korunur
+                np.copyto(x, start_x)
+                np.copyto(y, start_y)
+                break
+
+        if not converged:
+            self._restore_lengths()
+        return passes, converged
+
+    def _restore_lengths(self):
+        """
+        Zincir segmentlerini mevcut yönlerinde doğal uzunluklarına getirir.
+
+        Her zincir, segment yönleri korunup uzunlukları düzeltilerek kümülatif
+        toplamla yeniden kurulur (follow-the-leader benzeri, vektörize). Kilitli
+        partiküller yerinde kalır: iki kilitli partikül arasındaki kapanma
+        farkı aradaki segmentlere eşit dağıtılır, kilitli partikülden sonraki
+        ve önceki kısımlar ona göre ötelenir. Kilitli partikülü olmayan
+        zincirler kütle merkezini korur.
+        """
+        particles = self.particles
+        x, y = particles.x, particles.y
+        a, b = self.i1, self.i2
+
+        # Zincir başları: önceki kısıtlamayla ortak partikülü olmayanlar
+        start = np.ones(len(self), dtype=bool)
+        start[1:] = b[:-1] != a[1:]
+        first = np.flatnonzero(start)
+        chain = np.cumsum(start) - 1
+
+        # Düzeltilmiş segment vektörleri ve zincir başına göre kümülatif toplam
+        dx = x[b] - x[a]
+        dy = y[b] - y[a]
+        distance = np.hypot(dx, dy)
+        coincident = distance == 0
+        safe = np.where(coincident, 1.0, distance)
+        seg_x = np.where(coincident, 1.0, dx / safe) * self.rest_length
+        seg_y = dy / safe * self.rest_length
+        sum_x = np.cumsum(seg_x)
+        sum_y = np.cumsum(seg_y)
+        sum_x -= (sum_x - seg_x)[first][chain]
+        sum_y -= (sum_y - seg_y)[first][chain]
+
+        # Düğümler zincir sırasındadır: her zincirin ilk partikülü ve b uçları
+        node = np.insert(b, first, a[first])
+        chain = np.insert(chain, first, chain[first])
+        sum_x = np.insert(sum_x, first, 0.0)
+        sum_y = np.insert(sum_y, first, 0.0)
+        count = len(node)
+        index = np.arange(count)
+        chain_first = first + np.arange(len(first))
+        chain_last = np.append(chain_first[1:] - 1, count - 1)
+
+        # Her düğüm için zincirdeki önceki ve sonraki kilitli düğüm
+        anchor = particles.locked()[node]
+        prev = np.maximum.accumulate(np.where(anchor, index, -1))
+        next_ = np.minimum.accumulate(np.where(anchor, index, count)[::-1])[::-1]
+        has_prev = prev >= chain_first[chain]
+        has_next = next_ <= chain_last[chain]
+        prev = np.where(has_prev, prev, 0)
+        next_ = np.where(has_next, next_, 0)
+
+        # Öteleme kilitli düğümlerde tam, aralarında doğrusal
+        offset_x = x[node] - sum_x
+        offset_y = y[node] - sum_y
+        span = np.maximum(next_ - prev, 1)
+        t = np.where(has_prev, (index - prev) / span, 1.0)
+        t = np.where(has_next, t, 0.0)
+        shift_x = offset_x[prev] * (1 - t) + offset_x[next_] * t
+        shift_y = offset_y[prev] * (1 - t) + offset_y[next_] * t
+
+        free = ~(has_prev | has_next)
+        if free.any():
+            mass = particles.mass[node]
+            total = np.bincount(chain, mass)
+            center_x = np.bincount(chain, mass * offset_x) / total
+            center_y = np.bincount(chain, mass * offset_y) / total
+            shift_x = np.where(free, center_x[chain], shift_x)
+            shift_y = np.where(free, center_y[chain], shift_y)
+
+        move = ~anchor
+        x[node[move]] = (sum_x + shift_x)[move]
+        y[node[move]] = (sum_y + shift_y)[move]
+
+    def _spread(self, lam, w_a, w_b, nx, ny):
+        """Kısıtlama çarpanlarını partikül yer değiştirmelerine çevirir (W J^T lambda)."""
+        n = len(self.particles.x)
+        a, b = self.i1, self.i2
+        step_x = np.bincount(a, w_a * lam * nx, n) - np.bincount(b, w_b * lam * nx, n)
+        step_y = np.bincount(a, w_a * lam * ny, n) - np.bincount(b, w_b * lam * ny, n)
+        return step_x, step_y
+
+    def _chain_error(self):
+        """
+        Kısıtlama hatası C = |p_a - p_b| - L ve birim yönler.
+
+        Üst üste düşen partiküllerde yön tanımsızdır; yatay yön kullanılır ki
+        çözücü onları ayırabilsin.
+        """
+        particles = self.particles
+        dx = particles.x[self.i1] - particles.x[self.i2]
+        dy = particles.y[self.i1] - particles.y[self.i2]
+        distance = np.hypot(dx, dy)
+        coincident = distance == 0
+        safe = np.where(coincident, 1.0, distance)
+        nx = np.where(coincident, 1.0, dx / safe)
+        return distance - self.rest_length, nx, dy / safe
+
+
+class ConstraintView:
+    """ConstraintArray içindeki tek kısıtlamaya Constraint benzeri erişim sağlar."""
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array, index):
+        self._array = array
+        self._index = index
+
+    @property
+    def p1(self):
+        return self._array.particles[int(self._array.i1[self._index])]
+
+    @property
+    def p2(self):
+        return self._array.particles[int(self._array.i2[self._index])]
+
+    @property
+    def rest_length(self):
+        return float(self._array.rest_length[self._index])
+
+    @rest_length.setter
+    def rest_length(self, value):
+        self._array.rest_length[self._index] = value
+
+    @property
+    def stiffness(self):
+        return float(self._array.stiffness[self._index])
+
+    @stiffness.setter
+    def stiffness(self, value):
+        self._array.stiffness[self._index] = value
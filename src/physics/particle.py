@@ -2,7 +2,23 @@ import pygame
 
 
 class Particle:
-    """Bir kütle/nokta temsil eder - Verlet entegrasyonu kullanır."""
+    """Bir kütle/nokta temsil eder - Verlet entegrasyonu kullanır.
+
+    __slots__ sayesinde partikül başına __dict__ tutulmaz; radius ve color
+    ipin ortak objelerini gösterir.
+    """
+
+    __slots__ = (
+        "x",
+        "y",
+        "old_x",
+        "old_y",
+        "radius",
+        "color",
+        "mass",
+        "is_fixed",
+        "is_being_dragged",
+    )
 
     def __init__(self, x, y, radius=5, color=(255, 255, 255)):
         self.x = x
@@ -0,0 +1,186 @@
+import numpy as np
+
+
+class ParticleArray:
+    """Partikül durumunu bitişik NumPy dizilerinde tutar (structure-of-arrays).
+
+    Particle sınıfının vektörize karşılığıdır; entegrasyon ve sınır kontrolü
+    tüm partiküller için tek geçişte yapılır. İndeksleme (particles[i])
+    Particle arayüzüne sahip bir ParticleView döndürür.
+    """
+
+    # Partikül başına tutulan diziler
+    FIELDS = (
+        "x",
+        "y",
+        "old_x",
+        "old_y",
+        "mass",
+        "is_fixed",
+        "is_being_dragged",
+        "is_sleeping",
+        "still_steps",
+    )
+
+    def __init__(self, x, y, radius=5, color=(255, 255, 255), dtype=float):
+        """
+        Args:
+            x: Partiküllerin X koordinatları
+            y: Partiküllerin Y koordinatları
+            radius: Tüm partiküller için ortak yarıçap
+            color: Tüm partiküller için ortak renk
+            dtype: Pozisyon ve kütle dizilerinin tipi (np.float32 yarı bellek)
+        """
+        self.x = np.array(x, dtype=dtype)
+        self.y = np.array(y, dtype=dtype)
+        self.old_x = self.x.copy()  # Önceki pozisyon (Verlet için gerekli)
+        self.old_y = self.y.copy()
+        self.mass = np.ones(len(self.x), dtype=dtype)
+        self.is_fixed = np.zeros(len(self.x), dtype=bool)
+        self.is_being_dragged = np.zeros(len(self.x), dtype=bool)
+
+        # Uyku durumu: hareketsiz kalınan adım sayısı ve uyuyor mu
+        self.still_steps = np.zeros(len(self.x), dtype=np.int32)
+        self.is_sleeping = np.zeros(len(self.x), dtype=bool)
+
+        self.radius = radius
+        self.color = color
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("particle index out of range")
+        return ParticleView(self, index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield ParticleView(self, i)
+
+    def append(self, x, y):
+        """
+        Sona hareketsiz yeni partiküller ekler; mevcut durum korunur.
+
+        Args:
+            x: Yeni partiküllerin X koordinatları
+            y: Yeni partiküllerin Y koordinatları
+        """
+        x = np.asarray(x, dtype=self.x.dtype)
+        y = np.asarray(y, dtype=self.y.dtype)
+        initial = {"x": x, "y": y, "old_x": x, "old_y": y, "mass": 1.0}
+        for name in self.FIELDS:
+            current = getattr(self, name)
+            added = np.full(len(x), initial.get(name, 0), dtype=current.dtype)
+            setattr(self, name, np.concatenate((current, added)))
+
+    def truncate(self, count):
+        """İlk count partikülü tutar, gerisini atar."""
+        for name in self.FIELDS:
+            setattr(self, name, getattr(self, name)[:count].copy())
+
+    @property
+    def nbytes(self):
+        """Partikül dizilerinin toplam boyutu (bayt)."""
+        return sum(getattr(self, name).nbytes for name in self.FIELDS)
+
+    def locked(self):
+        """Entegrasyon ve constraint çözümünde hareket ettirilmeyecek partiküller."""
+        return self.is_fixed | self.is_being_dragged | self.is_sleeping
+
+    def update(self, dt=1.0, gravity=0.5, damping=0.99):
+        """Verlet entegrasyonu ile tüm pozisyonları tek geçişte günceller."""
+        free = ~self.locked()
+
+        # Hız hesapla (position - old_position), kilitli partiküller için sıfır
+        vx = (self.x - self.old_x) * damping
+        vy = (self.y - self.old_y) * damping + gravity * dt * dt
+        vx *= free
+        vy *= free
+
+        # Önceki pozisyonu güncelle
+        np.copyto(self.old_x, self.x, where=free)
+        np.copyto(self.old_y, self.y, where=free)
+
+        # Yeni pozisyonu hesapla (yerçekimi vy içinde)
+        self.x += vx
+        self.y += vy
+
+    def constrain(self, width, height):
+        """Ekran sınırlarına çarpma kontrolü (Particle.constrain ile aynı)."""
+        movable = ~self.is_fixed
+        _clamp_axis(self.x, self.old_x, self.radius, width - self.radius, movable)
+        _clamp_axis(self.y, self.old_y, self.radius, height - self.radius, movable)
+
+
+def _clamp_axis(pos, old, low, high, movable):
+    """Tek eksende sınır dışına çıkan partikülleri geri iter ve hızını yarıya indirir."""
+    over = movable & (pos > high)
+    under = movable & (pos < low) & ~over
+    if not (over.any() or under.any()):
+        return
+
+    pos[over] = high
+    pos[under] = low
+
+    # Çarpma dampingu
+    hit = over | under
+    old[hit] = pos[hit] + (pos[hit] - old[hit]) * 0.5
+
+
+def _field(name, cast):
+    """ParticleArray dizisindeki bir alanı tek partikül özelliği olarak sunar."""
+
+    def getter(self):
+        return cast(getattr(self._array, name)[self._index])
+
+    def setter(self, value):
+        getattr(self._array, name)[self._index] = value
+
+    return property(getter, setter)
+
+
+class ParticleView:
+    """ParticleArray içindeki tek partiküle Particle benzeri erişim sağlar."""
+
+    __slots__ = ("_array", "_index")
+
+    x = _field("x", float)
+    y = _field("y", float)
+    old_x = _field("old_x", float)
+    old_y = _field("old_y", float)
+    mass = _field("mass", float)
+    is_fixed = _field("is_fixed", bool)
+    is_being_dragged = _field("is_being_dragged", bool)
+    is_sleeping = _field("is_sleeping", bool)
+
+    def __init__(self, array, index):
+        self._array = array
+        self._index = index
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def radius(self):
+        return self._array.radius
+
+    @property
+    def color(self):
+        return self._array.color
+
+    def apply_force(self, fx, fy):
+        """Kütle üzerinde kuvvet uygula."""
+        if self.is_fixed or self.is_being_dragged:
+            return
+
+        self.x += fx / self.mass
+        self.y += fy / self.mass
+
+    def set_position(self, x, y):
+        """Kütleyi doğrudan konumlandırmak için (sürükleme için)."""
+        self.x = x
+        self.y = y
@@ -0,0 +1,107 @@
+import math
+
+import numpy as np
+
+# Hücre koordinatlarını tek bir tamsayı anahtarda birleştirmek için çarpan
+_KEY_STRIDE = 1 << 32
+
+
+class SpatialHash:
+    """Partikül pozisyonları üzerinde düzgün ızgara (uniform grid) indeksi.
+
+    Pozisyonlar hücre anahtarına göre sıralanır; bir noktanın çevresindeki
+    hücreler ikili arama ile bulunur. Sorgu maliyeti partikül sayısından
+    değil, yarıçapın kapsadığı hücre sayısından etkilenir.
+    """
+
+    def __init__(self, cell_size=50):
+        """
+        Args:
+            cell_size: Izgara hücresinin dünya birimindeki kenar uzunluğu
+        """
+        self.cell_size = cell_size
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self._order = np.zeros(0, dtype=np.intp)
+        self._keys = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.x)
+
+    def _cell(self, value):
+        return np.floor_divide(value, self.cell_size).astype(np.int64)
+
+    def build(self, x, y):
+        """
+        İndeksi verilen pozisyonlarla yeniden kurar.
+
+        Args:
+            x: X koordinatları
+            y: Y koordinatları
+        """
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        keys = self._cell(self.x) * _KEY_STRIDE + self._cell(self.y)
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def candidates(self, px, py, radius):
+        """
+        Noktanın yarıçap kadar çevresindeki hücrelerde bulunan indeksler.
+
+        Mesafe kontrolü yapmaz; sonuç sıralı değildir.
+        """
+        reach = max(0, math.ceil(radius / self.cell_size))
+        cx = math.floor(px / self.cell_size)
+        cy = math.floor(py / self.cell_size)
+
+        offsets = np.arange(-reach, reach + 1, dtype=np.int64)
+        # Her sütun için ardışık y hücreleri sıralı dizide tek bir aralıktır
+        low = (cx + offsets) * _KEY_STRIDE + (cy - reach)
+        high = (cx + offsets) * _KEY_STRIDE + (cy + reach)
+        starts = np.searchsorted(self._keys, low, side="left")
+        ends = np.searchsorted(self._keys, high, side="right")
+
+        ranges = [self._order[s:e] for s, e in zip(starts, ends) if e > s]
+        if not ranges:
+            return np.zeros(0, dtype=np.intp)
+        return np.concatenate(ranges)
+
+    def query_radius(self, px, py, radius, exclude=None):
+        """
+        Noktaya radius'tan yakın olan indeksleri artan sırada döndürür.
+
+        Args:
+            px, py: Sorgu noktası
+            radius: Arama yarıçapı
+            exclude: True olan indeksleri atla (None ise hepsi dikkate alınır)
+        """
+        found = self.candidates(px, py, radius)
+        if exclude is not None:
+            found = found[~exclude[found]]
+        dist = np.hypot(self.x[found] - px, self.y[found] - py)
+        return np.sort(found[dist < radius])
+
+    def nearest(self, px, py, max_distance, exclude=None):
+        """
+        Noktaya max_distance'tan yakın en yakın indeksi döndürür.
+
+        Args:
+            px, py: Sorgu noktası
+            max_distance: En fazla mesafe
+            exclude: True olan indeksleri atla (None ise hepsi dikkate alınır)
+
+        Returns:
+            İndeks veya None
+        """
+        found = np.sort(self.candidates(px, py, max_distance))
+        if exclude is not None:
+            found = found[~exclude[found]]
+        if len(found) == 0:
+            return None
+
+        dist = np.hypot(self.x[found] - px, self.y[found] - py)
+        best = int(np.argmin(dist))
+        if dist[best] >= max_distance:
+            return None
+        return int(found[best])
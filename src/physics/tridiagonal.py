@@ -0,0 +1,98 @@
+import numpy as np
+
+# Bu boyuttan küçük sistemler Thomas döngüsüyle çözülür (NumPy çağrı yükü baskın)
+THOMAS_SIZE = 64
+
+
+def solve_tridiagonal(lower, diag, upper, rhs):
+    """
+    Üç köşegenli doğrusal sistemi O(n) işle çözer.
+
+    Büyük sistemlerde tek-çift indirgeme (cyclic reduction) kullanılır: her
+    seviyede tek indeksli bilinmeyenler komşularıyla birlikte vektörize
+    olarak elenir, sistem yarıya iner ve log2(n) seviyede çözülür. Küçük
+    sistemler ve son seviye Thomas algoritmasıyla çözülür. Köşegen baskın
+    (örn. J W J^T) sistemlerde pivot gerekmez.
+
+    Args:
+        lower: Alt köşegen (lower[i], i. satırın i-1. sütunu; lower[0] kullanılmaz)
+        diag: Ana köşegen
+        upper: Üst köşegen (upper[i], i. satırın i+1. sütunu; son eleman kullanılmaz)
+        rhs: Sağ taraf vektörü
+
+    Returns:
+        Çözüm vektörü (NumPy dizisi)
+    """
+    n = len(diag)
+    if n == 0:
+        return np.zeros(0)
+    if n <= THOMAS_SIZE:
+        return _thomas(lower, diag, upper, rhs)
+
+    # Thomas boyutuna inene kadar her seviyede tek uzunluk kalması için sistem
+    # q * 2^k - 1 satıra birim satırlarla uzatılır (ayrık oldukları için
+    # çözümü değiştirmezler; en fazla n / THOMAS_SIZE satır eklenir)
+    levels = 0
+    while -(-(n + 1) // 2**levels) - 1 > THOMAS_SIZE:
+        levels += 1
+    size = -(-(n + 1) // 2**levels) * 2**levels - 1
+    a = np.zeros(size)
+    b = np.ones(size)
+    c = np.zeros(size)
+    d = np.zeros(size)
+    a[1:n] = lower[1:]
+    b[:n] = diag
+    c[: n - 1] = upper[:-1]
+    d[:n] = rhs
+    return _cyclic_reduction(a, b, c, d)[:n]
+
+
+def _cyclic_reduction(a, b, c, d):
+    """Tek uzunluklu, uç katsayıları sıfır olan sistemi özyinelemeli çözer."""
+    if len(b) <= THOMAS_SIZE:
+        return _thomas(a, b, c, d)
+
+    # Tek satırlardan komşu çift bilinmeyenler elenir
+    left = -a[1::2] / b[0:-1:2]
+    right = -c[1::2] / b[2::2]
+    x_odd = _cyclic_reduction(
+        left * a[0:-1:2],
+        b[1::2] + left * c[0:-1:2] + right * a[2::2],
+        right * c[2::2],
+        d[1::2] + left * d[0:-1:2] + right * d[2::2],
+    )
+
+    # Çift bilinmeyenler iki komşu tek bilinmeyenden geri yerine konur
+    x = np.empty(len(b))
+    x[1::2] = x_odd
+    x_even = d[0::2].copy()
+    x_even[1:] -= a[2::2] * x_odd
+    x_even[:-1] -= c[0:-1:2] * x_odd
+    x[0::2] = x_even / b[0::2]
+    return x
+
+
+def _thomas(a, b, c, d):
+    """Thomas algoritması (küçük sistemler için saf Python döngüsü)."""
+    n = len(b)
+    a = np.asarray(a, dtype=float).tolist()
+    b = np.asarray(b, dtype=float).tolist()
+    c = np.asarray(c, dtype=float).tolist()
+    d = np.asarray(d, dtype=float).tolist()
+
+    # İleri eleme
+    c_prime = [0.0] * n
+    d_prime = [0.0] * n
+    c_prime[0] = c[0] / b[0]
+    d_prime[0] = d[0] / b[0]
+    for i in range(1, n):
+        denom = b[i] - a[i] * c_prime[i - 1]
+        c_prime[i] = c[i] / denom
+        d_prime[i] = (d[i] - a[i] * d_prime[i - 1]) / denom
+
+    # Geri yerine koyma
+    x = d_prime
+    for i in range(n - 2, -1, -1):
+        x[i] -= c_prime[i] * x[i + 1]
+
+    return np.array(x)
@@ -0,0 +1,215 @@
+"""Aşama bazlı zamanlayıcılar ve Chrome trace dışa aktarımı.
+
+Kod aşamaları `with PROFILER.section("ad"):` ile işaretlenir. Profiler
+kapalıyken section() her seferinde aynı boş bağlam yöneticisini döndürür;
+zaman ölçülmez ve kayıt tutulmaz. Açıkken her bölüm başlangıç/bitiş
+zamanıyla kaydedilir, frame_end() ile kare süresi ve kare başına bölüm
+toplamları geçmişe eklenir.
+
+Dışa aktarılan dosya Chrome'un trace biçimindedir (chrome://tracing veya
+Perfetto ile açılır); her iş parçacığının bölümleri ayrı bir satırda
+görünür.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import numpy as np
+
+# Dağılım ve ortalamalar için saklanan kare sayısı
+FRAME_HISTORY = 600
+
+# Trace için saklanan en fazla bölüm kaydı (eskiler atılır)
+TRACE_EVENTS = 200_000
+
+# Kapalı profiler'ın döndürdüğü paylaşılan boş bölüm
+_NULL_SECTION = nullcontext()
+
+
+class _Section:
+    """Tek bir zamanlanmış bölüm (with bloğu)."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._profiler._record(self._name, self._start, time.perf_counter())
+
+
+class Profiler:
+    """Açılıp kapatılabilen, kare bazlı aşama zamanlayıcısı."""
+
+    def __init__(self, enabled=False, history=FRAME_HISTORY, max_events=TRACE_EVENTS):
+        """
+        Args:
+            enabled: Başlangıçta ölçüm yapılsın mı?
+            history: Kare süresi dağılımı için saklanan kare sayısı
+            max_events: Trace için saklanan en fazla bölüm kaydı
+        """
+        self.enabled = enabled
+        self.frame_times = deque(maxlen=history)
+        self.events = deque(maxlen=max_events)
+        self._sections = deque(maxlen=history)
+        self._current = {}
+        self._origin = time.perf_counter()
+        self._frame_start = None
+        # Fizik iş parçacığı _current'a eklerken ana döngü onu kareye
+        # aktarıp sıfırlayabilir; ikisi de bu kilitle yapılır
+        self._lock = threading.Lock()
+
+    def section(self, name):
+        """
+        Bir aşamayı zamanlayan bağlam yöneticisi.
+
+        Args:
+            name: Aşama adı (aynı adlı bölümler kare içinde toplanır)
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def _record(self, name, start, end):
+        """Bir bölümü trace'e ve o karenin toplamına ekler."""
+        thread = threading.current_thread().name
+        self.events.append((name, start, end, thread))
+        with self._lock:
+            self._current[name] = self._current.get(name, 0.0) + (end - start)
+
+    def frame_end(self):
+        """
+        Karenin bittiğini bildirir; kare süresini ve bölüm toplamlarını saklar.
+
+        Kare süresi bir önceki frame_end çağrısından bu yana geçen süredir.
+        """
+        if not self.enabled:
+            self._frame_start = None
+            return
+
+        now = time.perf_counter()
+        with self._lock:
+            if self._frame_start is not None:
+                self.frame_times.append(now - self._frame_start)
+                self._sections.append(self._current)
+            self._current = {}
+            self._frame_start = now
+
+    def enable(self, enabled=True):
+        """Ölçümü açar veya kapatır; açılışta önceki kare geçmişi silinir."""
+        if enabled and not self.enabled:
+            with self._lock:
+                self.frame_times.clear()
+                self._sections.clear()
+                self._current = {}
+                self._frame_start = None
+        self.enabled = enabled
+
+    def toggle(self):
+        """Ölçümü açıp kapatır."""
+        self.enable(not self.enabled)
+
+    def breakdown(self):
+        """
+        Saklanan karelerde aşamaların kare başına ortalama süresi.
+
+        Returns:
+            {aşama adı: ortalama milisaniye}, ilk görülme sırasıyla
+        """
+        with self._lock:
+            recorded = list(self._sections)
+        frames = len(recorded)
+        if not frames:
+            return {}
+        totals = {}
+        for sections in recorded:
+            for name, seconds in sections.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        return {name: total * 1000 / frames for name, total in totals.items()}
+
+    def percentiles(self, *percents):
+        """
+        Kare süresinin yüzdelikleri (milisaniye).
+
+        Args:
+            percents: İstenen yüzdelikler (örn. 50, 99)
+
+        Returns:
+            Yüzdelik değerlerinin listesi (kare yoksa 0)
+        """
+        if not self.frame_times:
+            return [0.0 for _ in percents]
+        times = np.fromiter(self.frame_times, dtype=float) * 1000
+        return [float(value) for value in np.percentile(times, percents)]
+
+    def histogram(self, bins=20, limit=None):
+        """
+        Kare sürelerinin dağılımı.
+
+        Args:
+            bins: Aralık sayısı
+            limit: Üst sınır (ms); üstündeki kareler son aralığa eklenir
+                (None ise en uzun kare)
+
+        Returns:
+            (aralık başına kare sayısı, aralık sınırları ms)
+        """
+        times = np.fromiter(self.frame_times, dtype=float) * 1000
+        if limit is None:
+            limit = float(times.max()) if len(times) else 1.0
+        counts, edges = np.histogram(
+            np.minimum(times, limit), bins=bins, range=(0.0, max(limit, 1e-3))
+        )
+        return counts, edges
+
+    def export_chrome_trace(self, path):
+        """
+        Saklanan bölümleri Chrome trace (JSON) dosyasına yazar.
+
+        Args:
+            path: Hedef dosya
+
+        Returns:
+            Yazılan olay sayısı
+        """
+        # Fizik iş parçacığı yazarken de güvenli olması için önce kopyalanır
+        recorded = list(self.events)
+        threads = {}
+        events = []
+        for name, start, end, thread in recorded:
+            tid = threads.setdefault(thread, len(threads))
+            events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": 0,
+                    "tid": tid,
+                }
+            )
+        events.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 0,
+                "tid": tid,
+                "args": {"name": thread},
+            }
+            for thread, tid in threads.items()
+        )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return len(recorded)
+
+
+# Simülasyon ve ana döngünün paylaştığı varsayılan profiler
+PROFILER = Profiler()
@@ -0,0 +1,387 @@
+"""Simülasyon kaydı ve kayıttan oynatma.
+
+Kayıt dosyası sabit boyutlu bir başlık ve ardından sabit boyutlu karelerden
+oluşur; dosyaya yalnızca sona ekleme yapılır. Kareler sabit boyutlu olduğu
+için herhangi bir kareye dosya ofseti hesaplanarak sabit sürede erişilir.
+Girdi olayları yanındaki ".events" dosyasına yine sabit boyutlu kayıtlar
+olarak yazılır. Birden çok ipli dünyalarda iplerin düz dizideki başlangıç
+indeksleri de bu dosyaya TOPOLOGY tipli kayıtlarla eklenir.
+
+Ham modda her kare partikül pozisyonlarını float32 olarak tutar. Delta
+modunda kareler KEYFRAME_INTERVAL uzunluğunda bloklara ayrılır: bloğun ilk
+karesi ham, diğerleri bloğun ilk karesine göre int16 farklar olarak
+saklanır (yaklaşık yarı boyut). Delta karelerin hassasiyeti 1/DELTA_SCALE
+birimdir; anahtar kareden ±32767/DELTA_SCALE birimden uzaklaşan değerler
+kırpılır ve karenin CLIPPED bayrağı işaretlenir.
+
+Büyüyebilen kayıtta kapasiteyi aşan bir kare gelince kapasite artırılır ve
+yazılmış kareler yeni düzenle dosyaya yeniden yazılır; böylece kareler yine
+sabit boyutlu kalır.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"ROPEREC1"
+
+# Başlık: magic, mod, kapasite, anahtar kare aralığı, delta ölçeği
+_HEADER = struct.Struct("<8sIIIf")
+
+RAW = 0
+DELTA = 1
+
+KEYFRAME_INTERVAL = 30
+DELTA_SCALE = 8.0
+
+# Kare bayrakları
+CLIPPED = 1
+
+# Büyüyen kaydın kapasitesi en az bu oranda artırılır (sık yeniden yazmayı önler)
+GROWTH = 1.5
+
+# İp düzeni kaydının olay tipi (pygame olay tipleriyle çakışmaz);
+# code ipin başlangıç indeksi, x ip sayısıdır
+TOPOLOGY = 0xFFFF0000
+
+# Olay kaydı: kare, pygame olay tipi, tuş/buton, x, y
+EVENT_DTYPE = np.dtype(
+    [
+        ("frame", "<u4"),
+        ("type", "<u4"),
+        ("code", "<i4"),
+        ("x", "<f4"),
+        ("y", "<f4"),
+    ]
+)
+
+
+def _frame_dtype(capacity, value_type):
+    """Bir karenin bellek düzeni (başlık + x ve y dizileri)."""
+    return np.dtype(
+        [
+            ("step", "<u4"),
+            ("count", "<i4"),
+            ("dragged", "<i4"),
+            ("flags", "<u4"),
+            ("x", value_type, (capacity,)),
+            ("y", value_type, (capacity,)),
+        ]
+    )
+
+
+def events_path(path):
+    """Kayıt dosyasının olay dosyasının yolu."""
+    return path + ".events"
+
+
+class Recorder:
+    """Her adımın partikül pozisyonlarını ve girdi olaylarını dosyaya ekler."""
+
+    def __init__(self, path, capacity, delta=False, keyframe_interval=None, grow=False):
+        """
+        Args:
+            path: Kayıt dosyası (olaylar path + ".events" dosyasına yazılır)
+            capacity: Karede saklanacak en fazla partikül sayısı
+            delta: Anahtar kareye göre int16 delta kodlaması kullan
+            keyframe_interval: Delta modunda anahtar kare aralığı
+            grow: Kapasiteyi aşan karede kırpmak yerine kapasiteyi artır
+        """
+        self.path = path
+        self.capacity = int(capacity)
+        self.mode = DELTA if delta else RAW
+        self.keyframe_interval = keyframe_interval or KEYFRAME_INTERVAL
+        self.grow = grow
+        self.frames = 0
+        self.clipped_frames = 0
+        self.truncated_frames = 0
+
+        self._raw = _frame_dtype(self.capacity, "<f4")
+        self._delta = _frame_dtype(self.capacity, "<i2")
+        self._key_x = None
+        self._key_y = None
+
+        self._file = open(path, "wb")
+        self._file.write(self._header())
+        self._events = open(events_path(path), "wb")
+
+    def _header(self):
+        """Dosya başlığının baytları."""
+        return _HEADER.pack(
+            MAGIC, self.mode, self.capacity, self.keyframe_interval, DELTA_SCALE
+        )
+
+    def write_frame(self, x, y, step, dragged=None):
+        """
+        Bir karenin pozisyonlarını dosyanın sonuna ekler.
+
+        Kapasiteden fazla partikül varsa grow ile kapasite artırılır, aksi
+        halde ilk capacity partikül saklanır (truncated_frames sayılır).
+
+        Args:
+            x: Partikül X koordinatları
+            y: Partikül Y koordinatları
+            step: Simülasyon adım numarası
+            dragged: Sürüklenen partikülün indeksi (yoksa None)
+        """
+        if self.grow and len(x) > self.capacity:
+            self._resize(max(len(x), int(self.capacity * GROWTH)))
+        count = min(len(x), self.capacity)
+        if count < len(x):
+            self.truncated_frames += 1
+
+        keyframe = self.mode == RAW or self.frames % self.keyframe_interval == 0
+        frame = np.zeros(1, dtype=self._raw if keyframe else self._delta)
+        frame["step"] = step
+        frame["count"] = count
+        frame["dragged"] = -1 if dragged is None else dragged
+
+        if keyframe:
+            frame["x"][0, :count] = x[:count]
+            frame["y"][0, :count] = y[:count]
+            if self.mode == DELTA:
+                self._set_keyframe(frame["x"][0], frame["y"][0], count)
+        else:
+            clipped = False
+            for axis, values, key in (("x", x, self._key_x), ("y", y, self._key_y)):
+                delta = np.round((values[:count] - key[:count]) * DELTA_SCALE)
+                clipped |= bool(np.any(np.abs(delta) > 32767))
+                frame[axis][0, :count] = np.clip(delta, -32767, 32767)
+            if clipped:
+                frame["flags"] = CLIPPED
+                self.clipped_frames += 1
+
+        self._file.write(frame.tobytes())
+        self.frames += 1
+
+    def _set_keyframe(self, x, y, count):
+        """Delta kareler için referans (count sonrası son partikülü kullanır)."""
+        self._key_x = x.astype(float)
+        self._key_y = y.astype(float)
+        if 0 < count < self.capacity:
+            self._key_x[count:] = self._key_x[count - 1]
+            self._key_y[count:] = self._key_y[count - 1]
+
+    def _resize(self, capacity):
+        """
+        Kapasiteyi artırır ve yazılmış kareleri yeni düzenle yeniden yazar.
+
+        Eski karelerin x ve y dizileri sıfırla uzatılır; anahtar karelerin
+        count sonrası değerleri okunurken zaten son partikülle doldurulur.
+
+        Args:
+            capacity: Yeni kapasite
+        """
+        old_raw, old_delta, old_capacity = self._raw, self._delta, self.capacity
+        self.capacity = int(capacity)
+        self._raw = _frame_dtype(self.capacity, "<f4")
+        self._delta = _frame_dtype(self.capacity, "<i2")
+
+        self._file.close()
+        temporary = self.path + ".resize"
+        with open(self.path, "rb") as source, open(temporary, "wb") as target:
+            source.seek(_HEADER.size)
+            target.write(self._header())
+            for index in range(self.frames):
+                keyframe = self.mode == RAW or index % self.keyframe_interval == 0
+                old = old_raw if keyframe else old_delta
+                record = np.frombuffer(source.read(old.itemsize), dtype=old)
+                frame = np.zeros(1, dtype=self._raw if keyframe else self._delta)
+                for name in ("step", "count", "dragged", "flags"):
+                    frame[name] = record[name]
+                frame["x"][0, :old_capacity] = record["x"][0]
+                frame["y"][0, :old_capacity] = record["y"][0]
+                target.write(frame.tobytes())
+        os.replace(temporary, self.path)
+        self._file = open(self.path, "ab")
+
+        # Yeni partiküllerin deltaları anahtar karenin son partikülüne göredir
+        if self._key_x is not None:
+            extra = self.capacity - old_capacity
+            self._key_x = np.append(self._key_x, np.full(extra, self._key_x[-1]))
+            self._key_y = np.append(self._key_y, np.full(extra, self._key_y[-1]))
+
+    def write_event(self, event):
+        """
+        Bir pygame olayını bir sonraki kare numarasıyla kaydeder.
+
+        Args:
+            event: pygame olayı (pos, key veya button alanları varsa saklanır)
+        """
+        record = np.zeros(1, dtype=EVENT_DTYPE)
+        record["frame"] = self.frames
+        record["type"] = event.type
+        record["code"] = getattr(event, "key", getattr(event, "button", 0))
+        x, y = getattr(event, "pos", (0, 0))
+        record["x"] = x
+        record["y"] = y
+        self._events.write(record.tobytes())
+
+    def write_ropes(self, starts):
+        """
+        İplerin düz dizideki başlangıç indekslerini bir sonraki kareden
+        itibaren geçerli olmak üzere kaydeder.
+
+        Args:
+            starts: Her ipin ilk partikülünün indeksi (World.offsets[:-1])
+        """
+        records = np.zeros(len(starts), dtype=EVENT_DTYPE)
+        records["frame"] = self.frames
+        records["type"] = TOPOLOGY
+        records["code"] = starts
+        records["x"] = len(starts)
+        self._events.write(records.tobytes())
+
+    def flush(self):
+        """Tamponlanmış kareleri ve olayları dosyaya yazar."""
+        self._file.flush()
+        self._events.flush()
+
+    def close(self):
+        """Kayıt ve olay dosyalarını kapatır."""
+        self._file.close()
+        self._events.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Recording:
+    """Kayıt dosyasını bellek eşlemeli (memmap) olarak okur.
+
+    Kareye erişim dosya ofsetinin doğrudan hesaplanmasıyla yapılır; bir
+    kareye gitmek için önceki kareleri okumak veya simülasyonu yeniden
+    çalıştırmak gerekmez.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Recorder ile yazılmış kayıt dosyası
+        """
+        self.path = path
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(self._data) < _HEADER.size:
+            raise ValueError(f"Not a rope recording: {path!r}")
+        magic, mode, capacity, interval, scale = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a rope recording: {path!r}")
+
+        self.mode = mode
+        self.capacity = capacity
+        self.keyframe_interval = interval
+        self.delta_scale = scale
+        self._raw = _frame_dtype(capacity, "<f4")
+        self._delta = _frame_dtype(capacity, "<i2")
+
+        # Yarım yazılmış son kare sayılmaz
+        payload = len(self._data) - _HEADER.size
+        if mode == RAW:
+            self.frames = payload // self._raw.itemsize
+        else:
+            block = self._raw.itemsize + (interval - 1) * self._delta.itemsize
+            blocks, rest = divmod(payload, block)
+            self.frames = blocks * interval
+            if rest >= self._raw.itemsize:
+                self.frames += 1 + (rest - self._raw.itemsize) // self._delta.itemsize
+
+        self.events = self._load_events()
+
+    def __len__(self):
+        return self.frames
+
+    def _load_events(self):
+        """Olay dosyasını okur (yoksa boş dizi, yarım kayıt atılır)."""
+        try:
+            with open(events_path(self.path), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return np.zeros(0, dtype=EVENT_DTYPE)
+        usable = len(data) - len(data) % EVENT_DTYPE.itemsize
+        return np.frombuffer(data[:usable], dtype=EVENT_DTYPE)
+
+    def _offset(self, index):
+        """Karenin dosyadaki bayt ofseti ve anahtar kare olup olmadığı."""
+        if self.mode == RAW:
+            return _HEADER.size + index * self._raw.itemsize, True
+
+        block, slot = divmod(index, self.keyframe_interval)
+        block_size = (
+            self._raw.itemsize + (self.keyframe_interval - 1) * self._delta.itemsize
+        )
+        offset = _HEADER.size + block * block_size
+        if slot == 0:
+            return offset, True
+        return offset + self._raw.itemsize + (slot - 1) * self._delta.itemsize, False
+
+    def _record(self, index):
+        """Karenin ham kaydı ve anahtar kare olup olmadığı."""
+        offset, keyframe = self._offset(index)
+        dtype = self._raw if keyframe else self._delta
+        record = np.frombuffer(self._data, dtype=dtype, count=1, offset=offset)[0]
+        return record, keyframe
+
+    def frame(self, index):
+        """
+        Bir kareyi sabit sürede çözer.
+
+        Args:
+            index: Kare numarası (negatifse sondan sayılır)
+
+        Returns:
+            {"step", "x", "y", "dragged" (yoksa None), "clipped"}
+        """
+        if index < 0:
+            index += self.frames
+        if not 0 <= index < self.frames:
+            raise IndexError("frame index out of range")
+
+        record, keyframe = self._record(index)
+        count = int(record["count"])
+        if keyframe:
+            x = record["x"][:count].astype(float)
+            y = record["y"][:count].astype(float)
+        else:
+            key, _ = self._record(index - index % self.keyframe_interval)
+            key_count = int(key["count"])
+            key_x = key["x"].astype(float)
+            key_y = key["y"].astype(float)
+            if 0 < key_count < self.capacity:
+                key_x[key_count:] = key_x[key_count - 1]
+                key_y[key_count:] = key_y[key_count - 1]
+            x = key_x[:count] + record["x"][:count] / self.delta_scale
+            y = key_y[:count] + record["y"][:count] / self.delta_scale
+
+        dragged = int(record["dragged"])
+        return {
+            "step": int(record["step"]),
+            "x": x,
+            "y": y,
+            "dragged": dragged if dragged >= 0 else None,
+            "clipped": bool(record["flags"] & CLIPPED),
+        }
+
+    def events_until(self, index):
+        """Kare index'e kadar (dahil) kaydedilmiş girdi olayları."""
+        end = np.searchsorted(self.events["frame"], index, side="right")
+        events = self.events[:end]
+        return events[events["type"] != TOPOLOGY]
+
+    def rope_starts(self, index):
+        """
+        Kare index'te geçerli ip başlangıç indeksleri.
+
+        Returns:
+            Başlangıç indeksleri dizisi (düzen kaydı yoksa tek ip: [0])
+        """
+        end = np.searchsorted(self.events["frame"], index, side="right")
+        topology = np.flatnonzero(self.events["type"][:end] == TOPOLOGY)
+        if len(topology) == 0:
+            return np.zeros(1, dtype=np.intp)
+        last = self.events[topology[-1]]
+        count = int(last["x"])
+        return self.events["code"][topology[-count:]].astype(np.intp)
@@ -1,7 +1,10 @@
+import sys
+
 import pygame
 
 from physics.constraint import Constraint
 from physics.particle import Particle
+from profiler import PROFILER
 
 
 class Rope:
@@ -31,6 +34,12 @@ class Rope:
         self.constraints = []
         self.segment_length = segment_length
         self.rope_color = rope_color
+        self.solver_stats = {
+            "iterations": 0,
+            "max_error": 0.0,
+            "rms_error": 0.0,
+            "converged": True,
+        }
 
         # Partikülleri oluştur
         for i in range(num_segments + 1):
@@ -52,29 +61,129 @@ class Rope:
             )
             self.constraints.append(constraint)
 
-    def update(self, gravity=0.5, damping=0.99, dt=1.0, constraint_iterations=3):
+    def update(
+        self,
+        gravity=0.5,
+        damping=0.99,
+        dt=1.0,
+        constraint_iterations=3,
+        bounds=None,
+        tolerance=None,
+        min_iterations=1,
+    ):
         """
         İpin fizik güncelleme döngüsü.
 
+        Kullanılan iterasyon sayısı ve kalan göreli hata solver_stats içinde
+        raporlanır.
+
         Args:
             gravity: Yerçekimi kuvveti
             damping: Sönümleme katsayısı (enerji kaybı)
             dt: Zaman adımı
-            constraint_iterations: Constraint çözme iterasyon sayısı (daha fazla = daha katı)
+            constraint_iterations: Constraint çözme iterasyon sayısı (daha fazla = daha katı);
+                tolerance verilirse en fazla iterasyon sayısı
+            bounds: (genişlik, yükseklik) dünya sınırları (None ise ekran boyutu)
+            tolerance: Verilirse çözüm, en büyük göreli kısıtlama hatası
+                (doğal uzunluğa göre) bunun altına inince durur
+            min_iterations: tolerance ile yapılacak en az iterasyon sayısı
         """
         # 1. Tüm partikülleri güncelle
-        for particle in self.particles:
-            particle.update(gravity=gravity, damping=damping, dt=dt)
+        with PROFILER.section("integrate"):
+            for particle in self.particles:
+                particle.update(gravity=gravity, damping=damping, dt=dt)
 
         # 2. Constraint'leri çöz ( 여러 iterasyon ile daha stabil)
-        for _ in range(constraint_iterations):
-            for constraint in self.constraints:
-                constraint.resolve()
+        iterations = 0
+        with PROFILER.section("solve"):
+            for iterations in range(1, constraint_iterations + 1):
+                for constraint in self.constraints:
+                    constraint.resolve()
+                if (
+                    tolerance is not None
+                    and iterations >= min_iterations
+                    and self.residual()[0] <= tolerance
+                ):
+                    break
+            max_error, rms_error = self.residual()
+
+        # Son taramadan sonra kalan hata (ArrayRope ile aynı ölçü); tolerans
+        # yoksa sabit tarama sayısı yapılır ve yakınsama tanımsızdır
+        self.solver_stats = {
+            "iterations": iterations,
+            "max_error": max_error,
+            "rms_error": rms_error,
+            "converged": None if tolerance is None else max_error <= tolerance,
+        }
 
         # 3. Ekran sınırlarına çarpma kontrolü
-        width, height = pygame.display.get_surface().get_size()
-        for particle in self.particles:
-            particle.constrain(width, height)
+        if bounds is None:
+            bounds = pygame.display.get_surface().get_size()
+        width, height = bounds
+        with PROFILER.section("clamp"):
+            for particle in self.particles:
+                particle.constrain(width, height)
+
+    def residual(self):
+        """
+        Kısıtlamaların doğal uzunluğa göre göreli hatası.
+
+        Returns:
+            (en büyük göreli hata, RMS göreli hata)
+        """
+        errors = [constraint.error() for constraint in self.constraints]
+        if not errors:
+            return 0.0, 0.0
+        return max(errors), (sum(e * e for e in errors) / len(errors)) ** 0.5
+
+    def resize(self, num_segments):
+        """
+        Segment sayısını ipi yeniden oluşturmadan değiştirir.
+
+        Mevcut partiküller korunur. Yeni partiküller son segmentin
+        doğrultusunda eklenir; fazla partiküller sondan atılır.
+
+        Args:
+            num_segments: Yeni segment sayısı (en az 1)
+        """
+        num_segments = max(1, int(num_segments))
+        if num_segments < len(self.constraints):
+            del self.particles[num_segments + 1 :]
+            del self.constraints[num_segments:]
+            return
+
+        last = self.particles[-1]
+        dx, dy = 1.0, 0.0
+        if len(self.particles) > 1:
+            dx = last.x - self.particles[-2].x
+            dy = last.y - self.particles[-2].y
+            length = (dx * dx + dy * dy) ** 0.5
+            dx, dy = (dx / length, dy / length) if length > 0 else (1.0, 0.0)
+
+        while len(self.constraints) < num_segments:
+            previous = self.particles[-1]
+            particle = Particle(
+                previous.x + dx * self.segment_length,
+                previous.y + dy * self.segment_length,
+                radius=last.radius,
+                color=last.color,
+            )
+            self.particles.append(particle)
+            self.constraints.append(Constraint(previous, particle, stiffness=1.0))
+
+    def set_segment_length(self, segment_length):
+        """
+        Segment uzunluğunu değiştirir; doğal uzunluklar aynı oranda ölçeklenir.
+
+        Args:
+            segment_length: Yeni segment uzunluğu
+        """
+        if segment_length == self.segment_length:
+            return
+        scale = segment_length / self.segment_length
+        for constraint in self.constraints:
+            constraint.rest_length *= scale
+        self.segment_length = segment_length
 
     def drag_particle(self, mouse_pos, dragged_index=None):
         """
@@ -168,7 +277,40 @@ class Rope:
                     screen, (255, 255, 0), (int(screen_x), int(screen_y)), 8, 2
                 )
 
+    def memory_usage(self):
+        """
+        Partikül ve kısıtlama objelerinin bellek kullanımı.
+
+        Objeler, listeler ve slot değerleri sys.getsizeof ile sayılır;
+        paylaşılan objeler (ortak renk tuple'ı, bool'lar, komşu partiküller)
+        bir kez sayılır.
+
+        Returns:
+            {"particles", "constraints", "total" (bayt), "bytes_per_segment"}
+        """
+        seen = set()
+        particles = _deep_size(self.particles, seen)
+        constraints = _deep_size(self.constraints, seen)
+        total = particles + constraints
+        return {
+            "particles": particles,
+            "constraints": constraints,
+            "total": total,
+            "bytes_per_segment": total / max(len(self.constraints), 1),
+        }
+
     def release_all(self):
         """Tüm partiküllerin sürükleme durumunu serbest bırak."""
         for particle in self.particles:
             particle.is_being_dragged = False
+
+
+def _deep_size(objects, seen):
+    """Listenin, içindeki slotlu objelerin ve slot değerlerinin toplam boyutu."""
+    total = sys.getsizeof(objects)
+    for obj in objects:
+        for value in (obj, *(getattr(obj, name) for name in obj.__slots__)):
+            if id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+    return total
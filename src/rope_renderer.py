@@ -0,0 +1,224 @@
+import numpy as np
+import pygame
+
+# Gösterge renkleri (Particle.draw ve Rope.draw ile aynı)
+FIXED_COLOR = (255, 0, 0)
+DRAGGED_COLOR = (255, 255, 0)
+
+# Varsayılan LOD toleransı (piksel): son çizilen partiküle ekranda ip boyunca
+# bundan yakın partiküller atlanır (en küçük zoom'da 35 px segment 7 px olur)
+LOD_TOLERANCE = 4.0
+
+
+class RopeRenderer:
+    """İpi toplu dönüşüm, görüş alanı kırpma ve polyline/blit ile çizer.
+
+    Tüm noktalar tek seferde ekran koordinatına çevrilir, görüş alanı
+    dışındaki segmentler atılır, görünen ardışık segmentler tek bir
+    pygame.draw.lines çağrısıyla, partiküller ise önceden çizilmiş bir
+    sprite'tan Surface.blits ile çizilir. Uzaklaştırılmış görünümde aynı
+    piksele düşen partiküller LOD ile atlanır. Böylece kare süresi toplam
+    partikül sayısıyla değil görünen detayla ölçeklenir.
+    """
+
+    def __init__(self, line_width=3, lod_tolerance=LOD_TOLERANCE):
+        """
+        Args:
+            line_width: Zoom 1.0'daki ip çizgi kalınlığı
+            lod_tolerance: Ekran uzayında piksel cinsinden LOD toleransı
+                (0 veya None ise her partikül çizilir)
+        """
+        self.line_width = line_width
+        self.lod_tolerance = lod_tolerance
+        self._sprites = {}
+
+    def sprite(self, radius, color):
+        """Verilen yarıçap ve renkte önceden çizilmiş partikül sprite'ı."""
+        key = (radius, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            size = 2 * radius + 1
+            # Alfa yerine colorkey: küçük sprite'larda blit çok daha hızlı
+            key_color = (0, 0, 0) if color != (0, 0, 0) else (255, 0, 255)
+            sprite = pygame.Surface((size, size))
+            sprite.fill(key_color)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprite.set_colorkey(key_color, pygame.RLEACCEL)
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen, rope, camera=None):
+        """
+        İpi ekrana çizer.
+
+        Args:
+            screen: Pygame ekran objesi
+            rope: ArrayRope (particles ve constraints dizileri)
+            camera: Kamera objesi (varsa world-to-screen transform uygular)
+        """
+        particles = rope.particles
+        if len(particles) == 0:
+            return
+
+        # Tüm noktaları tek seferde dönüştür
+        if camera:
+            xs, ys = camera.world_to_screen(particles.x, particles.y)
+            zoom = camera.zoom
+            line_width = max(1, int(self.line_width * zoom))
+            draw_radius = max(1, int(particles.radius * zoom))
+            fixed_radius = max(2, int((particles.radius + 2) * zoom))
+        else:
+            xs, ys = particles.x, particles.y
+            line_width = self.line_width
+            draw_radius = particles.radius
+            fixed_radius = particles.radius + 2
+
+        xs = xs.astype(int)
+        ys = ys.astype(int)
+        width, height = screen.get_size()
+        margin = max(line_width, fixed_radius, 8)
+
+        # LOD yalnızca uzaklaştırılmışken devrede (yakında maske kazançsız)
+        keep = None
+        if camera and camera.zoom < 1.0:
+            keep = self.lod_mask(particles, xs, ys)
+
+        self._draw_segments(
+            screen, rope, xs, ys, keep, width, height, margin, line_width
+        )
+        self._draw_particles(
+            screen, particles, xs, ys, keep, width, height, draw_radius
+        )
+
+        # Sabit ve sürüklenen partiküller için göstergeler (az sayıda)
+        for i in np.flatnonzero(particles.is_fixed).tolist():
+            center = (xs[i], ys[i])
+            pygame.draw.circle(screen, FIXED_COLOR, center, fixed_radius, 2)
+        for i in np.flatnonzero(particles.is_being_dragged).tolist():
+            center = (xs[i], ys[i])
+            pygame.draw.circle(screen, DRAGGED_COLOR, center, 8, 2)
+
+    def bounds(self, rope, camera=None):
+        """
+        İpin ekranda kapladığı alan (göstergeler dahil).
+
+        Args:
+            rope: ArrayRope
+            camera: Kamera objesi (varsa world-to-screen transform uygular)
+
+        Returns:
+            pygame.Rect
+        """
+        particles = rope.particles
+        if len(particles) == 0:
+            return pygame.Rect(0, 0, 0, 0)
+
+        left, right = float(particles.x.min()), float(particles.x.max())
+        top, bottom = float(particles.y.min()), float(particles.y.max())
+        zoom = 1.0
+        if camera:
+            left, top = camera.world_to_screen(left, top)
+            right, bottom = camera.world_to_screen(right, bottom)
+            zoom = camera.zoom
+
+        # Çizgi kalınlığı, sabit partikül halkası ve sürükleme göstergesi payı
+        margin = int(max(self.line_width, particles.radius + 2) * zoom) + 10
+        return pygame.Rect(
+            int(left) - margin,
+            int(top) - margin,
+            int(right) - int(left) + 2 * margin + 1,
+            int(bottom) - int(top) + 2 * margin + 1,
+        )
+
+    def lod_mask(self, particles, xs, ys):
+        """
+        Ekran uzayında çizilecek partiküllerin maskesi.
+
+        İlk partikül çizilir; sonrakiler, son çizilen partikülden ekranda ip
+        boyunca en az lod_tolerance uzaktaki ilk partiküle kadar atlanır.
+        Böylece atlanan her partikül son çizilene toleranstan yakındır ve
+        segmentleri tolerans kadar kısalan uzaklaştırılmış iplerde de
+        seyreltme yapılır. Her partikülün ardılı (yol uzunluğu + tolerans
+        üzerinde searchsorted) vektörize bulunur; ardıl zinciri, atlama
+        tablosu her turda ikiye katlanarak en fazla log(n) turda çıkarılır.
+        Sabit ve sürüklenen partiküller her zaman korunur.
+
+        Returns:
+            Boolean dizi veya LOD kapalıysa None
+        """
+        if not self.lod_tolerance or len(xs) < 2:
+            return None
+
+        count = len(xs)
+        steps = np.hypot(np.diff(xs).astype(float), np.diff(ys).astype(float))
+        path = np.concatenate(([0.0], np.cumsum(steps)))
+
+        # Her partikülden sonra çizilecek partikül (count: ip bitti)
+        successor = np.searchsorted(path, path + self.lod_tolerance, side="left")
+        jump = np.append(successor, count)
+
+        # Önceki adımı toleranstan uzun partiküller kesin çizilir; zincirler
+        # bunlardan başlar ve her turda 2^k adım daha uzatılır (jump: 2^k
+        # adımlık ardıl, son eleman "ip bitti")
+        keep = np.zeros(count + 1, dtype=bool)
+        keep[:count] = np.concatenate(([True], steps >= self.lod_tolerance))
+        while True:
+            reached = jump[np.flatnonzero(keep[:count])]
+            if keep[reached].all():
+                break
+            keep[reached] = True
+            jump = jump[jump]
+        keep = keep[:count]
+        keep |= particles.is_fixed | particles.is_being_dragged
+        return keep
+
+    def _draw_segments(
+        self, screen, rope, xs, ys, keep, width, height, margin, line_width
+    ):
+        """Görünen ardışık segmentleri polyline olarak çizer."""
+        i1 = rope.constraints.i1
+        i2 = rope.constraints.i2
+        if len(i1) == 0:
+            return
+
+        x1, y1, x2, y2 = xs[i1], ys[i1], xs[i2], ys[i2]
+        visible = (
+            (np.maximum(x1, x2) >= -margin)
+            & (np.minimum(x1, x2) <= width + margin)
+            & (np.maximum(y1, y2) >= -margin)
+            & (np.minimum(y1, y2) <= height + margin)
+        )
+
+        # Bir segment, önceki segment görünür ve zincirde ona bağlıysa run'ı sürdürür
+        continues = np.zeros(len(i1), dtype=bool)
+        continues[1:] = visible[:-1] & (i2[:-1] == i1[1:])
+        starts = np.flatnonzero(visible & ~continues)
+        ends = np.flatnonzero(visible & ~np.append(continues[1:], False))
+
+        color = rope.rope_color
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            indices = np.append(i1[start], i2[start : end + 1])
+            if keep is not None:
+                # Run'ın uçları her zaman korunur ki komşu run'lar kopmasın
+                mask = keep[indices]
+                mask[0] = mask[-1] = True
+                indices = indices[mask]
+            points = np.column_stack((xs[indices], ys[indices])).tolist()
+            pygame.draw.lines(screen, color, False, points, line_width)
+
+    def _draw_particles(self, screen, particles, xs, ys, keep, width, height, radius):
+        """Görünen partikülleri önceden çizilmiş sprite ile toplu blit eder."""
+        visible = (
+            (xs >= -radius)
+            & (xs <= width + radius)
+            & (ys >= -radius)
+            & (ys <= height + radius)
+        )
+        if keep is not None:
+            visible &= keep
+        if not visible.any():
+            return
+
+        sprite = self.sprite(radius, tuple(particles.color))
+        corners = np.column_stack((xs[visible] - radius, ys[visible] - radius))
+        screen.blits([(sprite, corner) for corner in corners.tolist()], False)
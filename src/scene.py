@@ -0,0 +1,109 @@
+"""İp sahnelerinin ikili dosyaya kaydedilmesi ve yüklenmesi.
+
+Dosya düzeni: MAGIC, JSON üst verisinin uzunluğu (uint32), JSON üst verisi
+(iplerin ayarları, simülasyon parametreleri, kamera ve dizilerin düzeni) ve
+ardından tüm iplerin dizilerinin ham baytları. Yükleme dosyayı tek seferde okur ve
+dizileri bu tampon üzerinde kopyalamadan oluşturur.
+"""
+
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"ROPESCN2"
+
+_LENGTH = struct.Struct("<I")
+
+# Dizilerin dosyadaki hizalaması (bayt)
+_ALIGN = 8
+
+
+def _padded(size):
+    """Boyutu bir sonraki hizalama sınırına yuvarlar."""
+    return -(-size // _ALIGN) * _ALIGN
+
+
+def save_scene(path, ropes, params=None, camera=None):
+    """
+    İplerin tam durumunu, simülasyon parametrelerini ve kamerayı kaydeder.
+
+    Args:
+        path: Hedef dosya
+        ropes: ArrayRope listesi veya World (tek ArrayRope da verilebilir)
+        params: Simülasyon parametreleri (JSON'a çevrilebilir sözlük)
+        camera: Kamera objesi (x, y, zoom saklanır)
+    """
+    if not hasattr(ropes, "__iter__"):
+        ropes = [ropes]
+
+    states = []
+    arrays = []
+    layout = []
+    offset = 0
+    for rope_index, rope in enumerate(ropes):
+        state = rope.snapshot()
+        for group in ("particles", "constraints"):
+            for name, values in state.pop(group).items():
+                values = np.ascontiguousarray(values)
+                dtype = values.dtype.newbyteorder("<")
+                values = values.astype(dtype, copy=False)
+                layout.append([rope_index, group, name, dtype.str, len(values), offset])
+                arrays.append(values)
+                offset += _padded(values.nbytes)
+        states.append(state)
+
+    meta = {
+        "ropes": states,
+        "params": params or {},
+        "camera": (
+            {"x": camera.x, "y": camera.y, "zoom": camera.zoom}
+            if camera is not None
+            else None
+        ),
+        "arrays": layout,
+    }
+    header = json.dumps(meta).encode("utf-8")
+
+    # Diziler hizalı başlasın diye başlık boşlukla tamamlanır
+    prefix = len(MAGIC) + _LENGTH.size + len(header)
+    header += b" " * (_padded(prefix) - prefix)
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header)))
+        f.write(header)
+        for values in arrays:
+            f.write(values.tobytes())
+            f.write(b"\0" * (_padded(values.nbytes) - values.nbytes))
+
+
+def load_scene(path):
+    """
+    Kaydedilmiş sahneyi tek seferlik okumayla yükler.
+
+    Args:
+        path: save_scene ile yazılmış dosya
+
+    Returns:
+        {"ropes": ArrayRope.restore için durum listesi (World.restore),
+         "params": sözlük, "camera": {"x", "y", "zoom"} veya None}
+    """
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise ValueError(f"Not a rope scene: {path!r}")
+    (length,) = _LENGTH.unpack_from(data, len(MAGIC))
+    start = len(MAGIC) + _LENGTH.size
+    meta = json.loads(data[start : start + length].decode("utf-8"))
+    base = start + length
+
+    # Diziler okunan tampon üzerinde görünümdür (yazılabilir, kopyasız)
+    states = [dict(state, particles={}, constraints={}) for state in meta["ropes"]]
+    for rope_index, group, name, dtype, count, offset in meta["arrays"]:
+        states[rope_index][group][name] = np.frombuffer(
+            data, dtype=np.dtype(dtype), count=count, offset=base + offset
+        )
+
+    return {"ropes": states, "params": meta["params"], "camera": meta["camera"]}
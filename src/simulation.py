@@ -0,0 +1,174 @@
+"""Fiziğin ayrı bir iş parçacığında sabit zaman adımıyla ilerletilmesi.
+
+SimulationThread dünyayı gerçek zamandan bağımsız, sabit hızda (rate adım
+/saniye) ilerletir: geçen süre bir biriktiricide toplanır ve biriktirici
+bir adım süresini geçtikçe adım atılır. Her adımdan sonra pozisyonların
+kopyası bir Snapshot olarak yayımlanır; en son iki snapshot (previous,
+current) tek bir atamayla birlikte değiştirilir. Çizim tarafı kilit almadan
+bu çifti okur ve interpolate() ile aralarında ara değer hesaplar; böylece
+fizik hızı kare hızına bağlı kalmaz ve yavaş bir çizim fiziği yavaşlatmaz.
+
+Dünyayı değiştiren işlemler (sürükleme, boyutlandırma, reset) lock
+alınarak yapılır; fizik adımı da aynı kilidi tutar.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+# Bir turda yetişmek için atılabilecek en fazla adım (fazlası atılır)
+MAX_CATCHUP_STEPS = 5
+
+
+class Snapshot:
+    """Bir fizik adımı sonrasındaki pozisyonların değişmez kopyası."""
+
+    __slots__ = (
+        "x",
+        "y",
+        "is_being_dragged",
+        "step",
+        "time",
+        "version",
+        "layout",
+        "active",
+        "solver_stats",
+        "collision_stats",
+    )
+
+    def __init__(self, world, step, published):
+        """
+        Args:
+            world: Kopyalanan World
+            step: Atılan fizik adımı sayısı
+            published: Yayımlanma zamanı (time.perf_counter)
+        """
+        particles = world.particles
+        self.x = particles.x.copy()
+        self.y = particles.y.copy()
+        self.is_being_dragged = particles.is_being_dragged.copy()
+        self.step = step
+        self.time = published
+        self.version = world.version
+        self.layout = world.layout
+        self.active = world.active_particles()
+        self.solver_stats = world.solver_stats
+        self.collision_stats = world.collision_stats
+
+
+class SimulationThread(threading.Thread):
+    """Dünyayı sabit zaman adımıyla ilerleten arka plan iş parçacığı."""
+
+    def __init__(self, world, simulation=None, rate=60):
+        """
+        Args:
+            world: Yayımlanan World
+            simulation: step() metodu çağrılan nesne (None ise world;
+                parallel.ShardedWorld da verilebilir)
+            rate: Saniyedeki fizik adımı sayısı
+        """
+        super().__init__(name="physics", daemon=True)
+        self.world = world
+        self.simulation = simulation or world
+        self.step_seconds = 1.0 / rate
+        self.lock = threading.RLock()
+        self.paused = True
+        self.steps = 0
+        self.steps_per_second = 0.0
+
+        self._params = {}
+        self._stop_event = threading.Event()
+        self.snapshots = (None, None)
+        self.publish(jump=True)
+
+    def configure(self, **params):
+        """Sonraki adımlarda World.step'e verilecek argümanları ayarlar."""
+        self._params = params
+
+    def publish(self, jump=False):
+        """
+        Dünyanın güncel durumunu yayımlar.
+
+        Args:
+            jump: İki snapshot'ı da güncel durum yap (interpolasyon yapılmaz;
+                reset, duraklatılmışken sürükleme ve ip yapısı değişimi için)
+        """
+        with self.lock:
+            snapshot = Snapshot(self.world, self.steps, time.perf_counter())
+        previous = self.snapshots[1]
+        if jump or previous is None or previous.layout != snapshot.layout:
+            previous = snapshot
+        self.snapshots = (previous, snapshot)
+
+    def alpha(self, now=None):
+        """
+        Çizim anının son iki snapshot arasındaki konumu.
+
+        Returns:
+            0 (previous) ile 1 (current) arasında oran
+        """
+        if now is None:
+            now = time.perf_counter()
+        current = self.snapshots[1]
+        return min(max((now - current.time) / self.step_seconds, 0.0), 1.0)
+
+    def run(self):
+        accumulator = 0.0
+        rate_start = previous = time.perf_counter()
+        rate_steps = self.steps
+        while not self._stop_event.is_set():
+            now = time.perf_counter()
+            if self.paused:
+                accumulator = 0.0
+            else:
+                accumulator += now - previous
+            previous = now
+
+            steps = 0
+            while accumulator >= self.step_seconds and steps < MAX_CATCHUP_STEPS:
+                with self.lock:
+                    self.simulation.step(**self._params)
+                    self.steps += 1
+                    self.publish()
+                accumulator -= self.step_seconds
+                steps += 1
+
+            # Yetişilemeyen süre atılır; simülasyon gerçek zamanın gerisinde kalır
+            if steps == MAX_CATCHUP_STEPS:
+                accumulator = 0.0
+
+            if now - rate_start >= 1.0:
+                self.steps_per_second = (self.steps - rate_steps) / (now - rate_start)
+                rate_start, rate_steps = now, self.steps
+
+            self._stop_event.wait(max(self.step_seconds - accumulator, 0.0))
+
+    def stop(self):
+        """İş parçacığını durdurur ve bitmesini bekler."""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+
+def interpolate(previous, current, alpha, out_x, out_y):
+    """
+    İki snapshot arasındaki ara pozisyonları hesaplar.
+
+    Args:
+        previous: Önceki Snapshot
+        current: Son Snapshot
+        alpha: 0 (previous) ile 1 (current) arasında oran
+        out_x: Sonuç X dizisi (current ile aynı uzunlukta)
+        out_y: Sonuç Y dizisi
+    """
+    if previous.layout != current.layout or alpha >= 1.0:
+        out_x[:] = current.x
+        out_y[:] = current.y
+        return
+    np.subtract(current.x, previous.x, out=out_x)
+    out_x *= alpha
+    out_x += previous.x
+    np.subtract(current.y, previous.y, out=out_y)
+    out_y *= alpha
+    out_y += previous.y
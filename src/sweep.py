@@ -0,0 +1,269 @@
+"""Headless parametre taraması: ızgaradaki her kombinasyon için bir koşu.
+
+Koşular bir süreç havuzuna dağıtılır; her biri bitince sonucu CSV
+dosyasına tek satır olarak eklenir ve dosya hemen diske yazılır. Tarama
+yarıda kesilirse aynı komut tekrar çalıştırıldığında dosyadaki koşular
+atlanır ve yalnızca eksikler çalıştırılır.
+
+Kullanım:
+    python sweep.py --gravity 0.3 0.5 1.0 --damping 0.95 0.99 --output sweep.csv
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from array_rope import SOLVERS, ArrayRope
+
+# Taranan parametreler ve main.py'deki varsayılan değerleri
+PARAMETERS = {
+    "gravity": 0.5,
+    "damping": 0.99,
+    "constraint_iterations": 5,
+    "num_segments": 15,
+    "segment_length": 35,
+}
+
+# Tam sayı parametreler (CSV'den okunurken ve ip oluşturulurken)
+INTEGER_PARAMETERS = ("constraint_iterations", "num_segments")
+
+METRICS = (
+    "settle_step",
+    "max_stretch",
+    "energy_drift",
+    "steps_per_second",
+)
+
+# Adım başına en büyük partikül hızı bunun altında kalınca ip durmuş sayılır
+SETTLE_SPEED = 0.05
+
+BOUNDS = (1600, 900)
+
+
+def grid(values):
+    """
+    Parametre değer listelerinin tüm kombinasyonları.
+
+    Args:
+        values: {parametre adı: değer listesi} (eksik parametreler varsayılan)
+
+    Returns:
+        Parametre sözlüklerinin listesi (PARAMETERS sırasıyla)
+    """
+    names = list(PARAMETERS)
+    lists = [values.get(name) or [PARAMETERS[name]] for name in names]
+    return [dict(zip(names, combination)) for combination in itertools.product(*lists)]
+
+
+def case_key(params):
+    """Bir koşuyu parametreleriyle tanımlar (CSV'den okunan değerlerle aynı)."""
+    return tuple(
+        int(params[name]) if name in INTEGER_PARAMETERS else float(params[name])
+        for name in PARAMETERS
+    )
+
+
+def energy(particles, gravity):
+    """
+    İpin toplam mekanik enerjisi (Verlet hızlarıyla kinetik + potansiyel).
+
+    Y ekseni aşağı baktığından potansiyel enerji -m g y'dir.
+    """
+    vx = particles.x - particles.old_x
+    vy = particles.y - particles.old_y
+    kinetic = 0.5 * np.sum(particles.mass * (vx * vx + vy * vy))
+    potential = -gravity * np.sum(particles.mass * particles.y)
+    return float(kinetic + potential)
+
+
+def run_case(params, steps=1000, solver="gauss_seidel", settle_speed=SETTLE_SPEED):
+    """
+    Tek bir parametre kombinasyonunu pencere açmadan çalıştırır.
+
+    Args:
+        params: PARAMETERS anahtarlarıyla parametre sözlüğü
+        steps: Fizik adımı sayısı
+        solver: Constraint çözücüsü (ArrayRope.SOLVERS)
+        settle_speed: Durma eşiği (adım başına en büyük partikül hızı)
+
+    Returns:
+        Parametreler ve ölçümler: settle_step (ipin son kez settle_speed
+        üzerinde hareket ettiği adımdan sonraki adım; durmadıysa boş),
+        max_stretch (en büyük göreli segment uzaması), energy_drift (ilk ve
+        son adım arasındaki enerji farkı, toplam ağırlık × ip uzunluğuna
+        oranla) ve steps_per_second
+    """
+    gravity = params["gravity"]
+    rope = ArrayRope(
+        start_x=0,
+        start_y=0,
+        num_segments=int(params["num_segments"]),
+        segment_length=params["segment_length"],
+        start_fixed=True,
+        solver=solver,
+    )
+    particles = rope.particles
+
+    first_energy = None
+    last_moving = 0
+    max_stretch = 0.0
+    elapsed = 0.0
+    for step in range(steps):
+        start = time.perf_counter()
+        rope.update(
+            gravity=gravity,
+            damping=params["damping"],
+            dt=1.0,
+            constraint_iterations=int(params["constraint_iterations"]),
+            bounds=BOUNDS,
+        )
+        elapsed += time.perf_counter() - start
+
+        max_stretch = max(max_stretch, rope.solver_stats["max_error"])
+        speed = np.hypot(particles.x - particles.old_x, particles.y - particles.old_y)
+        if speed.max() > settle_speed:
+            last_moving = step + 1
+        if first_energy is None:
+            first_energy = energy(particles, gravity)
+    last_energy = energy(particles, gravity)
+
+    # Enerji farkı ipin ağırlığı ve uzunluğuyla boyutsuzlaştırılır
+    scale = gravity * float(np.sum(particles.mass))
+    scale *= int(params["num_segments"]) * params["segment_length"]
+    return {
+        **params,
+        "settle_step": last_moving if last_moving < steps else "",
+        "max_stretch": max_stretch,
+        "energy_drift": (
+            (last_energy - first_energy) / scale if steps and scale else 0.0
+        ),
+        "steps_per_second": steps / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def completed_cases(path):
+    """
+    Çıktı dosyasında tamamlanmış koşuların anahtarları.
+
+    Yarım yazılmış son satır (kesinti) dosyadan kesilir.
+    """
+    if not os.path.exists(path):
+        return set()
+
+    with open(path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            f.truncate(end)
+
+    with open(path, newline="") as f:
+        return {case_key(row) for row in csv.DictReader(f)}
+
+
+def run_sweep(
+    cases,
+    path,
+    processes=None,
+    steps=1000,
+    solver="gauss_seidel",
+    settle_speed=SETTLE_SPEED,
+):
+    """
+    Koşuları süreç havuzunda çalıştırır ve sonuçları CSV'ye ekler.
+
+    Dosyada bulunan koşular tekrar çalıştırılmaz.
+
+    Args:
+        cases: Parametre sözlüklerinin listesi (grid())
+        path: Çıktı CSV dosyası
+        processes: Süreç sayısı (None ise işlemci sayısı)
+        steps: Koşu başına fizik adımı sayısı
+        solver: Constraint çözücüsü
+        settle_speed: Durma eşiği
+
+    Returns:
+        (bu çalıştırmada tamamlanan koşu sayısı, atlanan koşu sayısı)
+    """
+    done = completed_cases(path)
+    pending = [params for params in cases if case_key(params) not in done]
+    skipped = len(cases) - len(pending)
+    if not pending:
+        return 0, skipped
+
+    fields = [*PARAMETERS, *METRICS]
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    finished = 0
+    with open(path, "a", newline="") as f, ProcessPoolExecutor(processes) as pool:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        if new_file:
+            writer.writeheader()
+
+        futures = [
+            pool.submit(run_case, params, steps, solver, settle_speed)
+            for params in pending
+        ]
+        try:
+            for future in as_completed(futures):
+                writer.writerow(future.result())
+                f.flush()
+                finished += 1
+                print(
+                    f"{skipped + finished}/{len(cases)} runs done",
+                    file=sys.stderr,
+                )
+        except KeyboardInterrupt:
+            # Yazılmış satırlar korunur; bir sonraki çalıştırma kalanlardan sürer
+            for future in futures:
+                future.cancel()
+            raise
+    return finished, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rope Simulation parameter sweep")
+    for name, default in PARAMETERS.items():
+        parser.add_argument(
+            "--" + name.replace("_", "-"),
+            dest=name,
+            nargs="+",
+            type=int if name in INTEGER_PARAMETERS else float,
+            default=[default],
+            help=f"values to sweep (default: {default})",
+        )
+    parser.add_argument("--output", default="sweep.csv")
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--solver", choices=SOLVERS, default="gauss_seidel")
+    parser.add_argument("--processes", type=int, help="default: CPU count")
+    parser.add_argument(
+        "--settle-speed",
+        type=float,
+        default=SETTLE_SPEED,
+        help="max per-step particle speed for the rope to count as settled",
+    )
+    args = parser.parse_args(argv)
+
+    cases = grid({name: getattr(args, name) for name in PARAMETERS})
+    try:
+        finished, skipped = run_sweep(
+            cases,
+            args.output,
+            processes=args.processes,
+            steps=args.steps,
+            solver=args.solver,
+            settle_speed=args.settle_speed,
+        )
+    except KeyboardInterrupt:
+        print(f"Interrupted; rerun to resume {args.output}", file=sys.stderr)
+        return 130
+    print(f"{finished} runs written, {skipped} already in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
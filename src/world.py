@@ -0,0 +1,494 @@
+import numpy as np
+import pygame
+
+from array_rope import (
+    DIRECT_PASSES,
+    IDLE_STATS,
+    PICK_CELL_SIZE,
+    SOLVERS,
+    ArrayRope,
+    update_sleep,
+    wake_spans,
+)
+from physics.collision import collide_flat, collide_ropes
+from physics.constraint_array import ConstraintArray
+from physics.particle_array import ParticleArray
+from physics.spatial_hash import SpatialHash
+from profiler import PROFILER
+from rope_renderer import LOD_TOLERANCE
+
+
+class World:
+    """Birden çok ipi ortak düz dizilerde tutan ve tek adımda ilerleten sahne.
+
+    Tüm iplerin partikülleri ve kısıtlamaları tek bir ParticleArray ve
+    ConstraintArray içinde art arda durur; offsets her ipin ilk partikülünün
+    düz dizideki indeksidir. İplerin kendi dizileri bu düz dizilerin
+    görünümleridir (view), bu yüzden step() tüm ipleri ip sayısından bağımsız
+    sayıda dizi işlemiyle ilerletirken çizim ve sürükleme ip bazında çalışmaya
+    devam eder.
+
+    İndeksler (is_mouse_over_particle, drag_particle, particles[i]) düz
+    dizideki global indekslerdir; rope_of() global indeksi ip ve yerel
+    indekse çevirir. Dünyadaki bir ip için update(), resize() veya restore()
+    doğrudan çağrılmamalıdır; bunların World karşılıkları kullanılır.
+    """
+
+    def __init__(
+        self,
+        solver="gauss_seidel",
+        self_collision=False,
+        dtype=float,
+        lod_tolerance=LOD_TOLERANCE,
+    ):
+        """
+        Args:
+            solver: Constraint çözücüsü (ArrayRope.SOLVERS)
+            self_collision: İpler kendileriyle ve birbirleriyle çarpışsın mı?
+            dtype: Düz dizilerin tipi (eklenen iplerinkiyle aynı olmalı)
+            lod_tolerance: Dünyadaki iplerin uzaklaştırılmış çizimdeki LOD
+                toleransı (piksel; eklenen iplerinkinin yerine geçer)
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver: {solver!r}")
+
+        self.solver = solver
+        self.self_collision = self_collision
+        self.lod_tolerance = lod_tolerance
+        self.collision_stats = {
+            "broadphase_pairs": 0,
+            "contacts": 0,
+            "truncated": False,
+        }
+        self.solver_stats = dict(IDLE_STATS)
+        self.ropes = []
+        self.offsets = np.zeros(1, dtype=np.intp)
+
+        self.particles = ParticleArray([], [], dtype=dtype)
+        self.constraints = ConstraintArray(self.particles, [], [])
+        self._breaks = np.zeros(0, dtype=bool)
+
+        # Tüm iplerde seçim için ızgara indeksi (gerektiğinde kurulur)
+        self.index = SpatialHash(cell_size=PICK_CELL_SIZE)
+        self._index_dirty = True
+
+        # Pozisyonlar her değiştiğinde artar; layout ip yapısı değişince artar
+        self.version = 0
+        self.layout = 0
+
+        self._forces = None
+
+    def __len__(self):
+        return len(self.ropes)
+
+    def __iter__(self):
+        return iter(self.ropes)
+
+    def add_rope(self, rope):
+        """
+        İpi dünyaya ekler; ipin dizileri düz dizilere taşınır.
+
+        Args:
+            rope: ArrayRope
+
+        Returns:
+            Eklenen ip
+        """
+        self.add_ropes([rope])
+        return rope
+
+    def add_ropes(self, ropes):
+        """Birden çok ipi tek yeniden kurulumla dünyaya ekler."""
+        self.ropes.extend(ropes)
+        self._rebuild()
+
+    def remove_rope(self, rope):
+        """İpi dünyadan çıkarır; ip kendi dizilerinin kopyasıyla kalır."""
+        self.ropes.remove(rope)
+        rope.restore(rope.snapshot(), copy=False)
+        self._rebuild()
+
+    def clear(self):
+        """Tüm ipleri çıkarır."""
+        self.ropes = []
+        self._rebuild()
+
+    def _rebuild(self):
+        """
+        İplerin güncel dizilerini düz dizilerde birleştirir ve ipleri bu
+        dizilerin görünümlerine bağlar.
+        """
+        ropes = self.ropes
+        sizes = [len(rope.particles) for rope in ropes]
+        self.offsets = np.concatenate(([0], np.cumsum(sizes, dtype=np.intp)))
+
+        particles = self.particles
+        for name in ParticleArray.FIELDS:
+            parts = [getattr(rope.particles, name) for rope in ropes]
+            dtype = getattr(particles, name).dtype
+            setattr(
+                particles,
+                name,
+                np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype),
+            )
+
+        constraints = self.constraints
+        for name in ConstraintArray.FIELDS:
+            parts = [getattr(rope.constraints, name) for rope in ropes]
+            if name in ("i1", "i2"):
+                # Yerel indeksler global indekslere kaydırılır
+                parts = [part + offset for part, offset in zip(parts, self.offsets)]
+            dtype = getattr(constraints, name).dtype
+            setattr(
+                constraints,
+                name,
+                np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype),
+            )
+
+        self._bind_ropes()
+        for rope in ropes:
+            rope.renderer.lod_tolerance = self.lod_tolerance
+
+        # Ortak yarıçap yoksa sınır kontrolü ip bazında yapılır
+        radii = {rope.particles.radius for rope in ropes}
+        particles.radius = radii.pop() if len(radii) == 1 else None
+
+        self._set_breaks()
+        self.layout += 1
+        self._moved()
+
+    def _bind_ropes(self):
+        """İpleri düz dizilerin görünümlerine bağlar (i1/i2 yerel kalır)."""
+        particles = self.particles
+        constraints = self.constraints
+        edges = np.cumsum([0] + [len(rope.constraints) for rope in self.ropes])
+        for rope, start, end, first, last in zip(
+            self.ropes, self.offsets[:-1], self.offsets[1:], edges[:-1], edges[1:]
+        ):
+            for name in ParticleArray.FIELDS:
+                setattr(rope.particles, name, getattr(particles, name)[start:end])
+            for name in ("stiffness", "rest_length", "parity"):
+                setattr(rope.constraints, name, getattr(constraints, name)[first:last])
+
+    def _set_breaks(self):
+        """Uyku bölümlerini ip sınırlarında da ayırır."""
+        self._breaks = np.zeros(len(self.particles), dtype=bool)
+        self._breaks[self.offsets[:-1]] = True
+
+    def attach(self, particles, constraints, offsets):
+        """
+        Dünyayı ip nesneleri olmadan hazır düz dizilere bağlar.
+
+        Paylaşımlı bellekteki bir parçayı ilerleten işçi süreçler içindir;
+        step() bu dizileri yerinde günceller.
+
+        Args:
+            particles: ParticleArray (ortak yarıçaplı)
+            constraints: Yerel indeksli ConstraintArray
+            offsets: İplerin başlangıç indeksleri ve sonda toplam partikül sayısı
+        """
+        self.ropes = []
+        self.particles = particles
+        self.constraints = constraints
+        self.offsets = np.asarray(offsets, dtype=np.intp)
+        self._set_breaks()
+        self.layout += 1
+        self._moved()
+
+    def relocate(self, allocate):
+        """
+        Düz dizileri yeni ayrılan dizilere kopyalar ve ipleri bunlara bağlar.
+
+        Args:
+            allocate: (grup, alan adı, mevcut dizi) alıp aynı boyut ve tipte
+                dizi döndüren fonksiyon (grup "particles" veya "constraints")
+        """
+        for group, array in (
+            ("particles", self.particles),
+            ("constraints", self.constraints),
+        ):
+            for name in type(array).FIELDS:
+                current = getattr(array, name)
+                target = allocate(group, name, current)
+                target[...] = current
+                setattr(array, name, target)
+        self._bind_ropes()
+
+    def rope_of(self, index):
+        """
+        Global partikül indeksini ip ve yerel indekse çevirir.
+
+        Returns:
+            (ip, yerel indeks)
+        """
+        position = int(np.searchsorted(self.offsets, index, side="right")) - 1
+        return self.ropes[position], int(index - self.offsets[position])
+
+    def step(
+        self,
+        gravity=0.5,
+        damping=0.99,
+        dt=1.0,
+        constraint_iterations=3,
+        bounds=None,
+        tolerance=None,
+        min_iterations=1,
+    ):
+        """
+        Tüm ipleri tek adımda ilerletir (ArrayRope.update ile aynı aşamalar).
+
+        Her aşama düz diziler üzerinde bir kez çalışır; ip başına yalnızca
+        sürüm sayacı artırılır. Kısıtlama zincirleri ipler arasında partikül
+        paylaşmadığından red-black sınıfları ve doğrudan çözücünün üç
+        köşegenli sistemi ip sınırlarında kendiliğinden ayrılır.
+
+        Args:
+            gravity: Yerçekimi kuvveti
+            damping: Sönümleme katsayısı (enerji kaybı)
+            dt: Zaman adımı
+            constraint_iterations: Constraint çözme iterasyon sayısı;
+                tolerance verilirse en fazla iterasyon sayısı
+            bounds: (genişlik, yükseklik) dünya sınırları (None ise ekran boyutu)
+            tolerance: Verilirse çözüm, en büyük göreli kısıtlama hatası
+                bunun altına inince durur
+            min_iterations: tolerance ile yapılacak en az iterasyon sayısı
+        """
+        particles = self.particles
+
+        # Yerçekimi/sönüm değişirse uyuyan partiküller yeni kuvvetlere uyanır
+        forces = (gravity, damping, dt)
+        if forces != self._forces:
+            self._forces = forces
+            self.wake()
+
+        # Tüm ipler uyuyorsa adım atlanır
+        if (particles.is_sleeping | particles.is_fixed).all():
+            self.solver_stats = dict(IDLE_STATS)
+            return
+
+        active = None
+        if particles.is_sleeping.any():
+            static = particles.is_sleeping | particles.is_fixed
+            active = ~(static[self.constraints.i1] & static[self.constraints.i2])
+
+        # 1. Tüm partikülleri tek geçişte güncelle
+        with PROFILER.section("integrate"):
+            particles.update(gravity=gravity, damping=damping, dt=dt)
+
+        # 2. Constraint'leri çöz
+        with PROFILER.section("solve"):
+            if self.solver == "direct":
+                direct = {} if tolerance is None else {"tolerance": tolerance}
+                iterations, converged = self.constraints.resolve_direct(
+                    max_passes=DIRECT_PASSES, **direct
+                )
+            else:
+                resolve = (
+                    self.constraints.resolve_red_black
+                    if self.solver == "red_black"
+                    else self.constraints.resolve
+                )
+                iterations = resolve(
+                    iterations=constraint_iterations,
+                    active=active,
+                    tolerance=tolerance,
+                    min_iterations=min_iterations,
+                )
+                converged = None
+            max_error, rms_error = self.constraints.residual(active)
+        # Yinelemeli çözücülerde yakınsama yalnızca tolerans verilirse tanımlıdır
+        if converged is None and tolerance is not None:
+            converged = max_error <= tolerance
+        self.solver_stats = {
+            "iterations": iterations,
+            "max_error": max_error,
+            "rms_error": rms_error,
+            "converged": converged,
+        }
+
+        # 3. İplerin kendileriyle ve birbirleriyle çarpışması (ip nesnesi
+        # olmayan, attach ile bağlanmış dünyalarda düz diziler üzerinde)
+        if self.self_collision and len(self.offsets) > 1:
+            with PROFILER.section("collide"):
+                if self.ropes:
+                    self.collision_stats = collide_ropes(
+                        self.ropes, self_collision=True
+                    )
+                else:
+                    self.collision_stats, touched = collide_flat(
+                        particles, self.constraints, self.offsets
+                    )
+                    self.wake(touched)
+
+        # 4. Ekran sınırlarına çarpma kontrolü
+        if bounds is None:
+            bounds = pygame.display.get_surface().get_size()
+        width, height = bounds
+        with PROFILER.section("clamp"):
+            if particles.radius is not None:
+                particles.constrain(width, height)
+            else:
+                for rope in self.ropes:
+                    rope.particles.constrain(width, height)
+
+        # 5. Tamamen durgun bölümleri uyut
+        with PROFILER.section("sleep"):
+            update_sleep(particles, self._breaks)
+
+        self._moved()
+
+    def _moved(self):
+        """Pozisyon değişikliğini dünyaya ve iplere kaydeder."""
+        self._index_dirty = True
+        self.version += 1
+        for rope in self.ropes:
+            rope._moved()
+
+    def wake(self, mask=None):
+        """
+        Uyuyan partikülleri uyandırır.
+
+        Args:
+            mask: Uyandırılacak partiküller (global); her biri bulunduğu
+                bölümün tamamını uyandırır (None ise tüm dünya)
+        """
+        wake_spans(self.particles, self._breaks, mask)
+
+    def active_particles(self):
+        """Simüle edilen (sabit olmayan ve uyumayan) partikül sayısı."""
+        particles = self.particles
+        return int(np.count_nonzero(~(particles.is_sleeping | particles.is_fixed)))
+
+    def resize(self, num_segments):
+        """
+        Tüm iplerin segment sayısını değiştirir (ArrayRope.resize).
+
+        Args:
+            num_segments: Yeni segment sayısı (en az 1)
+        """
+        num_segments = max(1, int(num_segments))
+        changed = [rope for rope in self.ropes if len(rope.constraints) != num_segments]
+        if not changed:
+            return
+        for rope in changed:
+            rope.resize(num_segments)
+        self._rebuild()
+
+    def set_segment_length(self, segment_length):
+        """
+        Tüm iplerin segment uzunluğunu değiştirir (doğal uzunluklar yerinde).
+
+        İpler düz dizilerin görünümleri olduğundan her ipin uyandırılması
+        dünyadaki uyuyan bölümlerini de uyandırır.
+        """
+        for rope in self.ropes:
+            rope.set_segment_length(segment_length)
+
+    def memory_usage(self):
+        """
+        Düz dizilerin bellek kullanımı (ArrayRope.memory_usage ile aynı alanlar).
+        """
+        particles = self.particles.nbytes
+        constraints = self.constraints.nbytes
+        total = particles + constraints
+        return {
+            "particles": particles,
+            "constraints": constraints,
+            "total": total,
+            "bytes_per_segment": total / max(len(self.constraints), 1),
+        }
+
+    def snapshot(self):
+        """Tüm iplerin snapshot listesi (restore ile geri yüklenir)."""
+        return [rope.snapshot() for rope in self.ropes]
+
+    def restore(self, states):
+        """
+        Dünyayı snapshot listesine döndürür.
+
+        İp sayısı farklıysa eksik ipler oluşturulur, fazlası atılır.
+
+        Args:
+            states: snapshot() veya scene.load_scene ile alınmış durumlar
+        """
+        ropes = self.ropes[: len(states)]
+        while len(ropes) < len(states):
+            ropes.append(ArrayRope(0, 0, num_segments=1))
+        # Diziler _rebuild içinde zaten kopyalanır
+        for rope, state in zip(ropes, states):
+            rope.restore(state, copy=False)
+        self.ropes = ropes
+        self._rebuild()
+
+    def spatial_index(self):
+        """Tüm iplerin güncel pozisyonlarıyla kurulmuş ızgara indeksi."""
+        if self._index_dirty:
+            self.index.build(self.particles.x, self.particles.y)
+            self._index_dirty = False
+        return self.index
+
+    def nearest_particle(self, pos, max_distance=50):
+        """Noktaya en yakın sabit olmayan partikülün global indeksi veya None."""
+        return self.spatial_index().nearest(
+            pos[0], pos[1], max_distance, exclude=self.particles.is_fixed
+        )
+
+    def is_mouse_over_particle(self, mouse_pos, radius=20):
+        """
+        Fare herhangi bir ipin partikülünün üzerinde mi kontrol et.
+
+        Returns:
+            Global partikül indeksi veya None
+        """
+        hits = self.spatial_index().query_radius(
+            mouse_pos[0], mouse_pos[1], radius, exclude=self.particles.is_fixed
+        )
+        if len(hits) == 0:
+            return None
+        return int(hits[0])
+
+    def drag_particle(self, mouse_pos, dragged_index=None):
+        """
+        Fare ile bir partikülü sürükler (ArrayRope.drag_particle gibi).
+
+        Args:
+            mouse_pos: (x, y) fare pozisyonu
+            dragged_index: Sürüklenecek global indeks (None ise en yakını bul)
+
+        Returns:
+            Sürüklenen partikülün global indeksi veya None
+        """
+        index = dragged_index
+        if index is None or not 0 <= index < len(self.particles):
+            index = self.nearest_particle(mouse_pos, max_distance=50)
+            if index is None:
+                return None
+
+        mask = np.zeros(len(self.particles), dtype=bool)
+        mask[index] = True
+        self.wake(mask)
+        self.particles[index].set_position(mouse_pos[0], mouse_pos[1])
+        self._moved()
+        return index
+
+    def release_all(self):
+        """Tüm partiküllerin sürükleme durumunu serbest bırak."""
+        self.particles.is_being_dragged[:] = False
+
+    def bounds(self, camera=None):
+        """Tüm iplerin ekranda kapladığı alanların birleşimi (pygame.Rect)."""
+        rects = [rope.renderer.bounds(rope, camera) for rope in self.ropes]
+        if not rects:
+            return pygame.Rect(0, 0, 0, 0)
+        return rects[0].unionall(rects[1:])
+
+    def draw(self, screen, camera=None):
+        """
+        Tüm ipleri çizer.
+
+        Args:
+            screen: Pygame ekran objesi
+            camera: Kamera objesi (varsa world-to-screen transform uygular)
+        """
+        for rope in self.ropes:
+            rope.draw(screen, camera)